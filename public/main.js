@@ -1,11 +1,24 @@
 const { createApp } = Vue;
 
 const NCOF_SUBSCRIPTION_URI = "/ETRI_INRS_TEAM/NCOF_Nncof_EventSubscription/1.0.0/subscriptions";
+const DASHBOARD_EVENTS_URI = "/dashboard/events";
+
+// 한 인스턴스가 여러 S-NSSAI 의 부하를 보내면 슬라이스별로 따로 표시한다.
+function loadKey(info) {
+  if (!info.snssai) return info.nfInstanceId;
+  const { sst, sd } = info.snssai;
+  return `${info.nfInstanceId} (${sd ? `${sst}-${sd}` : sst})`;
+}
 
 createApp({
   data() {
     return {
       subscriptions: {},
+      // nfInstanceId (S-NSSAI 별 부하이면 슬라이스 포함) -> 집계 부하 정보
+      loads: {},
+      // 목록을 받는 동안 도착한 구독 변경 (받은 뒤 순서대로 적용)
+      pendingEvents: null,
+      connected: false,
       selectedSubscription: null,
       isModalVisible: false,
       error: null,
@@ -15,29 +28,79 @@ createApp({
     hasSubscriptions() {
       return Object.keys(this.subscriptions).length > 0;
     },
+    hasLoads() {
+      return Object.keys(this.loads).length > 0;
+    },
     prettyJson() {
       if (!this.selectedSubscription) return "";
       return JSON.stringify(this.selectedSubscription, null, 2);
     },
   },
   methods: {
-    fetchSubscriptions() {
-      fetch(NCOF_SUBSCRIPTION_URI)
-        .then((response) => {
+    async fetchSubscriptions() {
+      // 목록은 페이지 단위로 내려오므로 X-Next-Cursor 가 없을 때까지 이어서 조회한다.
+      const subscriptions = {};
+      let cursor = null;
+      try {
+        do {
+          const url = cursor
+            ? `${NCOF_SUBSCRIPTION_URI}?cursor=${encodeURIComponent(cursor)}`
+            : NCOF_SUBSCRIPTION_URI;
+          const response = await fetch(url);
           if (!response.ok) {
             throw new Error(
               `Network response was not ok (${response.status})`
             );
           }
-          return response.json();
-        })
-        .then((data) => {
-          this.subscriptions = data;
-        })
-        .catch((error) => {
-          console.error("Error fetching subscriptions:", error);
-          this.error = error.message;
+          Object.assign(subscriptions, await response.json());
+          cursor = response.headers.get("X-Next-Cursor");
+        } while (cursor);
+        this.subscriptions = subscriptions;
+        this.error = null;
+      } catch (error) {
+        console.error("Error fetching subscriptions:", error);
+        this.error = error.message;
+      }
+    },
+    async syncSubscriptions() {
+      // 스트림은 연결 이후의 변경만 보내므로, 목록을 받은 뒤 그동안 모인 변경을 적용한다.
+      this.pendingEvents = [];
+      await this.fetchSubscriptions();
+      const events = this.pendingEvents;
+      this.pendingEvents = null;
+      events.forEach((event) => this.applySubscriptionEvent(event));
+    },
+    applySubscriptionEvent(event) {
+      if (this.pendingEvents) {
+        this.pendingEvents.push(event);
+      } else if (event.subscription) {
+        this.subscriptions[event.subscriptionId] = event.subscription;
+      } else {
+        delete this.subscriptions[event.subscriptionId];
+      }
+    },
+    connectEvents() {
+      this.events = new EventSource(DASHBOARD_EVENTS_URI);
+      this.events.onopen = () => {
+        this.connected = true;
+        // 재연결 중에 놓친 변경이 있을 수 있으므로 연결될 때마다 다시 맞춘다.
+        this.syncSubscriptions();
+      };
+      this.events.onerror = () => {
+        this.connected = false;
+      };
+      this.events.addEventListener("subscription", (e) =>
+        this.applySubscriptionEvent(JSON.parse(e.data))
+      );
+      this.events.addEventListener("subscription-removed", (e) =>
+        this.applySubscriptionEvent(JSON.parse(e.data))
+      );
+      this.events.addEventListener("loads", (e) => {
+        const updatedAt = new Date().toLocaleTimeString();
+        JSON.parse(e.data).nfLoadLevelInfos.forEach((info) => {
+          this.loads[loadKey(info)] = { ...info, updatedAt };
         });
+      });
     },
     showModal(subscription) {
       this.selectedSubscription = subscription;
@@ -65,10 +128,8 @@ createApp({
         if (response.status === 204) {
           // No Content
           alert(`Successfully unsubscribed from ${subscriptionId}`);
-          // Remove the subscription from the local data
+          // 스트림으로도 삭제가 전달되지만 목록에서 바로 제거한다.
           delete this.subscriptions[subscriptionId];
-          // Trigger reactivity to update the list
-          this.subscriptions = { ...this.subscriptions };
         } else {
           const errorData = await response.json();
           throw new Error(
@@ -83,6 +144,11 @@ createApp({
     },
   },
   mounted() {
-    this.fetchSubscriptions();
+    this.connectEvents();
+  },
+  beforeUnmount() {
+    if (this.events) {
+      this.events.close();
+    }
   },
 }).mount("#app");
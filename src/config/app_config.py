@@ -1,8 +1,138 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 import logging
+from typing import Optional
 import yaml
 
 
+@dataclass
+class HttpClientConfig:
+    """
+    NF 로 보내는 HTTP 요청(구독, 알림 콜백)에 사용하는 클라이언트 풀 설정
+
+    연결은 목적지(scheme://host:port) 별로 재사용되며, max_connections_per_host
+    는 목적지 하나에 동시에 열 수 있는 연결 수이다.
+
+    http_version 은 다음 중 하나이며, destinations 로 목적지(host:port)별로
+    덮어쓸 수 있다.
+      - "1.1": HTTP/1.1 만 사용
+      - "2": TLS(ALPN)로 HTTP/2 를 협상하고, 지원하지 않으면 HTTP/1.1 사용
+      - "h2c": 평문 HTTP/2 (prior knowledge), 상대가 HTTP/2 를 지원해야 한다
+    """
+
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+    write_timeout: float = 5.0
+    pool_timeout: float = 5.0
+    max_connections_per_host: int = 10
+    max_keepalive_connections_per_host: int = 5
+    keepalive_expiry: float = 30.0
+    http_version: str = "1.1"
+    destinations: dict[str, str] = field(default_factory=dict)
+
+    def http_version_for(self, destination: str) -> str:
+        """목적지(host:port)에 사용할 HTTP 버전"""
+        return str(self.destinations.get(destination, self.http_version))
+
+
+@dataclass
+class NotificationDispatchConfig:
+    """
+    consumer 로 보내는 알림 콜백의 송신 큐 설정
+
+    queue_size 는 전송 대기 중인 알림의 최대 수, max_senders 는 전체 동시
+    전송 수, max_in_flight_per_destination 은 목적지 하나에 대한 동시 전송 수이다.
+
+    batch_destinations 에 등록된 알림 URI 는 배치 모드로 동작한다. 등록된 시간
+    (초) 동안 같은 URI 로 보낼 알림을 모아, 구독별 알림 목록을 담은 하나의
+    요청(최대 max_batch_size 개)으로 보낸다.
+    """
+
+    queue_size: int = 10000
+    max_senders: int = 64
+    max_in_flight_per_destination: int = 4
+    batch_destinations: dict[str, float] = field(default_factory=dict)
+    max_batch_size: int = 100
+
+    def batch_window_for(self, uri: str) -> float:
+        """uri 의 배치 대기 시간. 0 이면 배치하지 않는다."""
+        return float(self.batch_destinations.get(uri, 0.0))
+
+
+@dataclass
+class DeliveryPolicyConfig:
+    """
+    알림 콜백 전송 실패 시의 재시도와 circuit breaker 설정
+
+    timeout, 연결 오류, 5xx, 429 응답은 max_retries 번까지 재시도하며,
+    재시도 간격은 backoff_base * 2^n (최대 backoff_max) 범위의 임의 값이다.
+    같은 notification_uri 로 failure_threshold 번 연속 실패하면 reset_timeout
+    동안 전송하지 않고 바로 실패 처리한다. buffer_size 가 0 보다 크면 그동안의
+    알림을 목적지별로 최대 buffer_size 개까지 보관했다가 복구되면 전송한다.
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    buffer_size: int = 0
+
+
+@dataclass
+class PersistenceConfig:
+    """
+    구독 영속화 설정
+
+    url 은 sqlalchemy 데이터베이스 URL 이며 (예: "sqlite:///ncof_subscriptions.db"),
+    None 이면 구독을 저장하지 않는다. 구독 생성/삭제와 보고 횟수는 메모리에
+    모았다가 flush_interval 마다 하나의 트랜잭션으로 저장된다.
+    """
+
+    url: Optional[str] = None
+    flush_interval: float = 1.0
+
+
+@dataclass
+class ReportingConfig:
+    """
+    이벤트 기반 보고(ON_THRESHOLD, ON_CHANGE) 설정
+
+    threshold_hysteresis 는 ON_THRESHOLD 구독의 임계값을 위로 넘은 값이 다시
+    아래로 넘었다고 보기 위해 임계값보다 더 내려가야 하는 값이다 (지표 단위,
+    예: CPU 사용률 %p). 임계값 근처에서 값이 흔들릴 때 반복 보고를 막는다.
+
+    change_delta 는 ON_CHANGE 구독이 인스턴스의 지표가 바뀌었다고 보는
+    변화량이다. 마지막으로 보고한 값보다 이 값을 넘게 바뀐 인스턴스만
+    보고하므로, 부하가 안정적인 NF 는 알림을 보내지 않는다.
+    """
+
+    threshold_hysteresis: float = 5.0
+    change_delta: float = 2.0
+
+
+@dataclass
+class DashboardConfig:
+    """
+    대시보드 실시간 스트림(SSE) 설정
+
+    클라이언트마다 변경 사항을 모아 interval 초마다 한 번 보내며, 클라이언트는
+    더 긴 간격만 요청할 수 있다. 동시에 연결할 수 있는 클라이언트는
+    max_clients 개이고, 변경이 없으면 keepalive 초마다 연결 유지 메시지를 보낸다.
+    """
+
+    interval: float = 1.0
+    max_clients: int = 16
+    keepalive: float = 15.0
+
+
+def _load_section(config_class, config: dict):
+    """하위 설정에서 config_class 에 정의된 키만 읽는다."""
+    if not isinstance(config, dict):
+        return config_class()
+    known = {f.name for f in fields(config_class)}
+    return config_class(**{k: v for k, v in config.items() if k in known})
+
+
 @dataclass
 class AppConfig:
     host: str = "0.0.0.0"
@@ -12,6 +142,15 @@ class AppConfig:
     report_period: int = 5
     notification_prefix: str = ""
     subscription_prefix: str = ""
+    fast_ingest: bool = False
+    http_client: HttpClientConfig = field(default_factory=HttpClientConfig)
+    dispatch: NotificationDispatchConfig = field(
+        default_factory=NotificationDispatchConfig
+    )
+    delivery: DeliveryPolicyConfig = field(default_factory=DeliveryPolicyConfig)
+    persistence: PersistenceConfig = field(default_factory=PersistenceConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
+    reporting: ReportingConfig = field(default_factory=ReportingConfig)
 
 
 def _load_config(file_path: str) -> AppConfig:
@@ -52,6 +191,21 @@ def _load_config(file_path: str) -> AppConfig:
             subscription_prefix=ncof_config.get(
                 "subscription_prefix", default_config.subscription_prefix
             ),
+            fast_ingest=ncof_config.get("fast_ingest", default_config.fast_ingest),
+            http_client=_load_section(
+                HttpClientConfig, ncof_config.get("http_client", {})
+            ),
+            dispatch=_load_section(
+                NotificationDispatchConfig, ncof_config.get("dispatch", {})
+            ),
+            delivery=_load_section(
+                DeliveryPolicyConfig, ncof_config.get("delivery", {})
+            ),
+            persistence=_load_section(
+                PersistenceConfig, ncof_config.get("persistence", {})
+            ),
+            dashboard=_load_section(DashboardConfig, ncof_config.get("dashboard", {})),
+            reporting=_load_section(ReportingConfig, ncof_config.get("reporting", {})),
         )
     except FileNotFoundError:
         logging.error(
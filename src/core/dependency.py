@@ -1,3 +1,4 @@
+from config.app_config import app_config
 from core.subscription_manager import SubscriptionManager
 
 # from openapi_server.apis.ncof_events_subscriptions_api_base import (
@@ -16,7 +17,9 @@ from core.subscription_manager import SubscriptionManager
 #     return BaseNWDAFEventsNotificationsApi.subclasses[0]()
 
 
-subscription_manager = SubscriptionManager()
+subscription_manager = SubscriptionManager(
+    app_config.dispatch, app_config.dashboard, app_config.reporting
+)
 
 
 def get_subscription_manager() -> SubscriptionManager:
@@ -0,0 +1,142 @@
+from typing import List, Optional
+
+from pydantic import ConfigDict, Field, StrictInt, StrictStr, TypeAdapter
+from typing_extensions import Annotated, TypedDict
+
+from openapi_server.models.event_notification import EventNotification
+from openapi_server.models.event_notification_batch_item import (
+    EventNotificationBatchItem,
+)
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+
+from .load_sample import LoadSample
+
+# 알 수 없는 키(필드 이름으로 된 본문 등)는 빠른 경로로 처리하지 않는다.
+_FORBID_EXTRA = ConfigDict(extra="forbid")
+
+_Percent = Annotated[int, Field(strict=True, ge=1, le=100)]
+
+
+class _NfStatusBody(TypedDict, total=False):
+    __pydantic_config__ = _FORBID_EXTRA
+
+    statusRegistered: Optional[_Percent]
+    statusUnregistered: Optional[_Percent]
+    statusUndiscoverable: Optional[_Percent]
+
+
+class _SnssaiBody(TypedDict, total=False):
+    __pydantic_config__ = _FORBID_EXTRA
+
+    sst: Annotated[int, Field(strict=True, ge=0, le=255)]
+    sd: Optional[Annotated[str, Field(pattern=r"^[A-Fa-f0-9]{6}$")]]
+
+
+class _LoadBody(TypedDict, total=False):
+    __pydantic_config__ = _FORBID_EXTRA
+
+    nfType: Optional[StrictStr]
+    nfInstanceId: Optional[StrictStr]
+    nfSetId: Optional[StrictStr]
+    nfStatus: Optional[_NfStatusBody]
+    nfCpuUsage: Optional[StrictInt]
+    nfMemoryUsage: Optional[StrictInt]
+    nfStorageUsage: Optional[StrictInt]
+    nfLoadLevelAverage: Optional[StrictInt]
+    nfLoadLevelpeak: Optional[StrictInt]
+    nfLoadAvgInAoi: Optional[StrictInt]
+    snssai: Optional[_SnssaiBody]
+    confidence: Optional[Annotated[int, Field(strict=True, ge=0)]]
+
+
+class _NotificationBody(TypedDict, total=False):
+    __pydantic_config__ = _FORBID_EXTRA
+
+    nfLoadLevelInfos: Optional[List[_LoadBody]]
+
+
+class _BatchItemBody(TypedDict):
+    __pydantic_config__ = _FORBID_EXTRA
+
+    subscriptionId: StrictStr
+    nfLoadLevelInfos: Annotated[List[_LoadBody], Field(min_length=1)]
+
+
+# EventNotification 과 같은 제약을 가진 dict 스키마. pydantic-core 가 바이트에서
+# 바로 파싱하고 검증하며, 모델 인스턴스는 만들지 않는다.
+_notification_adapter = TypeAdapter(_NotificationBody)
+# 여러 구독의 알림 (POST /notifications) 본문. 빠른 경로와 전체 검증용
+_batch_adapter = TypeAdapter(Annotated[List[_BatchItemBody], Field(min_length=1)])
+_batch_model_adapter = TypeAdapter(
+    Annotated[List[EventNotificationBatchItem], Field(min_length=1)]
+)
+
+
+def parse_load_records(body: bytes) -> Optional[list[LoadSample]]:
+    """
+    EventNotification 본문에서 모델을 거치지 않고 LoadSample 목록을 만든다.
+
+    Returns:
+        샘플 목록, nfLoadLevelInfos 가 없으면 None
+
+    Raises:
+        pydantic.ValidationError: 빠른 경로로 처리할 수 없는 본문인 경우
+    """
+    infos = _notification_adapter.validate_json(body).get("nfLoadLevelInfos")
+    if infos is None:
+        return None
+    return [LoadSample.from_body(info) for info in infos]
+
+
+def parse_event_notification(
+    body: bytes, fast: bool
+) -> Optional[list[NfLoadLevelInformation | LoadSample]]:
+    """
+    알림 본문에서 부하 정보 목록을 꺼낸다.
+
+    fast 가 True 이면 parse_load_records 를 먼저 시도하고, 실패하면 전체
+    검증(EventNotification)으로 처리한다. 전체 검증의 오류는 pydantic
+    ValidationError 로 전달된다.
+    """
+    if fast:
+        try:
+            return parse_load_records(body)
+        except ValueError:  # pydantic ValidationError 포함
+            pass
+    return EventNotification.model_validate_json(body).nf_load_level_infos
+
+
+def parse_batch_records(body: bytes) -> list[tuple[str, list[LoadSample]]]:
+    """
+    여러 구독의 알림 본문에서 모델을 거치지 않고 (구독 ID, 샘플 목록) 을 만든다.
+
+    Raises:
+        pydantic.ValidationError: 빠른 경로로 처리할 수 없는 본문인 경우
+    """
+    return [
+        (
+            item["subscriptionId"],
+            [LoadSample.from_body(info) for info in item["nfLoadLevelInfos"]],
+        )
+        for item in _batch_adapter.validate_json(body)
+    ]
+
+
+def parse_event_notification_batch(
+    body: bytes, fast: bool
+) -> list[tuple[str, list[NfLoadLevelInformation | LoadSample]]]:
+    """
+    여러 구독의 알림 본문에서 (구독 ID, 부하 정보 목록) 을 꺼낸다.
+
+    fast 가 True 이면 parse_batch_records 를 먼저 시도하고, 실패하면 전체
+    검증(EventNotificationBatchItem 목록)으로 처리한다.
+    """
+    if fast:
+        try:
+            return parse_batch_records(body)
+        except ValueError:  # pydantic ValidationError 포함
+            pass
+    return [
+        (item.subscription_id, item.nf_load_level_infos)
+        for item in _batch_model_adapter.validate_json(body)
+    ]
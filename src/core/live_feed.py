@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+import time
+import weakref
+from typing import AsyncIterator, Optional
+
+from config.app_config import DashboardConfig
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+
+from .load_sample import LoadSample
+from .load_store import LoadFilter, LoadStore
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data: bytes) -> bytes:
+    """Server-Sent Events 메시지 하나. data 는 줄바꿈이 없는 JSON 이어야 한다."""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+class LiveFeedClient:
+    """
+    대시보드 연결 하나가 아직 받지 않은 변경 사항
+
+    같은 구독의 변경은 마지막 상태 하나로, 부하 정보는 새 샘플이 들어온
+    nf_instance_id 집합으로 모아 두므로 전송 주기 사이에 변경이 많아도
+    보관하는 양은 구독 수와 인스턴스 수를 넘지 않는다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        # 구독 ID -> 현재 구독 (삭제되었으면 None)
+        self.subscriptions: dict[str, Optional[NncofEventsSubscription]] = {}
+        self.instances: set[str] = set()
+
+
+class LiveFeed:
+    """
+    대시보드로 보내는 구독/부하 정보 변경 스트림
+
+    SubscriptionManager 가 구독 생성/삭제와 저장된 샘플을 알리면, 연결된
+    클라이언트마다 변경 사항을 모아 두었다가 클라이언트의 interval 마다 한 번
+    SSE 메시지로 보낸다. 연결된 클라이언트가 없으면 알림은 바로 반환된다.
+    부하 정보는 변경된 인스턴스의 running aggregate 를 LoadStore 에서 집계해
+    보낸다. 이벤트 루프 스레드에서 사용해야 한다.
+
+    메시지 (event: data)
+      - subscription: {"subscriptionId": ..., "subscription": {...}}
+      - subscription-removed: {"subscriptionId": ...}
+      - loads: {"nfLoadLevelInfos": [...]}
+    """
+
+    def __init__(self, load_store: LoadStore, config: Optional[DashboardConfig] = None):
+        self.load_store = load_store
+        self.config = config or DashboardConfig()
+        # 스트림이 시작되지 못하고 버려진 클라이언트도 정리되도록 약한 참조로 둔다.
+        self.clients: weakref.WeakSet[LiveFeedClient] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def connect(self, interval: Optional[float] = None) -> Optional[LiveFeedClient]:
+        """
+        클라이언트를 등록한다. interval 은 설정의 interval 보다 짧을 수 없다.
+
+        Returns:
+            등록된 클라이언트, max_clients 를 넘으면 None
+        """
+        if len(self.clients) >= self.config.max_clients:
+            return None
+        client = LiveFeedClient(max(interval or 0.0, self.config.interval))
+        self.clients.add(client)
+        return client
+
+    def disconnect(self, client: LiveFeedClient) -> None:
+        self.clients.discard(client)
+
+    def subscription_changed(
+        self,
+        subscription_id: str,
+        subscription: Optional[NncofEventsSubscription],
+    ) -> None:
+        """구독이 생성/교체되었거나 (subscription 이 None 이면) 삭제되었음을 알린다."""
+        for client in self.clients:
+            client.subscriptions[subscription_id] = subscription
+
+    def loads_ingested(self, samples: list[LoadSample]) -> None:
+        """LoadStore 에 샘플이 저장되었음을 알린다."""
+        if not self.clients:
+            return
+        instances = {sample.nf_instance_id for sample in samples}
+        for client in self.clients:
+            client.instances |= instances
+
+    def take_events(self, client: LiveFeedClient) -> bytes:
+        """클라이언트에 모인 변경 사항을 SSE 메시지로 만들고 비운다."""
+        subscriptions, client.subscriptions = client.subscriptions, {}
+        instances, client.instances = client.instances, set()
+
+        messages = []
+        for subscription_id, subscription in subscriptions.items():
+            key = json.dumps(subscription_id).encode()
+            if subscription is None:
+                messages.append(
+                    format_event(
+                        "subscription-removed", b'{"subscriptionId":' + key + b"}"
+                    )
+                )
+                continue
+            body = subscription.model_dump_json(by_alias=True, exclude_none=True)
+            messages.append(
+                format_event(
+                    "subscription",
+                    b'{"subscriptionId":'
+                    + key
+                    + b',"subscription":'
+                    + body.encode()
+                    + b"}",
+                )
+            )
+        if instances:
+            payload = self.load_store.collect_json(
+                LoadFilter(nf_instance_ids=frozenset(instances))
+            )
+            if payload is not None:
+                messages.append(format_event("loads", payload))
+        return b"".join(messages)
+
+    async def stream(self, client: LiveFeedClient) -> AsyncIterator[bytes]:
+        """
+        클라이언트의 interval 마다 모인 변경 사항을 보낸다.
+
+        보낼 것이 없는 상태가 keepalive 초 동안 이어지면 연결 유지를 위한
+        주석을 보낸다. 반복이 끝나면(연결 종료) 클라이언트 등록을 해제한다.
+        """
+        last_sent = time.monotonic()
+        try:
+            # 연결 직후 클라이언트가 재연결 간격을 알 수 있도록 한다.
+            yield f"retry: {int(client.interval * 1000)}\n\n".encode()
+            while True:
+                await asyncio.sleep(client.interval)
+                events = self.take_events(client)
+                now = time.monotonic()
+                if events:
+                    yield events
+                    last_sent = now
+                elif now - last_sent >= self.config.keepalive:
+                    yield b": keep-alive\n\n"
+                    last_sent = now
+        finally:
+            self.disconnect(client)
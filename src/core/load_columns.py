@@ -0,0 +1,134 @@
+from typing import Optional
+
+import numpy as np
+
+from .load_sample import LOAD_FIELDS, STATUS_ALIASES, LoadMeta, LoadSample
+from .ring_buffer import TimedRingBuffer
+from .running_aggregates import RunningLoadAggregates
+
+
+class LoadColumnStore:
+    """
+    한 시계열의 LoadSample 을 지표별 정수 배열로 저장하는 열 지향 저장소
+
+    LoadStore 는 메타데이터(인스턴스와 S-NSSAI)별로 저장소를 하나씩 만들므로,
+    저장소 하나에는 한 인스턴스의 샘플만 들어온다.
+
+    슬롯 관리는 TimedRingBuffer 가 담당하고, 각 슬롯의 지표 값은
+    (지표 수 x capacity) 크기의 NumPy 배열에 저장한다.
+    값이 없는(None) 지표는 present 마스크로 구분한다. nf_status 도 (상태 수 x
+    capacity) 배열에 저장하며 값이 없으면 0 이다(유효한 값은 1~100).
+    메타데이터가 직전 샘플과 같으면 LoadMeta 객체를 공유하므로, 슬롯마다
+    파이썬 객체를 따로 보관하지 않는다.
+
+    샘플이 추가되거나 덮어쓰기/만료로 빠질 때마다 aggregates 의
+    running sum/count/min/max 도 함께 갱신된다.
+
+    Args:
+        capacity: 저장할 수 있는 최대 샘플 수
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ring: TimedRingBuffer[LoadMeta] = TimedRingBuffer(capacity)
+        self.values = np.zeros((len(LOAD_FIELDS), capacity), dtype=np.int64)
+        self.present = np.zeros((len(LOAD_FIELDS), capacity), dtype=bool)
+        self.status = np.zeros((len(STATUS_ALIASES), capacity), dtype=np.int16)
+        self.has_status = np.zeros(capacity, dtype=bool)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self.aggregates = RunningLoadAggregates(len(LOAD_FIELDS))
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def next_seq(self) -> int:
+        """다음 샘플에 부여될 순번"""
+        return self._next_seq
+
+    def append(
+        self,
+        timestamp: float,
+        sample: LoadSample,
+        seq: Optional[int] = None,
+    ) -> bool:
+        """
+        샘플을 저장한다. nf_instance_id 가 없는 샘플은 집계할 수 없으므로 무시한다.
+
+        seq 를 지정하면 그 값을 샘플 순번으로 사용한다(증가하는 값이어야 한다).
+
+        Returns:
+            저장되었으면 True
+        """
+        meta = sample.meta
+        if not meta.nf_instance_id:
+            return False
+
+        latest = self.latest_meta()
+        if latest == meta:
+            meta = latest
+
+        # 가득 찬 경우 덮어쓰일 가장 오래된 샘플을 집계에서 먼저 뺀다.
+        if len(self._ring) == self.capacity:
+            self._evict(self._ring.span()[0])
+
+        present = [value is not None for value in sample.values]
+        values = [value if value is not None else 0 for value in sample.values]
+
+        slot = self._ring.append(timestamp, meta)
+        if seq is None:
+            seq = self._next_seq
+        self._next_seq = seq + 1
+
+        self.seq[slot] = seq
+        self.values[:, slot] = values
+        self.present[:, slot] = present
+        nf_status = sample.nf_status
+        self.has_status[slot] = nf_status is not None
+        if nf_status is not None:
+            self.status[:, slot] = [value or 0 for value in nf_status]
+        self.aggregates.add(seq, slot, values, present)
+        return True
+
+    def _evict(self, slot: int) -> None:
+        self.aggregates.remove(
+            int(self.seq[slot]),
+            self.values[:, slot].tolist(),
+            self.present[:, slot].tolist(),
+        )
+
+    def expire_before(self, cutoff: float) -> int:
+        """cutoff 보다 오래된 샘플을 제거한다."""
+        start, _ = self._ring.span()
+        expired = self._ring.expire_before(cutoff)
+        for offset in range(expired):
+            self._evict((start + offset) % self.capacity)
+        return expired
+
+    def clear(self) -> None:
+        """모든 샘플을 제거한다."""
+        self._ring.clear()
+        self.aggregates.reset()
+
+    def slots(self) -> np.ndarray:
+        """저장된 샘플의 슬롯 번호를 오래된 순서로 반환한다."""
+        start, length = self._ring.span()
+        return (start + np.arange(length)) % self.capacity
+
+    def latest_meta(self) -> Optional[LoadMeta]:
+        """가장 최근 샘플의 메타데이터를 반환한다."""
+        start, length = self._ring.span()
+        if not length:
+            return None
+        return self._ring.item_at((start + length - 1) % self.capacity)
+
+    def meta_at(self, slot: int) -> LoadMeta:
+        """슬롯에 저장된 샘플의 메타데이터를 반환한다."""
+        return self._ring.item_at(slot)
+
+    def nf_status_at(self, slot: int) -> Optional[tuple]:
+        """슬롯에 저장된 샘플의 nf_status 튜플을 반환한다."""
+        if not self.has_status[slot]:
+            return None
+        return tuple(int(value) or None for value in self.status[:, slot])
@@ -0,0 +1,121 @@
+import sys
+from typing import NamedTuple, Optional
+
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+
+# 집계 대상 지표 필드 (열 순서)
+LOAD_FIELDS = (
+    "nf_cpu_usage",
+    "nf_memory_usage",
+    "nf_storage_usage",
+    "nf_load_level_average",
+    "nf_load_levelpeak",
+    "nf_load_avg_in_aoi",
+)
+
+# nf_status 튜플 순서
+STATUS_ALIASES = ("statusRegistered", "statusUnregistered", "statusUndiscoverable")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def snssai_key(sst: int, sd: Optional[str]) -> tuple:
+    """S-NSSAI 비교에 사용하는 (sst, 소문자 sd) 튜플"""
+    return (sst, sd.lower() if sd else None)
+
+
+class LoadMeta(NamedTuple):
+    """
+    샘플의 식별 정보. 집계 결과와 LoadFilter 판단에 사용된다.
+
+    snssai 는 snssai_key() 튜플이다. 인스턴스별로 거의 바뀌지 않으므로
+    LoadColumnStore 에서 연속된 샘플이 같은 LoadMeta 객체를 공유한다.
+    """
+
+    nf_instance_id: str
+    nf_type: Optional[str]
+    nf_set_id: Optional[str]
+    snssai: Optional[tuple] = None
+
+
+class LoadSample:
+    """
+    LoadStore 와 핸들러가 사용하는 부하 정보 샘플
+
+    NfLoadLevelInformation 대신 메타데이터(LoadMeta), LOAD_FIELDS 순서의 지표
+    값 튜플, STATUS_ALIASES 순서의 nf_status 튜플만 가진다. pydantic 모델은
+    API 경계에서만 만들어진다.
+    """
+
+    __slots__ = ("meta", "values", "nf_status")
+
+    def __init__(self, meta: LoadMeta, values: tuple, nf_status: Optional[tuple]):
+        self.meta = meta
+        self.values = values
+        self.nf_status = nf_status
+
+    @property
+    def nf_instance_id(self) -> Optional[str]:
+        return self.meta.nf_instance_id
+
+    @staticmethod
+    def from_model(load: NfLoadLevelInformation) -> "LoadSample":
+        """NfLoadLevelInformation 에서 샘플을 만든다."""
+        nf_status = load.nf_status
+        if nf_status is not None:
+            nf_status = (
+                nf_status.status_registered,
+                nf_status.status_unregistered,
+                nf_status.status_undiscoverable,
+            )
+        snssai = load.snssai
+        if snssai is not None:
+            snssai = snssai_key(snssai.sst, snssai.sd)
+        meta = LoadMeta(
+            _intern(load.nf_instance_id),
+            _intern(load.nf_type),
+            _intern(load.nf_set_id),
+            snssai,
+        )
+        values = tuple(getattr(load, field) for field in LOAD_FIELDS)
+        return LoadSample(meta, values, nf_status)
+
+    @staticmethod
+    def from_body(body: dict) -> "LoadSample":
+        """검증된 alias 키 dict (NfLoadLevelInformation 본문) 에서 샘플을 만든다."""
+        # 요청마다 호출되므로 LOAD_FIELDS/STATUS_ALIASES 순서로 직접 나열한다.
+        get = body.get
+        nf_status = get("nfStatus")
+        if nf_status is not None:
+            nf_status = (
+                nf_status.get("statusRegistered"),
+                nf_status.get("statusUnregistered"),
+                nf_status.get("statusUndiscoverable"),
+            )
+        snssai = get("snssai")
+        if snssai is not None:
+            snssai = snssai_key(snssai["sst"], snssai.get("sd"))
+        meta = LoadMeta(
+            _intern(get("nfInstanceId")),
+            _intern(get("nfType")),
+            _intern(get("nfSetId")),
+            snssai,
+        )
+        values = (
+            get("nfCpuUsage"),
+            get("nfMemoryUsage"),
+            get("nfStorageUsage"),
+            get("nfLoadLevelAverage"),
+            get("nfLoadLevelpeak"),
+            get("nfLoadAvgInAoi"),
+        )
+        return LoadSample(meta, values, nf_status)
+
+
+def to_sample(load) -> LoadSample:
+    """NfLoadLevelInformation 이면 LoadSample 로 변환하고, 샘플이면 그대로 반환한다."""
+    if isinstance(load, LoadSample):
+        return load
+    return LoadSample.from_model(load)
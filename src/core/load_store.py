@@ -0,0 +1,261 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+
+from .load_columns import LoadColumnStore
+from .load_sample import LoadMeta, LoadSample, snssai_key, to_sample
+from .nf_load_aggregator import (
+    calculate_average_loads_columnar,
+    calculate_average_loads_incremental,
+    dump_event_notification_json,
+)
+
+
+@dataclass(frozen=True)
+class LoadFilter:
+    """
+    구독이 관심을 가지는 NF 부하 정보의 조건
+
+    None 인 조건은 모든 값을 허용한다. snssai 가 없는 샘플은 슬라이스와 무관한
+    NF 전체 부하로 보고 snssai 조건을 통과시킨다.
+    """
+
+    nf_types: Optional[frozenset[str]] = None
+    nf_instance_ids: Optional[frozenset[str]] = None
+    nf_set_ids: Optional[frozenset[str]] = None
+    snssais: Optional[frozenset[tuple]] = None
+
+    @staticmethod
+    def from_event_subscription(event_subscription) -> "LoadFilter":
+        """
+        EventSubscription 의 nf_types, nf_instance_ids, nf_set_ids, snssaia 로
+        LoadFilter 를 생성한다. any_slice 가 true 이면 snssai 조건은 무시한다.
+        """
+
+        def to_set(values):
+            return frozenset(values) if values else None
+
+        snssais = None
+        if event_subscription.snssaia and not event_subscription.any_slice:
+            snssais = frozenset(
+                snssai_key(s.sst, s.sd) for s in event_subscription.snssaia
+            )
+
+        return LoadFilter(
+            nf_types=to_set(event_subscription.nf_types),
+            nf_instance_ids=to_set(event_subscription.nf_instance_ids),
+            nf_set_ids=to_set(event_subscription.nf_set_ids),
+            snssais=snssais,
+        )
+
+    def matches(self, meta: LoadMeta) -> bool:
+        if self.nf_types is not None and meta.nf_type not in self.nf_types:
+            return False
+        if (
+            self.nf_instance_ids is not None
+            and meta.nf_instance_id not in self.nf_instance_ids
+        ):
+            return False
+        if self.nf_set_ids is not None and meta.nf_set_id not in self.nf_set_ids:
+            return False
+        if (
+            self.snssais is not None
+            and meta.snssai is not None
+            and meta.snssai not in self.snssais
+        ):
+            return False
+        return True
+
+
+class LoadStore:
+    """
+    모든 구독이 공유하는 부하 정보 저장소
+
+    샘플은 메타데이터(LoadMeta: nf_instance_id, nf_type, nf_set_id, snssai)
+    별 시계열에 저장된다. 한 인스턴스가 여러 S-NSSAI 의 부하를 보내거나
+    메타데이터가 바뀌어도 시계열마다 샘플의 조건이 같으므로, 조건 판단은
+    시계열 단위로 정확하다.
+
+    NF 로부터 받은 샘플은 구독 수와 관계없이 한 번만 저장되고, 각 구독은
+    LoadView 를 통해 조건에 맞는 시계열만 집계한다. 샘플에는 저장소 전체에서
+    증가하는 순번이 부여되므로, 구독은 순번 하나로 마지막 보고 이후의
+    샘플을 구분할 수 있다.
+
+    collect_json() 으로 직렬화한 알림 본문은 저장소가 바뀔 때까지 (조건, 순번)
+    별로 캐시되므로, 같은 조건의 구독들은 한 번 만든 바이트를 함께 사용한다.
+
+    Args:
+        capacity_per_instance: 시계열별로 보관하는 최대 샘플 수
+        max_age: 샘플 보관 시간 (초)
+    """
+
+    def __init__(self, capacity_per_instance: int = 100, max_age: float = 300.0):
+        self.capacity_per_instance = capacity_per_instance
+        self.max_age = max_age
+        self._series: dict[LoadMeta, LoadColumnStore] = {}
+        self._next_seq = 0
+        self._payloads: dict[tuple[LoadFilter, Optional[int]], Optional[bytes]] = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    @property
+    def next_seq(self) -> int:
+        """다음 샘플에 부여될 순번"""
+        return self._next_seq
+
+    def ingest(
+        self,
+        load: LoadSample | NfLoadLevelInformation,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """
+        샘플을 메타데이터가 같은 시계열에 저장한다.
+
+        Returns:
+            저장되었으면 True (nf_instance_id 가 없으면 False)
+        """
+        return bool(self.ingest_many([load], timestamp))
+
+    def ingest_many(
+        self,
+        loads: list[LoadSample | NfLoadLevelInformation],
+        timestamp: Optional[float] = None,
+    ) -> list[LoadSample]:
+        """
+        여러 샘플을 한 번의 락으로 저장한다.
+
+        NfLoadLevelInformation 은 락을 잡기 전에 LoadSample 로 변환된다.
+
+        Returns:
+            저장된 샘플 목록 (nf_instance_id 가 없는 샘플은 제외)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        cutoff = timestamp - self.max_age
+
+        samples = [to_sample(load) for load in loads]
+        stored = []
+        with self.lock:
+            for sample in samples:
+                if not sample.nf_instance_id:
+                    continue
+                series = self._series.get(sample.meta)
+                if series is None:
+                    series = LoadColumnStore(self.capacity_per_instance)
+                    self._series[sample.meta] = series
+                series.expire_before(cutoff)
+                series.append(timestamp, sample, seq=self._next_seq)
+                self._next_seq += 1
+                stored.append(sample)
+            if stored:
+                self._payloads.clear()
+        return stored
+
+    def collect(
+        self,
+        load_filter: LoadFilter,
+        since_seq: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> list[NfLoadLevelInformation]:
+        """
+        조건에 맞는 시계열별 평균 부하를 계산한다.
+
+        since_seq 가 없으면 보관 중인 전체 윈도우를 running aggregate 로,
+        있으면 순번이 since_seq 이상인 샘플만 집계한다.
+        """
+        with self.lock:
+            self._expire(now)
+            return self._collect(load_filter, since_seq)
+
+    def collect_json(
+        self,
+        load_filter: LoadFilter,
+        since_seq: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Optional[bytes]:
+        """
+        collect() 결과를 EventNotification JSON 바이트로 반환한다.
+
+        결과가 없으면 None. 샘플이 저장되거나 만료되기 전까지 같은 인자의
+        호출은 캐시된 바이트를 그대로 반환한다.
+        """
+        key = (load_filter, since_seq)
+        with self.lock:
+            self._expire(now)
+            if key in self._payloads:
+                return self._payloads[key]
+            loads = self._collect(load_filter, since_seq)
+            payload = dump_event_notification_json(loads) if loads else None
+            self._payloads[key] = payload
+            return payload
+
+    def _expire(self, now: Optional[float]) -> None:
+        if now is None:
+            now = time.time()
+        cutoff = now - self.max_age
+        expired = 0
+        for meta in list(self._series):
+            series = self._series[meta]
+            expired += series.expire_before(cutoff)
+            if not len(series):
+                # 샘플이 모두 만료된 시계열은 정리한다.
+                del self._series[meta]
+        if expired:
+            self._payloads.clear()
+
+    def _collect(
+        self, load_filter: LoadFilter, since_seq: Optional[int]
+    ) -> list[NfLoadLevelInformation]:
+        loads: list[NfLoadLevelInformation] = []
+        for meta, series in self._series.items():
+            if not load_filter.matches(meta):
+                continue
+            if since_seq is None:
+                loads.extend(calculate_average_loads_incremental(series))
+            elif series.next_seq > since_seq:
+                loads.extend(calculate_average_loads_columnar(series, since_seq))
+        return loads
+
+
+class LoadView:
+    """
+    공유 LoadStore 위에서 하나의 구독이 보는 부분 집합
+
+    조건(LoadFilter)과 마지막으로 보고한 샘플의 순번만 가진다.
+    """
+
+    def __init__(self, store: LoadStore, load_filter: LoadFilter):
+        self.store = store
+        self.filter = load_filter
+        # 구독 이전에 저장된 샘플은 새 이벤트로 보지 않는다.
+        self.cursor = store.next_seq
+
+    def matches(self, sample: LoadSample) -> bool:
+        return self.filter.matches(sample.meta)
+
+    def window_loads(self) -> list[NfLoadLevelInformation]:
+        """보관 중인 전체 윈도우의 인스턴스별 평균 부하"""
+        return self.store.collect(self.filter)
+
+    def take_new_loads(self) -> list[NfLoadLevelInformation]:
+        """마지막 호출 이후 들어온 샘플의 인스턴스별 평균 부하를 반환하고 커서를 옮긴다."""
+        cursor = self.store.next_seq
+        loads = self.store.collect(self.filter, since_seq=self.cursor)
+        self.cursor = cursor
+        return loads
+
+    def window_payload(self) -> Optional[bytes]:
+        """window_loads() 결과의 EventNotification JSON 바이트 (없으면 None)"""
+        return self.store.collect_json(self.filter)
+
+    def take_new_payload(self) -> Optional[bytes]:
+        """take_new_loads() 결과의 EventNotification JSON 바이트 (없으면 None)"""
+        cursor = self.store.next_seq
+        payload = self.store.collect_json(self.filter, since_seq=self.cursor)
+        self.cursor = cursor
+        return payload
@@ -1,26 +1,203 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
 
 import httpx
 
 from dataclasses import dataclass
 
+from config.app_config import DeliveryPolicyConfig, HttpClientConfig
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 # 응답 객체 정의
 @dataclass
 class ApiResponse:
     status_code: int
-    body: Optional[Dict[str, Any]] = None
+    body: Optional[Any] = None  # JSON 이면 파싱한 값, 아니면 문자열
     error: Optional[str] = None
+    location: Optional[str] = None  # Location 헤더 (생성된 리소스 URI)
+
+
+class NfRequestError(Exception):
+    """
+    NF 요청이 실패했거나 응답을 사용할 수 없는 경우
+
+    Attributes:
+        status_code: 응답 상태 코드 (timeout/연결 오류는 0)
+    """
+
+    def __init__(self, status_code: int, message: Optional[str]):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self) -> bool:
+        return _is_retryable(self.status_code)
+
+
+class NfClientPool:
+    """
+    NF 로 보내는 HTTP 요청에 사용하는 장수명 httpx.AsyncClient 풀
+
+    목적지(scheme://host:port) 별로 클라이언트를 하나씩 만들어 keep-alive 연결을
+    재사용하므로, 요청마다 TCP 연결(TLS 사용 시 handshake 포함)을 새로 맺지 않는다.
+    목적지별 클라이언트의 연결 수 제한이 곧 호스트별 연결 수 제한이 된다.
+
+    HTTP/2 로 설정된 목적지는 동시에 보내는 요청을 하나의 연결에 다중화한다.
+    h2 패키지가 없으면 경고를 남기고 HTTP/1.1 을 사용한다.
+
+    Args:
+        config: 타임아웃과 연결 수 제한 설정
+        transport: 클라이언트에 사용할 transport (테스트용)
+    """
+
+    def __init__(
+        self,
+        config: HttpClientConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config
+        self.transport = transport
+        self.timeout = _build_timeout(config)
+        self.limits = httpx.Limits(
+            max_connections=config.max_connections_per_host,
+            max_keepalive_connections=config.max_keepalive_connections_per_host,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # 목적지별로 실제 사용하는 HTTP 버전
+        self.http_versions: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def client_for(self, uri: str) -> httpx.AsyncClient:
+        """uri 의 목적지에 해당하는 클라이언트를 반환한다. 없으면 새로 만든다."""
+        url = httpx.URL(uri)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        destination = f"{url.host}:{port}"
+        origin = f"{url.scheme}://{destination}"
+        client = self._clients.get(origin)
+        if client is None:
+            http_version = self._resolve_http_version(
+                self.config.http_version_for(destination)
+            )
+            client = self._create_client(http_version)
+            self._clients[origin] = client
+            self.http_versions[origin] = http_version
+        return client
+
+    @staticmethod
+    def _resolve_http_version(http_version: str) -> str:
+        if http_version in ("2", "h2c"):
+            if _h2_available():
+                return http_version
+            logging.warning(
+                f"HTTP/2 ({http_version}) requested but the 'h2' package is not "
+                "installed; using HTTP/1.1"
+            )
+        elif http_version != "1.1":
+            logging.warning(f"Unknown http_version '{http_version}'; using HTTP/1.1")
+        return "1.1"
+
+    def _create_client(self, http_version: str) -> httpx.AsyncClient:
+        # h2c 는 업그레이드 없이 처음부터 HTTP/2 로 요청한다.
+        http1 = http_version != "h2c"
+        http2 = http_version in ("2", "h2c")
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self.limits,
+            http1=http1,
+            http2=http2,
+            transport=self.transport,
+        )
+
+    async def aclose(self) -> None:
+        """모든 클라이언트의 연결을 닫는다."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self.http_versions.clear()
+        for client in clients:
+            await client.aclose()
+
 
+_client_pool: Optional[NfClientPool] = None
 
-async def _make_post_request(
-    uri: str, payload: Dict[str, Any], request_id: str, log_context: str
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_timeout(config: HttpClientConfig) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=config.connect_timeout,
+        read=config.read_timeout,
+        write=config.write_timeout,
+        pool=config.pool_timeout,
+    )
+
+
+def open_client_pool(
+    config: HttpClientConfig, transport: Optional[httpx.AsyncBaseTransport] = None
+) -> NfClientPool:
+    """
+    애플리케이션 전역 클라이언트 풀을 생성한다. lifespan 시작 시 호출된다.
+    """
+    global _client_pool
+    _client_pool = NfClientPool(config, transport)
+    return _client_pool
+
+
+async def close_client_pool() -> None:
+    """
+    애플리케이션 전역 클라이언트 풀을 닫는다. lifespan 종료 시 호출된다.
+    """
+    global _client_pool
+    pool, _client_pool = _client_pool, None
+    if pool is not None:
+        await pool.aclose()
+
+
+def _request_body(payload: Optional[Dict[str, Any] | bytes]) -> dict:
+    # 이미 직렬화된 JSON 바이트는 다시 인코딩하지 않고 그대로 보낸다.
+    if isinstance(payload, bytes):
+        return {"content": payload, "headers": _JSON_HEADERS}
+    return {"json": payload}
+
+
+async def _send(
+    method: str, uri: str, payload: Optional[Dict[str, Any] | bytes]
+) -> httpx.Response:
+    body = _request_body(payload)
+    if _client_pool is not None:
+        return await _client_pool.client_for(uri).request(method, uri, **body)
+
+    # 풀이 없는 경우(lifespan 밖에서 사용하는 경우) 요청마다 클라이언트를 만든다.
+    async with httpx.AsyncClient(timeout=_build_timeout(HttpClientConfig())) as client:
+        return await client.request(method, uri, **body)
+
+
+async def _make_request(
+    method: str,
+    uri: str,
+    payload: Optional[Dict[str, Any] | bytes],
+    request_id: str,
+    log_context: str,
 ) -> ApiResponse:
     """
-    공통 HTTP POST 요청을 수행합니다.
+    공통 HTTP 요청을 수행합니다.
 
     Args:
+        method: HTTP 메서드 (예: 'POST', 'DELETE')
         uri: 요청 대상 URI
         payload: 요청 페이로드
         request_id: 요청 식별자 (로깅용)
@@ -29,16 +206,14 @@ async def _make_post_request(
     Returns:
         ApiResponse 객체 (상태 코드, 본문, 오류 메시지)
     """
-    timeout = httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0)
-
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(uri, json=payload)
-            response.raise_for_status()
-            return ApiResponse(
-                status_code=response.status_code,
-                body=response.json() if response.content else None,
-            )
+        response = await _send(method, uri, payload)
+        response.raise_for_status()
+        return ApiResponse(
+            status_code=response.status_code,
+            body=_response_body(response),
+            location=response.headers.get("location"),
+        )
 
     except httpx.TimeoutException as e:
         logging.error(
@@ -63,9 +238,214 @@ async def _make_post_request(
         return ApiResponse(status_code=0, error=str(e))
 
 
-async def subscribe_to_nf(
-    subscription_id: str, uri: str, payload
-) -> Optional[Dict[str, Any]]:
+def _response_body(response: httpx.Response) -> Optional[Any]:
+    """JSON 응답만 파싱하고, 그 밖의 본문(예: 텍스트 ID)은 문자열로 반환한다."""
+    if not response.content:
+        return None
+    if "json" in response.headers.get("content-type", ""):
+        return response.json()
+    return response.text
+
+
+def _is_retryable(status_code: int) -> bool:
+    """timeout/연결 오류(0), 429, 5xx 는 일시적인 실패로 보고 재시도한다."""
+    return status_code == 0 or status_code == 429 or status_code >= 500
+
+
+class CircuitBreaker:
+    """
+    목적지 하나에 대한 circuit breaker
+
+    - closed: 정상적으로 전송한다.
+    - open: failure_threshold 번 연속 실패하면 reset_timeout 동안 바로 실패 처리한다.
+    - half_open: reset_timeout 이 지나면 한 번의 시험 전송을 허용하고,
+      성공하면 closed, 실패하면 다시 open 이 된다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self, now: float) -> bool:
+        """지금 전송해도 되는지 여부"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            return True
+        # open 이거나 half_open 의 시험 전송이 진행 중인 경우
+        return False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self, now: float) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = now
+
+
+class DeliveryPolicy:
+    """
+    알림 콜백 전송 정책
+
+    일시적인 실패는 jitter 가 있는 지수 backoff 로 max_retries 번까지 재시도하고,
+    notification_uri 별 CircuitBreaker 가 열려 있는 동안에는 요청을 보내지 않고
+    바로 실패 처리한다. 따라서 죽은 consumer 가 연결 timeout 으로 송신 태스크를
+    붙잡지 않는다. buffer_size 가 설정되면 그동안의 알림을 보관했다가
+    목적지가 복구되면 순서대로 전송한다.
+
+    Args:
+        config: 재시도와 circuit breaker 설정
+        clock: 현재 시각 함수 (테스트용)
+    """
+
+    def __init__(
+        self,
+        config: DeliveryPolicyConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._buffers: Dict[str, deque] = {}
+
+    def breaker_for(self, uri: str) -> CircuitBreaker:
+        breaker = self._breakers.get(uri)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                self.config.failure_threshold, self.config.reset_timeout
+            )
+            self._breakers[uri] = breaker
+        return breaker
+
+    def buffered(self, uri: str) -> int:
+        """uri 로 보내기 위해 보관 중인 알림 수"""
+        return len(self._buffers.get(uri, ()))
+
+    async def send(
+        self, notification_id: str, uri: str, payload: Dict[str, Any] | bytes
+    ) -> ApiResponse:
+        breaker = self.breaker_for(uri)
+        if not breaker.allow(self._clock()):
+            return self._reject(notification_id, uri, payload)
+
+        response = await self._send_with_retry(notification_id, uri, payload, breaker)
+        if _is_retryable(response.status_code):
+            breaker.record_failure(self._clock())
+            if breaker.state == CircuitBreaker.OPEN:
+                logging.warning(f"Circuit opened for {uri}")
+            return response
+
+        breaker.record_success()
+        if self._buffers.get(uri):
+            await self._flush(uri, breaker)
+        return response
+
+    async def _send_with_retry(
+        self,
+        notification_id: str,
+        uri: str,
+        payload: Dict[str, Any] | bytes,
+        breaker: CircuitBreaker,
+    ) -> ApiResponse:
+        attempt = 0
+        while True:
+            response = await _make_request(
+                method="POST",
+                uri=uri,
+                payload=payload,
+                request_id=notification_id,
+                log_context="notification",
+            )
+            if (
+                not _is_retryable(response.status_code)
+                or attempt >= self.config.max_retries
+                # 다른 전송으로 이미 circuit 이 열렸으면 더 기다리지 않는다.
+                or breaker.state == CircuitBreaker.OPEN
+            ):
+                return response
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 여러 송신 태스크가 같은 시각에 재시도하지 않도록 한다.
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def _reject(
+        self, notification_id: str, uri: str, payload: Dict[str, Any] | bytes
+    ) -> ApiResponse:
+        if self.config.buffer_size > 0:
+            buffer = self._buffers.get(uri)
+            if buffer is None:
+                buffer = deque(maxlen=self.config.buffer_size)
+                self._buffers[uri] = buffer
+            buffer.append((notification_id, payload))
+            logging.debug(f"Circuit open, notification buffered: {notification_id}")
+        else:
+            logging.debug(f"Circuit open, notification dropped: {notification_id}")
+        return ApiResponse(status_code=0, error=f"circuit open for {uri}")
+
+    async def _flush(self, uri: str, breaker: CircuitBreaker) -> None:
+        buffer = self._buffers[uri]
+        while buffer and breaker.state == CircuitBreaker.CLOSED:
+            notification_id, payload = buffer.popleft()
+            response = await _make_request(
+                method="POST",
+                uri=uri,
+                payload=payload,
+                request_id=notification_id,
+                log_context="notification",
+            )
+            if _is_retryable(response.status_code):
+                buffer.appendleft((notification_id, payload))
+                breaker.record_failure(self._clock())
+                break
+
+
+_delivery_policy = DeliveryPolicy(DeliveryPolicyConfig())
+
+
+def configure_delivery_policy(config: DeliveryPolicyConfig) -> DeliveryPolicy:
+    """
+    알림 콜백 전송 정책을 설정한다. lifespan 시작 시 호출된다.
+    """
+    global _delivery_policy
+    _delivery_policy = DeliveryPolicy(config)
+    return _delivery_policy
+
+
+def _remote_subscription_id(response: ApiResponse) -> Optional[str]:
+    """
+    구독 응답에서 NF 가 만든 구독 ID 를 찾는다.
+
+    Location 헤더(개별 구독 리소스 URI)의 마지막 경로를 우선 사용하고,
+    없으면 본문의 subscriptionId/id 필드를, 본문이 문자열이면 그 값을 사용한다.
+    """
+    if response.location:
+        remote_id = response.location.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+        if remote_id:
+            return remote_id
+    body = response.body
+    if isinstance(body, dict):
+        remote_id = body.get("subscriptionId") or body.get("id")
+        return str(remote_id) if remote_id else None
+    if isinstance(body, str) and body:
+        return body
+    return None
+
+
+async def subscribe_to_nf(subscription_id: str, uri: str, payload) -> str:
     """
     NF에 구독 요청을 보내는 비동기 함수이다.
 
@@ -75,37 +455,69 @@ async def subscribe_to_nf(
         payload: 구독 요청 페이로드 (SubscriptionPayload 객체)
 
     Returns:
-        성공 시 API 응답 본문 (딕셔너리), 실패 시 None
+        NF 가 만든 구독 ID (해지 요청에 사용)
+
+    Raises:
+        NfRequestError: 구독 요청이 실패했거나, 응답에 구독 ID 가 없어 나중에
+            해지할 수 없는 경우
     """
 
-    response = await _make_post_request(
+    response = await _make_request(
+        method="POST",
         uri=uri,
         payload=payload,
         request_id=subscription_id,
         log_context="subscription",
     )
 
-    if response.status_code >= 200 and response.status_code < 300:
-        return response.body
+    if not (200 <= response.status_code < 300):
+        raise NfRequestError(response.status_code, response.error)
+
+    remote_id = _remote_subscription_id(response)
+    if remote_id is None:
+        raise NfRequestError(
+            response.status_code, f"No subscription id in the response from {uri}"
+        )
+    return remote_id
 
-    raise Exception(response.error)
+
+async def unsubscribe_from_nf(subscription_id: str, uri: str) -> bool:
+    """
+    NF에 구독 해지 요청을 보내는 비동기 함수이다.
+
+    Args:
+        subscription_id: NF가 응답한 구독 ID
+        uri: 구독 요청을 보냈던 URI (구독 ID를 붙여 개별 구독 리소스로 요청)
+
+    Returns:
+        성공 시 True, 실패 시 False
+    """
+    response = await _make_request(
+        method="DELETE",
+        uri=f"{uri.rstrip('/')}/{subscription_id}",
+        payload=None,
+        request_id=subscription_id,
+        log_context="unsubscription",
+    )
+    return 200 <= response.status_code < 300
 
 
 async def send_notification(
-    notification_id: str, uri: str, payload: Dict[str, Any]
+    notification_id: str, uri: str, payload: Dict[str, Any] | bytes
 ) -> int:
     """
     알림을 보내는 비동기 함수입니다.
 
+    일시적인 실패는 DeliveryPolicy 에 따라 재시도되며, circuit 이 열린
+    목적지로는 요청을 보내지 않고 0 을 반환합니다.
+
     Args:
         notification_id: 알림 ID
         uri: 요청 대상 URI
-        payload: 알림 페이로드 (딕셔너리)
+        payload: 알림 페이로드 (딕셔너리 또는 직렬화된 JSON 바이트)
 
     Returns:
         HTTP 상태 코드 (성공/실패 여부에 따라)
     """
-    response = await _make_post_request(
-        uri=uri, payload=payload, request_id=notification_id, log_context="notification"
-    )
+    response = await _delivery_policy.send(notification_id, uri, payload)
     return response.status_code
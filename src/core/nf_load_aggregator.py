@@ -1,9 +1,18 @@
-from typing import Dict
-from pydantic import StrictInt
+from typing import Dict, Optional
+
+import numpy as np
+from pydantic import StrictInt, TypeAdapter
 
 
 from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
 
+from .load_columns import LOAD_FIELDS, LoadColumnStore
+from .load_sample import LoadMeta
+
+_STATUS_FIELDS = ("status_registered", "status_unregistered", "status_undiscoverable")
+
+_load_infos_adapter = TypeAdapter(list[NfLoadLevelInformation])
+
 
 def average(values: list[StrictInt]) -> float:
     return round(sum(values) / len(values), 2) if values else 0
@@ -106,3 +115,97 @@ def calculate_average_loads(
         nf_load_level_infos.append(load)
 
     return nf_load_level_infos
+
+
+def build_load_info(
+    meta: LoadMeta, nf_status: Optional[tuple], averages: list[int]
+) -> NfLoadLevelInformation:
+    """
+    집계 결과 NfLoadLevelInformation 을 만든다.
+
+    빈 모델에 필드를 하나씩 대입하면 validate_assignment 로 대입마다 검증이
+    일어나므로, 모든 필드를 담은 dict 를 한 번에 검증한다. (model_construct 는
+    파이썬에서 기본값을 채우므로 pydantic-core 의 한 번 검증보다 느리다.)
+
+    Args:
+        meta: 결과에 복사할 샘플 메타데이터
+        nf_status: STATUS_ALIASES 순서의 튜플 또는 None
+        averages: LOAD_FIELDS 순서의 평균값
+    """
+    fields = dict(zip(LOAD_FIELDS, averages))
+    fields["nf_instance_id"] = meta.nf_instance_id
+    fields["nf_type"] = meta.nf_type
+    fields["nf_set_id"] = meta.nf_set_id
+    if meta.snssai is not None:
+        sst, sd = meta.snssai
+        fields["snssai"] = {"sst": sst, "sd": sd} if sd else {"sst": sst}
+    if nf_status is not None:
+        fields["nf_status"] = {
+            name: value
+            for name, value in zip(_STATUS_FIELDS, nf_status)
+            if value is not None
+        }
+    return NfLoadLevelInformation.model_validate(fields)
+
+
+def dump_load_infos_json(loads: list[NfLoadLevelInformation]) -> bytes:
+    """집계 결과를 3GPP alias 를 사용하는 JSON 바이트로 직렬화한다."""
+    return _load_infos_adapter.dump_json(loads, by_alias=True, exclude_none=True)
+
+
+def dump_event_notification_json(loads: list[NfLoadLevelInformation]) -> bytes:
+    """
+    집계 결과를 담은 EventNotification 본문을 JSON 바이트로 만든다.
+
+    EventNotification 모델을 만들지 않고 nfLoadLevelInfos 만 감싼다.
+    """
+    return b'{"nfLoadLevelInfos":' + dump_load_infos_json(loads) + b"}"
+
+
+def calculate_average_loads_columnar(
+    store: LoadColumnStore,
+    since_seq: Optional[int] = None,
+) -> list[NfLoadLevelInformation]:
+    """
+    LoadColumnStore 에 저장된 한 시계열의 샘플 평균을 NumPy 로 계산한다.
+
+    calculate_average_loads 와 같은 결과를 내며, 메타데이터는 가장 오래된
+    샘플의 값을 사용한다. since_seq 를 지정하면 순번이 since_seq 이상인
+    샘플만 집계한다. 샘플이 없으면 빈 목록을 반환한다.
+    """
+    slots = store.slots()
+    if since_seq is not None:
+        slots = slots[store.seq[slots] >= since_seq]
+    if len(slots) == 0:
+        return []
+
+    present = store.present[:, slots]
+    sums = np.where(present, store.values[:, slots], 0).sum(axis=1)
+    counts = present.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        averages = np.where(counts > 0, np.round(sums / counts, 2), 0).astype(np.int64)
+
+    slot = int(slots[0])
+    return [
+        build_load_info(
+            store.meta_at(slot), store.nf_status_at(slot), averages.tolist()
+        )
+    ]
+
+
+def calculate_average_loads_incremental(
+    store: LoadColumnStore,
+) -> list[NfLoadLevelInformation]:
+    """
+    LoadColumnStore 가 유지하는 running sum/count 로 시계열의 평균을 만든다.
+
+    저장된 샘플 수와 관계없이 지표 수에 비례하는 비용으로
+    calculate_average_loads_columnar 와 같은 값을 반환한다.
+    """
+    aggregates = store.aggregates
+    if not len(aggregates):
+        return []
+
+    slot = aggregates.first_slot()
+    averages = [int(aggregates.average(row)) for row in range(len(LOAD_FIELDS))]
+    return [build_load_info(store.meta_at(slot), store.nf_status_at(slot), averages)]
@@ -0,0 +1,268 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from config.app_config import NotificationDispatchConfig
+
+from .nf_client import send_notification
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutboundNotification:
+    """
+    전송 대기 중인 알림 하나
+
+    payload 는 직렬화된 JSON 바이트이거나 JSON 으로 보낼 dict 이다.
+    """
+
+    notification_id: str
+    uri: str
+    payload: Any
+    notif_corr_id: Optional[str] = None
+
+
+def _to_json_bytes(payload: Any) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def build_batch_payload(notifications: list[OutboundNotification]) -> bytes:
+    """
+    여러 구독의 알림을 하나의 요청 본문(JSON 바이트)으로 묶는다.
+
+    구독별로 {"subscriptionId", "notifCorrId", "eventNotifications"} 항목을
+    만들고, 같은 구독의 알림은 eventNotifications 에 순서대로 담는다.
+    이미 직렬화된 알림 바이트는 다시 파싱하지 않고 그대로 이어 붙인다.
+    """
+    entries: dict[str, tuple[dict, list[bytes]]] = {}
+    for notification in notifications:
+        entry = entries.get(notification.notification_id)
+        if entry is None:
+            header = {"subscriptionId": notification.notification_id}
+            if notification.notif_corr_id is not None:
+                header["notifCorrId"] = notification.notif_corr_id
+            entry = (header, [])
+            entries[notification.notification_id] = entry
+        entry[1].append(_to_json_bytes(notification.payload))
+
+    items = []
+    for header, payloads in entries.values():
+        # header 의 닫는 중괄호 앞에 eventNotifications 를 붙인다.
+        items.append(
+            _to_json_bytes(header)[:-1]
+            + b',"eventNotifications":['
+            + b",".join(payloads)
+            + b"]}"
+        )
+    return b"[" + b",".join(items) + b"]"
+
+
+class _Destination:
+    __slots__ = ("queue", "senders", "batching", "posts")
+
+    def __init__(self, max_in_flight: int):
+        self.queue: deque[OutboundNotification] = deque()
+        # 실행 중인 송신 태스크 수 (배치 모드에서는 배치 태스크와 전송 중인 요청)
+        self.senders = 0
+        # 배치 모드: 알림을 모으는 태스크가 실행 중인지 여부
+        self.batching = False
+        # 배치 모드: 목적지로 동시에 보내는 요청 수 제한
+        self.posts = asyncio.Semaphore(max_in_flight)
+
+
+class NotificationDispatcher:
+    """
+    완성된 알림을 비동기로 전송하는 송신 파이프라인
+
+    핸들러는 submit() 으로 알림을 큐에 넣고 바로 돌아가며, 실제 전송은
+    목적지(uri)별 송신 태스크가 처리한다. 목적지마다 동시에 전송하는 수는
+    max_in_flight_per_destination 으로 제한되므로 느린 consumer 는 자기
+    목적지의 큐만 쌓이게 하고 다른 목적지나 집계를 막지 않는다.
+
+    대기 중인 알림 수는 queue_size 로 제한되며, 가득 차면 새 알림은 버려진다.
+
+    배치 모드로 설정된 목적지는 목적지마다 배치 태스크 하나가 batch window
+    동안 모인 알림을 여러 구독의 알림을 담은 하나의 요청으로 보낸다
+    (build_batch_payload 참고). max_in_flight_per_destination 은 이 목적지로
+    동시에 보내는 요청 수만 제한한다.
+
+    Args:
+        config: 큐 크기와 동시 전송 수 설정
+    """
+
+    def __init__(self, config: Optional[NotificationDispatchConfig] = None):
+        self.config = config or NotificationDispatchConfig()
+        self._destinations: dict[str, _Destination] = {}
+        self._senders: set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self._closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """전송 대기 중인 알림 수"""
+        return self._pending
+
+    def submit(
+        self,
+        notification_id: str,
+        uri: str,
+        payload: bytes | Dict[str, Any],
+        notif_corr_id: Optional[str] = None,
+    ) -> bool:
+        """
+        알림을 전송 큐에 넣는다. 이벤트 루프에서 호출해야 하며 기다리지 않는다.
+
+        Returns:
+            큐에 들어갔으면 True, 큐가 가득 찼거나 종료 중이면 False
+        """
+        if self._closed:
+            logger.warning(
+                f"Dispatcher closed, notification dropped: {notification_id}"
+            )
+            return False
+        if self._pending >= self.config.queue_size:
+            self.dropped += 1
+            logger.warning(
+                f"Outbound queue full, notification dropped: {notification_id} -> {uri}"
+            )
+            return False
+
+        destination = self._destinations.get(uri)
+        if destination is None:
+            destination = _Destination(self.config.max_in_flight_per_destination)
+            self._destinations[uri] = destination
+        destination.queue.append(
+            OutboundNotification(notification_id, uri, payload, notif_corr_id)
+        )
+        self._pending += 1
+
+        batch_window = self.config.batch_window_for(uri)
+        if batch_window > 0:
+            if not destination.batching:
+                destination.batching = True
+                self._spawn(
+                    uri, destination, self._batch(uri, destination, batch_window)
+                )
+        elif destination.senders < self.config.max_in_flight_per_destination:
+            self._spawn(uri, destination, self._drain(destination))
+        return True
+
+    def _spawn(self, uri: str, destination: _Destination, coro) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.config.max_senders)
+        destination.senders += 1
+        task = asyncio.get_running_loop().create_task(
+            self._run_sender(uri, destination, coro)
+        )
+        self._senders.add(task)
+        task.add_done_callback(self._senders.discard)
+
+    async def _run_sender(self, uri: str, destination: _Destination, coro) -> None:
+        try:
+            await coro
+        finally:
+            destination.senders -= 1
+            if not destination.senders and not destination.queue:
+                self._destinations.pop(uri, None)
+
+    async def _drain(self, destination: _Destination) -> None:
+        while destination.queue:
+            notification = destination.queue.popleft()
+            self._pending -= 1
+            async with self._slots:
+                await self._deliver(notification)
+
+    async def _batch(
+        self, uri: str, destination: _Destination, batch_window: float
+    ) -> None:
+        """
+        목적지의 알림을 batch_window 동안 모아 요청 하나로 보낸다.
+
+        큐가 빌 때까지 반복하며, 요청은 동시 전송 수 제한 안에서 기다리지 않고
+        보내므로 느린 요청이 다음 배치를 모으는 것을 막지 않는다.
+        """
+        try:
+            while destination.queue:
+                if len(destination.queue) < self.config.max_batch_size:
+                    await asyncio.sleep(batch_window)
+                await destination.posts.acquire()
+                batch = self._take_batch(destination)
+                self._spawn(uri, destination, self._post_batch(uri, destination, batch))
+        finally:
+            destination.batching = False
+
+    async def _post_batch(
+        self, uri: str, destination: _Destination, batch: list[OutboundNotification]
+    ) -> None:
+        try:
+            async with self._slots:
+                await self._deliver_batch(uri, batch)
+        finally:
+            destination.posts.release()
+
+    def _take_batch(self, destination: _Destination) -> list[OutboundNotification]:
+        count = min(len(destination.queue), self.config.max_batch_size)
+        batch = [destination.queue.popleft() for _ in range(count)]
+        self._pending -= count
+        return batch
+
+    async def _deliver_batch(self, uri: str, batch: list[OutboundNotification]) -> None:
+        # 배치 모드 목적지는 알림이 하나여도 같은 형식으로 받는다.
+        await self._deliver(
+            OutboundNotification(
+                notification_id=f"batch({len(batch)})",
+                uri=uri,
+                payload=build_batch_payload(batch),
+            )
+        )
+
+    async def _deliver(self, notification: OutboundNotification) -> None:
+        try:
+            # 클라이언트 콜백 URL로 알림 전송
+            status_code = await send_notification(
+                notification_id=notification.notification_id,
+                uri=notification.uri,
+                payload=notification.payload,
+            )
+            if 200 <= status_code < 300:
+                logger.debug(
+                    f"Notification sent successfully: {notification.notification_id}"
+                )
+            else:
+                logger.warning(
+                    f"Notification sending failed: {notification.notification_id},"
+                    f"Status code={status_code}"
+                )
+        except asyncio.TimeoutError:
+            logger.error(f"Notification timeout: {notification.notification_id}")
+        except ConnectionError:
+            logger.error(f"Connection failed: {notification.notification_id}")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error: {notification.notification_id} {e}", exc_info=True
+            )
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        새 알림을 받지 않고, timeout 동안 남은 알림을 전송한 뒤 송신 태스크를 정리한다.
+        """
+        self._closed = True
+        if self._senders:
+            await asyncio.wait(set(self._senders), timeout=timeout)
+        for task in list(self._senders):
+            task.cancel()
+        if self._senders:
+            await asyncio.gather(*self._senders, return_exceptions=True)
+        if self._pending:
+            logger.warning(
+                f"Discarding {self._pending} undelivered notifications on shutdown"
+            )
+        self._destinations.clear()
+        self._pending = 0
@@ -0,0 +1,101 @@
+from typing import Generic, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RingSnapshot(Generic[T]):
+    """
+    TimedRingBuffer 의 특정 시점 구간을 복사하지 않고 참조하는 뷰
+
+    스냅샷 이후 버퍼가 한 바퀴 이상 덮어써지면 더 이상 유효하지 않으므로,
+    이벤트 루프에서 스냅샷을 만든 직후 await 없이 읽어야 한다.
+    """
+
+    __slots__ = ("_buffer", "_start", "_length", "_written")
+
+    def __init__(self, buffer: "TimedRingBuffer[T]", start: int, length: int):
+        self._buffer = buffer
+        self._start = start
+        self._length = length
+        self._written = buffer._written
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        buffer = self._buffer
+        if buffer._written - self._written > buffer.capacity - self._length:
+            raise RuntimeError("ring buffer snapshot was overwritten")
+        items = buffer._items
+        capacity = buffer.capacity
+        for offset in range(self._length):
+            yield items[(self._start + offset) % capacity]
+
+
+class TimedRingBuffer(Generic[T]):
+    """
+    타임스탬프 순으로 항목을 저장하는 고정 크기 링 버퍼
+
+    - append: O(1), 가득 차면 가장 오래된 항목을 덮어쓴다.
+    - expire_before: 오래된 항목을 head 포인터 이동만으로 제거한다.
+    - snapshot: 현재 구간을 복사 없이 참조하는 뷰를 반환한다.
+    - span/item_at: 현재 구간의 슬롯을 복사 없이 읽는다 (열 저장소용).
+
+    Args:
+        capacity: 저장할 수 있는 최대 항목 수
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamps: list[float] = [0.0] * capacity
+        self._items: list[Optional[T]] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        # 지금까지 기록된 항목 수 (스냅샷 유효성 확인용)
+        self._written = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, item: T) -> int:
+        """
+        항목을 추가하고 저장된 슬롯 번호를 반환한다.
+        버퍼가 가득 차면 가장 오래된 항목이 밀려난다.
+        """
+        tail = (self._head + self._size) % self.capacity
+        self._timestamps[tail] = timestamp
+        self._items[tail] = item
+        self._written += 1
+        if self._size == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+        else:
+            self._size += 1
+        return tail
+
+    def expire_before(self, cutoff: float) -> int:
+        """cutoff 보다 오래된 항목을 제거하고 제거한 개수를 반환한다."""
+        expired = 0
+        while self._size and self._timestamps[self._head] < cutoff:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            expired += 1
+        return expired
+
+    def span(self) -> tuple[int, int]:
+        """현재 구간의 시작 슬롯과 길이를 반환한다."""
+        return self._head, self._size
+
+    def item_at(self, slot: int) -> Optional[T]:
+        """슬롯 번호에 저장된 항목을 반환한다."""
+        return self._items[slot]
+
+    def snapshot(self) -> RingSnapshot[T]:
+        """현재 저장된 항목을 오래된 순서로 참조하는 뷰를 반환한다."""
+        return RingSnapshot(self, self._head, self._size)
+
+    def clear(self) -> None:
+        """모든 항목을 제거한다. 이전에 만든 스냅샷은 덮어쓰기 전까지 유효하다."""
+        self._head = (self._head + self._size) % self.capacity
+        self._size = 0
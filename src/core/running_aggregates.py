@@ -0,0 +1,101 @@
+from collections import deque
+from typing import Optional, Sequence
+
+
+class RunningLoadAggregates:
+    """
+    한 시계열의 지표별 running sum/count/min/max
+
+    샘플이 윈도우에 들어오면 add(), 윈도우에서 빠지면 remove() 로 갱신하므로
+    보고 시점에 저장된 샘플을 다시 읽을 필요가 없다. 샘플은 들어온
+    순서대로(FIFO) 빠져야 한다.
+
+    min/max 는 (seq, value) 단조 deque 로 관리하며 갱신 비용은 amortized O(1) 이다.
+
+    Args:
+        n_fields: 지표 수
+    """
+
+    def __init__(self, n_fields: int):
+        self.n_fields = n_fields
+        self.sums: list[int] = [0] * n_fields
+        self.counts: list[int] = [0] * n_fields
+        self._mins: list[deque] = [deque() for _ in range(n_fields)]
+        self._maxs: list[deque] = [deque() for _ in range(n_fields)]
+        self._slots: deque = deque()
+
+    def __len__(self) -> int:
+        """윈도우에 있는 샘플 수"""
+        return len(self._slots)
+
+    def add(
+        self,
+        seq: int,
+        slot: int,
+        values: Sequence[int],
+        present: Sequence[bool],
+    ) -> None:
+        """샘플을 윈도우에 추가한다."""
+        sums = self.sums
+        counts = self.counts
+        for field in range(self.n_fields):
+            if not present[field]:
+                continue
+            value = values[field]
+            sums[field] += value
+            counts[field] += 1
+            window = self._mins[field]
+            while window and window[-1][1] >= value:
+                window.pop()
+            window.append((seq, value))
+            window = self._maxs[field]
+            while window and window[-1][1] <= value:
+                window.pop()
+            window.append((seq, value))
+        self._slots.append(slot)
+
+    def remove(
+        self,
+        seq: int,
+        values: Sequence[int],
+        present: Sequence[bool],
+    ) -> None:
+        """가장 오래된 샘플을 윈도우에서 제거한다."""
+        sums = self.sums
+        counts = self.counts
+        for field in range(self.n_fields):
+            if not present[field]:
+                continue
+            sums[field] -= values[field]
+            counts[field] -= 1
+            for window in (self._mins[field], self._maxs[field]):
+                if window and window[0][0] == seq:
+                    window.popleft()
+        self._slots.popleft()
+
+    def reset(self) -> None:
+        """모든 집계값을 초기화한다."""
+        self.sums = [0] * self.n_fields
+        self.counts = [0] * self.n_fields
+        for window in self._mins + self._maxs:
+            window.clear()
+        self._slots.clear()
+
+    def first_slot(self) -> int:
+        """가장 오래된 샘플이 저장된 슬롯"""
+        return self._slots[0]
+
+    def average(self, field: int) -> float:
+        """값이 없으면 0, 있으면 소수 둘째 자리까지 반올림한 평균"""
+        count = self.counts[field]
+        if not count:
+            return 0
+        return round(self.sums[field] / count, 2)
+
+    def minimum(self, field: int) -> Optional[int]:
+        window = self._mins[field]
+        return window[0][1] if window else None
+
+    def maximum(self, field: int) -> Optional[int]:
+        window = self._maxs[field]
+        return window[0][1] if window else None
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from .timing_wheel import TimerEntry, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+
+class HandlerScheduler:
+    """
+    모든 구독 핸들러를 하나의 asyncio 이벤트 루프에서 구동하는 스케줄러
+
+    구독마다 스레드를 만들고 1초마다 깨우는 대신, 각 핸들러의 보고 시각,
+    start_ts 활성화, end_ts/mon_dur 만료 시각을 하나의 계층형 타이밍 휠에
+    등록하고, 휠에서 다음 항목이 만료되는 시각에만 루프 타이머를 건다.
+    등록/취소는 O(1) 이며, 유휴 구독은 휠의 항목 외에는 CPU 를 사용하지 않는다.
+
+    시각 인자는 모두 time.time() 기준 epoch 초이다.
+    이벤트 루프 스레드에서만 호출해야 한다.
+
+    Args:
+        tick: 타이밍 휠의 해상도 (초)
+    """
+
+    DEFAULT_TICK_SEC = 0.01
+
+    def __init__(self, tick: float = DEFAULT_TICK_SEC):
+        self.tick = tick
+        self._wheel: Optional[TimingWheel] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_deadline: Optional[float] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._wheel) if self._wheel else 0
+
+    def _ensure_loop(self) -> None:
+        """
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프가 없는 경우
+        """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._wheel = TimingWheel(tick=self.tick, origin=self._loop.time())
+
+    def _to_loop_time(self, when: float) -> float:
+        return self._loop.time() + (when - time.time())
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> TimerEntry:
+        """when 시각에 callback 을 호출하도록 예약한다. 반환값으로 취소할 수 있다."""
+        self._ensure_loop()
+        entry = self._wheel.insert(self._to_loop_time(when), callback)
+        self._rearm()
+        return entry
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerEntry:
+        """delay 초 후에 callback 을 호출하도록 예약한다."""
+        return self.call_at(time.time() + delay, callback)
+
+    def spawn(self, coro_func: Callable[[], Awaitable[None]]) -> None:
+        """코루틴 함수를 짧게 실행되는 태스크로 실행한다."""
+        self._ensure_loop()
+        task = self._loop.create_task(coro_func())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _rearm(self) -> None:
+        deadline = self._wheel.next_expiry()
+        if deadline is None or deadline == self._timer_deadline:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._loop.call_at(deadline, self._on_timer)
+        self._timer_deadline = deadline
+
+    def _on_timer(self) -> None:
+        # 루프 타이머는 clock resolution 만큼 일찍 깨어날 수 있다.
+        now = max(self._loop.time(), self._timer_deadline)
+        self._timer = None
+        self._timer_deadline = None
+
+        for entry in self._wheel.advance(now):
+            try:
+                entry.callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback: {e}", exc_info=True)
+
+        self._rearm()
+
+    async def shutdown(self) -> None:
+        """예약된 타이머를 해제하고 실행 중인 핸들러 태스크를 정리한다."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_deadline = None
+        if self._loop is not None:
+            self._wheel = TimingWheel(tick=self.tick, origin=self._loop.time())
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.debug("HandlerScheduler shut down")
@@ -1,19 +1,18 @@
 import time
-import threading
-import queue
-import asyncio
 import logging
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Optional
 
-from openapi_server.models.event_notification import EventNotification
-from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
-
-from .nf_load_aggregator import calculate_average_loads
-from .nf_client import send_notification
+from .load_sample import LoadMeta, LoadSample
+from .load_store import LoadView
+from .nf_load_aggregator import build_load_info, dump_event_notification_json
+from .notification_dispatcher import NotificationDispatcher
 from .ifc import SubscriberManagerIfc
+from .scheduler import HandlerScheduler
+from .threshold_index import THRESHOLD_METRICS, ThresholdCrossing
+from .timing_wheel import TimerEntry
 
 logger = logging.getLogger(__name__)
 TIMEZONE: timezone = timezone(timedelta(hours=9))
@@ -33,7 +32,11 @@ class HandlerConfig:
     notif_method: str  # 알림 방법
 
     notification_uri: Optional[str]  # 알림 URI (선택)
+    notif_corr_id: Optional[str] = None  # 알림 상관 식별자 (선택)
     log_level: int = logging.INFO  # 로그 레벨 기본값
+    coalesce_window: float = 0.0  # 이벤트 기반 알림을 모아서 보내는 시간 (초)
+    thresholds: tuple = ()  # ON_THRESHOLD 임계값 (ThresholdLevel 목록)
+    change_delta: float = 0.0  # ON_CHANGE 에서 변경으로 보는 지표 변화량 (초과)
 
     # 클래스 상수: 기본값 정의
     DEFAULT_rep_period_SEC = 5.0  # 기본 보고 주기
@@ -48,6 +51,19 @@ class HandlerConfig:
             raise ValueError("rep_period must be positive")
         if self.max_report_nbr < 0:
             raise ValueError("max_report_nbr cannot be negative")
+        if self.coalesce_window < 0:
+            raise ValueError("coalesce_window cannot be negative")
+        if self.change_delta < 0:
+            raise ValueError("change_delta cannot be negative")
+        if self.notif_method == "ON_THRESHOLD" and not any(
+            getattr(threshold, metric) is not None
+            for threshold in self.thresholds
+            for metric in THRESHOLD_METRICS
+        ):
+            raise ValueError(
+                "ON_THRESHOLD requires nf_load_lvl_thds with "
+                + ", ".join(THRESHOLD_METRICS)
+            )
         if (
             self.start_ts is not None
             and self.end_ts is not None
@@ -56,12 +72,15 @@ class HandlerConfig:
             raise ValueError("start_ts must be earlier than end_ts")
 
     @staticmethod
-    def from_ncof_events_subscription(ncof_events_subscription) -> "HandlerConfig":
+    def from_ncof_events_subscription(
+        ncof_events_subscription, change_delta: float = 0.0
+    ) -> "HandlerConfig":
         """
         ncof_events_subscription에서 설정값을 추출해 HandlerConfig를 생성한다.
 
         Args:
             ncof_events_subscription: 이벤트 구독 객체
+            change_delta: ON_CHANGE 변경 기준 (ReportingConfig.change_delta)
         Returns:
             HandlerConfig: 추출된 설정값으로 채워진 설정 객체
         """
@@ -69,20 +88,27 @@ class HandlerConfig:
         evt_req = getattr(event_subscription, "evt_req", None)
         extra_report_req = getattr(event_subscription, "extra_report_req", None)
 
-        rep_period = getattr(
-            evt_req, "rep_period", HandlerConfig.DEFAULT_rep_period_SEC
+        rep_period = (
+            getattr(evt_req, "rep_period", None) or HandlerConfig.DEFAULT_rep_period_SEC
         )
-        max_report_nbr = getattr(
-            evt_req, "max_report_nbr", HandlerConfig.DEFAULT_MAX_REPORT_NBR
+        max_report_nbr = (
+            getattr(evt_req, "max_report_nbr", None)
+            or HandlerConfig.DEFAULT_MAX_REPORT_NBR
         )
 
         mon_dur = getattr(evt_req, "mon_dur", None)
         start_ts = getattr(extra_report_req, "start_ts", None)
         end_ts = getattr(extra_report_req, "end_ts", None)
 
-        notif_method = getattr(evt_req, "notif_method", "PERIODIC")
+        notif_method = getattr(evt_req, "notif_method", None) or "PERIODIC"
 
         notification_uri = getattr(ncof_events_subscription, "notification_uri", None)
+        notif_corr_id = getattr(ncof_events_subscription, "notif_corr_id", None)
+
+        # grp_rep_time 동안 도착한 이벤트는 하나의 알림으로 모아서 보낸다.
+        coalesce_window = getattr(evt_req, "grp_rep_time", None) or 0.0
+
+        thresholds = tuple(getattr(event_subscription, "nf_load_lvl_thds", None) or ())
 
         return HandlerConfig(
             rep_period=rep_period,
@@ -92,39 +118,61 @@ class HandlerConfig:
             end_ts=end_ts,
             notif_method=notif_method,
             notification_uri=notification_uri,
+            notif_corr_id=notif_corr_id,
             log_level=logging.INFO,
+            coalesce_window=coalesce_window,
+            thresholds=thresholds,
+            change_delta=change_delta,
         )
 
 
-@dataclass
-class TimedNotification:
-    """타임스탬프를 포함하는 알림 데이터 클래스"""
-
-    timestamp: float
-    notification: NfLoadLevelInformation
+class SubscriptionHandler:
+    """
+    구독 요청을 처리하고 조건에 따라 알림을 전송하는 핸들러 클래스
 
+    전용 스레드 없이 HandlerScheduler 의 타이밍 휠에 start_ts 활성화,
+    보고 시각, end_ts/mon_dur 만료 타이머를 각각 등록하고, 타이머가 만료될
+    때만 이벤트 루프에서 실행된다.
 
-class SubscriptionHandler(threading.Thread):
-    """구독 요청을 처리하고 조건에 따라 알림을 전송하는 스레드 클래스"""
+    부하 정보는 직접 보관하지 않고, 공유 LoadStore 위의 LoadView 를 통해
+    구독 조건에 맞는 인스턴스만 집계한다.
+    """
 
     def __init__(
         self,
         subscription_id: str,
         handler_manager: SubscriberManagerIfc,
         config: HandlerConfig,
+        scheduler: HandlerScheduler,
+        load_view: LoadView,
+        dispatcher: NotificationDispatcher,
     ):
-        super().__init__(daemon=True)
-
         self.subscription_id = subscription_id
         self.subscription_manager = handler_manager
-        self.notifications: list[TimedNotification] = []
+        self.scheduler = scheduler
+        self.load_view = load_view
+        self.dispatcher = dispatcher
         self.start_time = time.time()
-        self.loop = asyncio.get_event_loop()
-        self.lock = threading.Lock()
+        self.last_report_time = self.start_time
         self.config = config
 
         self.report_count = 0
         self.running = True
+        self.active = False
+
+        # 이벤트 기반 보고가 예약되었거나 진행 중인지 여부
+        self._report_requested = False
+        # 마지막 보고 이후 새 알림이 도착했는지 여부
+        self._has_new_events = False
+        # ON_THRESHOLD: 마지막 보고 이후 임계값을 넘은 시계열(LoadMeta)별 최근 샘플
+        self._crossed_loads: dict[LoadMeta, LoadSample] = {}
+        # ON_CHANGE: 시계열(LoadMeta)별 마지막으로 보고한 지표 (LoadSample.values)
+        self._last_reported: dict[LoadMeta, tuple] = {}
+        # ON_CHANGE: 마지막 보고 이후 값이 바뀐 시계열별 최근 샘플
+        self._changed_loads: dict[LoadMeta, LoadSample] = {}
+        self._activation_timer: Optional[TimerEntry] = None
+        self._report_timer: Optional[TimerEntry] = None
+        self._expiry_timer: Optional[TimerEntry] = None
 
     def _has_reached_limit(self):
         current_time = datetime.now(TIMEZONE)
@@ -145,7 +193,10 @@ class SubscriptionHandler(threading.Thread):
             )
             return True
 
-        if self.report_count >= self.config.max_report_nbr:
+        if (
+            self.config.max_report_nbr
+            and self.report_count >= self.config.max_report_nbr
+        ):
             logging.info(
                 f"{red('종료조건')} - max_report_nbr excedeed ({self.config.max_report_nbr})"
             )
@@ -153,162 +204,240 @@ class SubscriptionHandler(threading.Thread):
 
         return False
 
-    def _get_nf_loads(
-        self, create_default_if_empty: bool = False
-    ) -> Dict[str, list[NfLoadLevelInformation]]:
-        """
-        저장된 알림 목록에서 최근 5분 내의 데이터를 필터링하고, nf_instance_id별로 그룹화한다.
-        처리할 데이터가 없는 경우 기본값을 포함하는 통계 정보를 생성합니다.
+    def _get_notification_payload(self) -> Optional[bytes]:
         """
-        with self.lock:
-            # 처리할 알림을 복사합니다.
-            notifications_to_process = self.notifications[:]
-            # 이벤트 기반 알림(PERIODIC이 아닌 경우)은 처리 후 목록을 비워 중복 전송방지
-            if self.config.notif_method != "PERIODIC":
-                self.notifications.clear()
-
-        five_minutes_ago = time.time() - (self.config.MAX_AGE_MINUTES * 60)
-
-        recent_notifications = [
-            item.notification
-            for item in notifications_to_process
-            if item.timestamp >= five_minutes_ago
-        ]
+        최근 5분 내의 데이터로 구독 조건에 맞는 nf_instance_id별 평균 부하를 계산해
+        EventNotification JSON 바이트로 반환한다. 보고할 부하가 없으면 None.
 
-        nf_loads: Dict[str, list[NfLoadLevelInformation]] = {}
-        for nf_load_level_info in recent_notifications:
-            nf_instance_id = nf_load_level_info.nf_instance_id
-            if not nf_instance_id:
-                continue
-            if nf_instance_id not in nf_loads:
-                nf_loads[nf_instance_id] = []
-            nf_loads[nf_instance_id].append(nf_load_level_info)
+        같은 조건의 구독은 LoadStore 가 캐시한 같은 바이트를 받는다.
+        """
+        # 이벤트 기반 알림(PERIODIC이 아닌 경우)은 마지막 보고 이후의 샘플만 사용해 중복 전송방지
+        if self.config.notif_method != "PERIODIC":
+            return self.load_view.take_new_payload()
+        return self.load_view.window_payload()
 
-        return nf_loads
+    def _send_callback_to_nf(self, payload: bytes):
+        """
+        통계정보 콜백처리
 
-    def _send_callback_to_nf(
-        self, nf_load_level_infos_by_nf: Dict[str, list[NfLoadLevelInformation]]
-    ):
-        """통계정보 콜백처리"""
+        전송은 NotificationDispatcher 가 비동기로 처리하므로, 느린 consumer 가
+        보고 주기를 지연시키지 않는다.
+        """
 
         if not self.config.notification_uri:
             logger.info("notification_uri missed")
             return
 
-        nf_load_level_infos = calculate_average_loads(nf_load_level_infos_by_nf)
-
-        if not nf_load_level_infos:
-            return
-
-        event_notification = EventNotification()
-        event_notification.nf_load_level_infos = nf_load_level_infos
-
-        try:
-            # 클라이언트 콜백 URL로 알림 전송
-            status_code = asyncio.run_coroutine_threadsafe(
-                send_notification(
-                    notification_id=self.subscription_id,
-                    uri=self.config.notification_uri,
-                    payload=event_notification.model_dump(),
-                ),
-                self.loop,
-            ).result()
-            if 200 <= status_code < 300:
-                logger.debug(f"Notification sent successfully: {self.subscription_id}")
-            else:
-                logger.warning(
-                    f"Notification sending failed: {self.subscription_id},"
-                    f"Status code={status_code}"
-                )
-        except asyncio.TimeoutError:
-            logger.error(f"Notification timeout: {self.subscription_id}")
-        except ConnectionError:
-            logger.error(f"Connection failed: {self.subscription_id}")
-        except Exception as e:
-            logger.error(f"Unexpected error: {self.subscription_id} {e}", exc_info=True)
-
-    def _check_value_change(self, nf_load_info) -> bool:
-        return True
+        self.dispatcher.submit(
+            notification_id=self.subscription_id,
+            uri=self.config.notification_uri,
+            payload=payload,
+            notif_corr_id=self.config.notif_corr_id,
+        )
 
-    def _check_threshold_exceeded(self, nf_load_info) -> bool:
-        return True
+    def _check_value_change(self, load: LoadSample) -> bool:
+        """
+        샘플의 지표 중 하나라도 같은 시계열(인스턴스와 S-NSSAI)에 마지막으로
+        보고한 값보다 change_delta 를 넘게 바뀌었는지 확인한다. 처음 보는
+        시계열이거나 전에 없던 지표가 생기면 바뀐 것으로 본다.
+        """
+        last = self._last_reported.get(load.meta)
+        if last is None:
+            return True
+        delta = self.config.change_delta
+        for value, last_value in zip(load.values, last):
+            if value is None:
+                continue
+            if last_value is None or abs(value - last_value) > delta:
+                return True
+        return False
 
-    def _process_queued_notifications(
-        self, create_default_if_empty: bool = False
-    ) -> bool:
+    async def _process_queued_notifications(self) -> bool:
         """
         notification_queue에서 모든 알림을 가져와 처리하고 전송한다.
         알림이 성공적으로 전송되었으면 True를 반환한다.
         """
-        nf_loads = self._get_nf_loads(create_default_if_empty=create_default_if_empty)
-        if not nf_loads:
+        payload = self._get_notification_payload()
+        if payload is None:
             return False
 
-        self._send_callback_to_nf(nf_loads)
+        self._send_callback_to_nf(payload)
         self._increase_report_count()
         return True
 
-    def _process_on_event_detection(self):
+    async def _process_on_event_detection(self):
         """ON_EVENT_DETECTION: 이벤트 감지 즉시 처리"""
-        if self._process_queued_notifications(create_default_if_empty=False):
+        if await self._process_queued_notifications():
             logger.info(
                 f"[{self.subscription_id}] 🚨 ON_EVENT_DETECTION Notify ---> NF"
             )
 
-    def _process_on_change(self):
-        pass
+    def _send_loads(self, loads) -> None:
+        """샘플들을 그 값 그대로 하나의 알림으로 보낸다."""
+        payload = dump_event_notification_json(
+            [build_load_info(load.meta, load.nf_status, load.values) for load in loads]
+        )
+        self._send_callback_to_nf(payload)
+        self._increase_report_count()
+
+    async def _process_on_change(self):
+        """ON_CHANGE: 마지막 보고 이후 값이 바뀐 시계열의 샘플만 보고"""
+        changed, self._changed_loads = self._changed_loads, {}
+        if not changed:
+            return
+
+        self._send_loads(changed.values())
+        for meta, load in changed.items():
+            self._last_reported[meta] = load.values
+        logger.info(
+            f"[{self.subscription_id}] {cyan('ON_CHANGE Notify')} ---> NF "
+            f"({len(changed)} series)"
+        )
+
+    async def _process_on_threshold(self):
+        """ON_THRESHOLD: 임계값을 넘은 시계열의 샘플만 보고"""
+        crossed, self._crossed_loads = self._crossed_loads, {}
+        if not crossed:
+            return
 
-    def _process_on_threshold(self):
-        pass
+        self._send_loads(crossed.values())
+        logger.info(f"[{self.subscription_id}] {yellow('ON_THRESHOLD Notify')} ---> NF")
 
     def _increase_report_count(self):
         self.report_count += 1
 
-    def run(self):
-        logger.info(f"Start handler: {self.subscription_id}")
-        last_report_time = time.time()
+    def _expiry_time(self) -> Optional[float]:
+        """end_ts 와 mon_dur 중 먼저 도래하는 시각(epoch 초)"""
+        limits = [
+            limit.timestamp()
+            for limit in (self.config.end_ts, self.config.mon_dur)
+            if limit is not None
+        ]
+        return min(limits) if limits else None
+
+    def start(self):
+        """
+        핸들러의 타이머를 스케줄러에 등록한다.
+
+        만료 타이머는 end_ts/mon_dur 에, 활성화 타이머는 start_ts 에 등록되며
+        start_ts 가 없거나 이미 지났으면 바로 보고 타이머를 시작한다.
+        """
+        logger.debug(f"Start handler: {self.subscription_id}")
+        now = time.time()
+
+        expiry_time = self._expiry_time()
+        if expiry_time is not None:
+            self._expiry_timer = self.scheduler.call_at(expiry_time, self._expire)
+
+        if self.config.start_ts and now < self.config.start_ts.timestamp():
+            logger.debug(
+                f"[{self.subscription_id}] Waiting for start_ts: {self.config.start_ts}"
+            )
+            self._activation_timer = self.scheduler.call_at(
+                self.config.start_ts.timestamp(), self._activate
+            )
+        else:
+            self._activate()
+
+    def _activate(self):
+        """start_ts 에 도달하면 보고 주기를 시작한다."""
+        self._activation_timer = None
+        if not self.running:
+            return
+        self.active = True
+        self.last_report_time = time.time()
+        self._arm_report_timer()
+
+    def _arm_report_timer(self):
+        """
+        다음 보고를 예약한다.
+
+        PERIODIC 은 다음 보고 시각에 타이머를 걸고, 이벤트 기반 알림은
+        처리할 알림이 남아 있을 때만 보고를 요청한다.
+        """
+        if self.config.notif_method == "PERIODIC":
+            self._report_timer = self.scheduler.call_at(
+                self.last_report_time + self.config.rep_period, self._on_report_due
+            )
+        elif self._has_new_events:
+            self._request_report()
+
+    def _request_report(self):
+        """
+        이벤트 기반 보고를 요청한다.
+
+        coalesce_window 가 0 이면 바로 보고하고, 아니면 첫 이벤트로부터
+        coalesce_window 뒤에 그 사이 도착한 알림을 모아서 한 번에 보고한다.
+        이미 보고가 예약되었거나 진행 중이면 아무것도 하지 않는다.
+        """
+        if not self.running or not self.active or self._report_requested:
+            return
+
+        self._report_requested = True
+        if self.config.coalesce_window > 0:
+            self._report_timer = self.scheduler.call_later(
+                self.config.coalesce_window, self._on_report_due
+            )
+        else:
+            self.scheduler.spawn(self._report)
+
+    def _on_report_due(self):
+        self._report_timer = None
+        if self.running:
+            self.scheduler.spawn(self._report)
+
+    async def _report(self):
+        """보고 타이머가 만료되면 notif_method 에 따라 한 번의 보고를 수행한다."""
+        if not self.running:
+            return
+
         notif_method = self.config.notif_method
+        has_new_events = self._has_new_events
+        self._has_new_events = False
+        try:
+            # notif_method에 따른 처리
+            if notif_method == "PERIODIC":
+                self.last_report_time = time.time()
+                if await self._process_queued_notifications():
+                    logger.info(
+                        f"[{self.subscription_id}] {green('PERIODIC Notify')} ---> NF"
+                    )
+            # 이벤트 기반 처리 (ON_EVENT_DETECTION, ON_CHANGE 등)
+            elif has_new_events:  # 새 알림이 있을 때만 처리
+                if notif_method == "ON_EVENT_DETECTION":
+                    await self._process_on_event_detection()
+                elif notif_method == "ON_CHANGE":
+                    await self._process_on_change()
+                elif notif_method == "ON_THRESHOLD":
+                    await self._process_on_threshold()
 
-        while self.running:
-            # 구독 만료 또는 핸들러 중지 조건 확인
-            if self._has_reached_limit():
-                self.running = False
-                break
-
-            current_time = datetime.now(TIMEZONE)
-            if self.config.start_ts and current_time < self.config.start_ts:
-                logger.debug(
-                    f"[{self.subscription_id}] Waiting for start_ts: {self.config.start_ts}"
-                )
-                time.sleep(1)
-                continue
+        except Exception as e:
+            logger.error(f"Error during notification processing: {str(e)}")
+
+        self._report_requested = False
+        if not self.running:
+            return
+        if self._has_reached_limit():
+            self._expire()
+            return
 
-            try:
-                # notif_method에 따른 처리
-                if notif_method == "PERIODIC":
-                    if time.time() - last_report_time >= self.config.rep_period:
-                        if self._process_queued_notifications():
-                            logger.info(
-                                f"[{self.subscription_id}] {green('PERIODIC Notify')} ---> NF"
-                            )
-                        last_report_time = time.time()
-                # 이벤트 기반 처리 (ON_EVENT_DETECTION, ON_CHANGE 등)
-                elif self.notifications:  # 리스트가 비어있지 않을 때만 처리
-                    if notif_method == "ON_EVENT_DETECTION":
-                        self._process_on_event_detection()
-                    elif notif_method == "ON_CHANGE":
-                        self._process_on_change()
-                    elif notif_method == "ON_THRESHOLD":
-                        self._process_on_threshold()
-
-                # CPU 사용을 줄이기 위해 짧은 대기 시간 추가
-                time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Error during notification processing: {str(e)}")
-                time.sleep(1.0)  # 오류 발생 시 잠시 대기
-
-        # 핸들러 종료 및 리소스 정리
+        self._arm_report_timer()
+
+    def _cancel_timers(self):
+        for timer in (self._activation_timer, self._report_timer, self._expiry_timer):
+            if timer is not None:
+                timer.cancel()
+        self._activation_timer = None
+        self._report_timer = None
+        self._expiry_timer = None
+
+    def _expire(self):
+        """종료 조건에 도달한 구독을 정리한다."""
+        self._expiry_timer = None
+        if not self.running:
+            return
+        self.running = False
+        self._cancel_timers()
         logger.debug(
             f"[Subscription Expired]: {self.subscription_id} "
             f"Elapsed Time: {(time.time() - self.start_time):.2f} seconds, "
@@ -316,27 +445,57 @@ class SubscriptionHandler(threading.Thread):
         )
         self.subscription_manager.remove_subscription(self.subscription_id)
 
-    def add_load_info(self, notification: NfLoadLevelInformation):
-        if not self.running:
+    def on_load_ingested(self, load: LoadSample):
+        """
+        공유 LoadStore 에 새 부하 정보가 저장되었음을 알린다.
+
+        구독 조건에 맞는 이벤트 기반 알림이면 즉시 보고를 요청하므로, 다음
+        폴링 주기를 기다리지 않고 알림이 전송된다. ON_CHANGE 는 마지막으로
+        보고한 값에서 바뀐 샘플만 보고를 요청한다. 이벤트 루프 스레드에서
+        호출해야 한다.
+        """
+        if not self.running or not self.load_view.matches(load):
             return
 
-        with self.lock:
-            # Wrapper 클래스를 사용하여 타임스탬프와 함께 저장
-            timed_notification = TimedNotification(
-                timestamp=time.time(), notification=notification
-            )
-            self.notifications.append(timed_notification)
+        notif_method = self.config.notif_method
+        if notif_method == "ON_CHANGE":
+            if not self._check_value_change(load):
+                # 보고 전에 값이 되돌아왔으면 보낼 필요가 없다.
+                self._changed_loads.pop(load.meta, None)
+                return
+            self._changed_loads[load.meta] = load
+        # ON_THRESHOLD 는 임계값을 넘었을 때만 보고한다 (on_threshold_crossed).
+        elif notif_method in ("PERIODIC", "ON_THRESHOLD"):
+            return
 
-            # 리스트 크기를 100개로 유지
-            if len(self.notifications) > self.config.MAX_NOTIFICATIONS:
-                self.notifications.pop(0)
+        self._has_new_events = True
+        self._request_report()
 
-            logger.debug(
-                f"Add loads: {self.subscription_id}"
-                f"List size: {len(self.notifications)}",
+    def on_threshold_crossed(
+        self, load: LoadSample, crossings: list[ThresholdCrossing]
+    ):
+        """
+        샘플이 구독의 임계값을 넘었음을 알린다 (ThresholdIndex 가 찾은 경우).
+
+        구독 조건에 맞으면 시계열의 샘플을 보관하고 즉시 보고를 요청한다.
+        이벤트 루프 스레드에서 호출해야 한다.
+        """
+        if not self.running or not self.load_view.matches(load):
+            return
+
+        logger.debug(
+            f"[{self.subscription_id}] Threshold crossed - "
+            f"nf_instance_id: '{load.nf_instance_id}', "
+            + ", ".join(
+                f"{c.metric} {'>=' if c.rising else '<'} {c.level:g}" for c in crossings
             )
+        )
+        self._crossed_loads[load.meta] = load
+        self._has_new_events = True
+        self._request_report()
 
     def stop(self):
         """핸들러 중지"""
         self.running = False
+        self._cancel_timers()
         logger.info(f"{red('Handler stopped')}: {self.subscription_id}")
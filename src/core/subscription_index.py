@@ -0,0 +1,216 @@
+from itertools import chain
+from typing import Hashable, Optional
+
+from .load_sample import LoadMeta
+from .load_store import LoadFilter
+
+# (LoadFilter 조건 이름, LoadMeta 필드 이름)
+DIMENSIONS = (
+    ("nf_types", "nf_type"),
+    ("nf_instance_ids", "nf_instance_id"),
+    ("nf_set_ids", "nf_set_id"),
+    ("snssais", "snssai"),
+)
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+class SubscriptionIndex:
+    """
+    LoadFilter 조건별 구독 역색인
+
+    조건 값(nf_type, nf_instance_id, nf_set_id, snssai 키)마다 그 값을 허용하는
+    구독 ID 집합을, 조건이 없는(None) 구독은 조건별 와일드카드 집합에 둔다.
+    한 조건에서 샘플을 허용하는 구독은 (와일드카드 집합, 값의 집합) 두 목록의
+    합이다. 샘플 하나에 맞는 구독은 이 목록들을 후보가 적은 조건부터
+    교집합해 찾으므로, 비용은 가장 작은 조건의 후보 수에 비례한다.
+
+    결과는 LoadMeta 별로 캐시된다. LoadColumnStore 와 같이 인스턴스의
+    샘플들은 같은 LoadMeta 를 공유하므로, 반복되는 샘플의 fan-out 은 딕셔너리
+    조회 한 번이다. 구독이 추가/제거되면 그 구독의 조건이 허용하는 캐시
+    항목만 지우며, 이를 찾기 위해 캐시된 LoadMeta 를 필드 값별로 색인한다.
+    캐시 항목을 지울 때는 이 역색인에서도 함께 지운다.
+
+    add()/remove() 는 호출자가 직렬화해야 한다. match()/accepting() 은 락 없이
+    호출할 수 있다. 변경마다 버전을 올리고, 변경 도중에 계산된 결과는 캐시에
+    넣은 뒤 버전이 바뀌었으면 다시 지운다.
+
+    Args:
+        max_cached_metas: 캐시할 최대 LoadMeta 수
+    """
+
+    def __init__(self, max_cached_metas: int = 10000):
+        self.max_cached_metas = max_cached_metas
+        self._filters: dict[str, LoadFilter] = {}
+        self._by_value: dict[str, dict[Hashable, set[str]]] = {
+            condition: {} for condition, _ in DIMENSIONS
+        }
+        self._any: dict[str, set[str]] = {
+            condition: set() for condition, _ in DIMENSIONS
+        }
+        self._matches: dict[LoadMeta, tuple[str, ...]] = {}
+        # LoadMeta 필드 -> 값 -> 그 값을 가진 캐시된 LoadMeta
+        self._cached_by_value: dict[str, dict[Hashable, set[LoadMeta]]] = {
+            field: {} for _, field in DIMENSIONS
+        }
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def __contains__(self, subscription_id: str) -> bool:
+        return subscription_id in self._filters
+
+    def add(self, subscription_id: str, load_filter: LoadFilter) -> None:
+        """구독을 색인에 추가한다. 이미 있으면 조건을 교체한다."""
+        self.remove(subscription_id)
+        self._filters[subscription_id] = load_filter
+        for condition, _ in DIMENSIONS:
+            values = getattr(load_filter, condition)
+            if values is None:
+                self._any[condition].add(subscription_id)
+                continue
+            by_value = self._by_value[condition]
+            for value in values:
+                by_value.setdefault(value, set()).add(subscription_id)
+        self._invalidate(load_filter)
+
+    def remove(self, subscription_id: str) -> bool:
+        """
+        구독을 색인에서 제거한다.
+
+        Returns:
+            색인에 있었으면 True
+        """
+        load_filter = self._filters.pop(subscription_id, None)
+        if load_filter is None:
+            return False
+        for condition, _ in DIMENSIONS:
+            values = getattr(load_filter, condition)
+            if values is None:
+                self._any[condition].discard(subscription_id)
+                continue
+            by_value = self._by_value[condition]
+            for value in values:
+                ids = by_value[value]
+                ids.discard(subscription_id)
+                if not ids:
+                    del by_value[value]
+        self._invalidate(load_filter)
+        return True
+
+    def _clear_cache(self) -> None:
+        self._matches = {}
+        self._cached_by_value = {field: {} for _, field in DIMENSIONS}
+
+    def _evict(self, meta: LoadMeta) -> None:
+        """meta 의 캐시 결과와 역색인 항목을 지운다."""
+        if self._matches.pop(meta, None) is None:
+            return
+        cached_by_value = self._cached_by_value
+        for _, field in DIMENSIONS:
+            by_value = cached_by_value[field]
+            value = getattr(meta, field)
+            metas = by_value.get(value)
+            if metas is None:
+                continue
+            metas.discard(meta)
+            if not metas:
+                del by_value[value]
+
+    def _invalidate(self, load_filter: LoadFilter) -> None:
+        """load_filter 가 허용하는 캐시된 LoadMeta 의 결과를 지운다."""
+        self._version += 1
+        # 조건 중 캐시된 후보가 가장 적은 조건의 후보만 확인한다.
+        candidates = None
+        size = 0
+        for condition, field in DIMENSIONS:
+            values = getattr(load_filter, condition)
+            if values is None:
+                continue
+            if condition == "snssais":
+                # snssai 가 없는 샘플은 snssai 조건을 통과한다.
+                values = chain(values, (None,))
+            by_value = self._cached_by_value[field]
+            metas = [by_value[value] for value in values if value in by_value]
+            metas_size = sum(map(len, metas))
+            if candidates is None or metas_size < size:
+                candidates, size = metas, metas_size
+        if candidates is None:
+            # 조건이 없는 구독은 모든 샘플을 허용한다.
+            self._clear_cache()
+            return
+        for metas in candidates:
+            for meta in tuple(metas):
+                if load_filter.matches(meta):
+                    self._evict(meta)
+
+    def accepting(self, condition: str, value: Optional[Hashable]) -> set[str]:
+        """
+        한 조건에서 value 를 허용하는 구독 ID 집합을 새로 만들어 반환한다.
+        match() 는 이 집합을 만들지 않는다.
+
+        Args:
+            condition: "nf_types", "nf_instance_ids", "nf_set_ids", "snssais" 중 하나
+            value: 조건 값. snssai 는 snssai_key() 튜플이다.
+        """
+        if condition == "snssais" and value is None:
+            # snssai 가 없는 샘플은 모든 구독의 snssai 조건을 통과한다.
+            return set(self._filters)
+        return self._any[condition] | self._by_value[condition].get(value, _EMPTY)
+
+    def match(self, meta: LoadMeta) -> tuple[str, ...]:
+        """LoadFilter 가 meta 를 허용하는 구독 ID 목록"""
+        matched = self._matches.get(meta)
+        if matched is not None:
+            return matched
+
+        version = self._version
+        matched = self._find(meta)
+
+        cache = self._matches
+        if len(cache) >= self.max_cached_metas:
+            self._clear_cache()
+            cache = self._matches
+        cache[meta] = matched
+        cached_by_value = self._cached_by_value
+        for _, field in DIMENSIONS:
+            cached_by_value[field].setdefault(getattr(meta, field), set()).add(meta)
+        if self._version != version:
+            # 계산하는 동안 색인이 바뀌었으면 결과를 남기지 않는다.
+            self._evict(meta)
+        return matched
+
+    def _find(self, meta: LoadMeta) -> tuple[str, ...]:
+        postings = []
+        for condition, field in DIMENSIONS:
+            value = getattr(meta, field)
+            if condition == "snssais" and value is None:
+                # snssai 가 없는 샘플은 모든 구독의 snssai 조건을 통과한다.
+                continue
+            wildcard = self._any[condition]
+            ids = self._by_value[condition].get(value, _EMPTY)
+            postings.append((len(wildcard) + len(ids), wildcard, ids))
+        postings.sort(key=lambda posting: posting[0])
+
+        # 허용하는 구독 = 조건마다 (와일드카드 ∪ 값의 집합) 의 교집합.
+        # set & set 은 작은 쪽만 순회하므로 후보가 가장 적은 조건부터
+        # 교집합을 구하면, 큰 목록(와일드카드 등)은 복사하거나 순회하지 않는다.
+        _, first_wildcard, first_ids = postings[0]
+        _, wildcard, ids = postings[1]
+        matched = (
+            (first_wildcard & wildcard)
+            | (first_wildcard & ids)
+            | (first_ids & wildcard)
+            | (first_ids & ids)
+        )
+        for _, wildcard, ids in postings[2:]:
+            if not matched:
+                break
+            matched = (matched & wildcard) | (matched & ids)
+
+        filters = self._filters
+        # 락 없이 읽는 동안 제거된 구독은 건너뛴다.
+        return tuple(
+            subscription_id for subscription_id in matched if subscription_id in filters
+        )
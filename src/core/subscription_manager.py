@@ -1,11 +1,35 @@
+import asyncio
+import bisect
 import logging
 import threading
-from typing import Optional
-
+import time
+from typing import Iterator, Optional
+
+from config.app_config import (
+    DashboardConfig,
+    NotificationDispatchConfig,
+    ReportingConfig,
+)
 from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
 
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+
 from .ifc import SubscriberManagerIfc
+from .live_feed import LiveFeed
+from .load_sample import LoadSample
+from .load_store import LoadFilter, LoadStore, LoadView
+from .nf_client import unsubscribe_from_nf
+from .notification_dispatcher import NotificationDispatcher
+from .scheduler import HandlerScheduler
 from .subscription_handler import HandlerConfig, SubscriptionHandler
+from .subscription_index import SubscriptionIndex
+from .threshold_index import ThresholdIndex
+from .subscription_store import (
+    StoredSubscription,
+    SubscriptionChanges,
+    SubscriptionStore,
+)
+from .upstream_registry import UpstreamKey, UpstreamRegistry, UpstreamSubscription
 
 logger = logging.getLogger(__name__)
 
@@ -18,17 +42,67 @@ class SubscriptionManager(SubscriberManagerIfc):
 
     이벤트 구독을 관리하고 각 구독에 대한 핸들러를 생성, 시작, 중지하는 역할을 담당한다.
     스레드 안전성을 보장하며, 여러 구독을 동시에 관리할 수 있다.
+    구독 생성/삭제는 lock 으로 직렬화되지만, 핸들러 생성과 시작은 락 밖에서
+    하고 등록만 락 안에서 한다. 조회(get_handler, ingest_batch 등)는 한 키씩
+    원자적으로 바뀌는 딕셔너리와 SubscriptionIndex 를 락 없이 읽는다.
+    모든 핸들러는 하나의 HandlerScheduler 에 의해 이벤트 루프에서 구동된다.
+    NF 로부터 받은 부하 정보는 하나의 LoadStore 에 한 번만 저장되고,
+    SubscriptionIndex 로 찾은 조건이 맞는 구독의 핸들러에만 전달된다.
+    ON_THRESHOLD 구독에는 ThresholdIndex 가 찾은 임계값을 넘은 샘플만
+    전달된다. NF 구독은 UpstreamRegistry 로 구독 간에 공유되며, 마지막
+    구독이 제거되면 NF 에 해지를 요청한다.
+
+    SubscriptionStore 가 연결되면 구독 생성/삭제와 보고 횟수를 모아 두었다가
+    주기적으로 한 번에 저장하고(write-behind), 재시작 시 restore() 로 구독과
+    핸들러 타이머를 복원한다.
 
     Attributes:
         subscriptions (Dict[str, NncofEventsSubscription]): 구독 ID를 키로 하는 구독 정보 딕셔너리
         handlers (Dict[str, SubscriptionHandler]): 구독 ID를 키로 하는 핸들러 딕셔너리
-        lock (threading.Lock): 스레드 안전성을 위한 락 객체
+        lock (threading.Lock): 구독 생성/삭제와 저장 상태를 직렬화하는 락 객체
+        scheduler (HandlerScheduler): 핸들러 처리 시각을 관리하는 스케줄러
+        load_store (LoadStore): 모든 구독이 공유하는 NF 인스턴스별 부하 정보 저장소
+        upstreams (UpstreamRegistry): 구독들이 공유하는 NF 구독 레지스트리
+        dispatcher (NotificationDispatcher): 핸들러들이 공유하는 알림 송신 큐
+        live_feed (LiveFeed): 대시보드로 보내는 구독/부하 정보 변경 스트림
+        index (SubscriptionIndex): nf_type, nf_instance_id, nf_set_id, snssai 별 구독 역색인
+        thresholds (ThresholdIndex): ON_THRESHOLD 구독의 지표별 임계값 색인
+        store (Optional[SubscriptionStore]): 구독 저장소 (없으면 저장하지 않음)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        dispatch_config: Optional[NotificationDispatchConfig] = None,
+        dashboard_config: Optional[DashboardConfig] = None,
+        reporting_config: Optional[ReportingConfig] = None,
+    ):
+        reporting_config = reporting_config or ReportingConfig()
         self.subscriptions = {}
         self.handlers = {}
         self.lock = threading.Lock()
+        self.scheduler = HandlerScheduler()
+        self.load_store = LoadStore(
+            capacity_per_instance=HandlerConfig.MAX_NOTIFICATIONS,
+            max_age=HandlerConfig.MAX_AGE_MINUTES * 60,
+        )
+        self.upstreams = UpstreamRegistry()
+        self.dispatcher = NotificationDispatcher(dispatch_config)
+        self.live_feed = LiveFeed(self.load_store, dashboard_config)
+        self.index = SubscriptionIndex()
+        self.thresholds = ThresholdIndex(reporting_config.threshold_hysteresis)
+        self._change_delta = reporting_config.change_delta
+        # 생성 순서대로의 (순번, 구독 ID). 삭제/교체된 항목은 _seqs 와 순번이
+        # 달라지며, 절반 이상이 되면 정리한다.
+        self._order: list[tuple[int, str]] = []
+        self._seqs: dict[str, int] = {}
+        self._next_seq = 0
+        self.store: Optional[SubscriptionStore] = None
+        # 저장되지 않은 생성/삭제가 있는 구독 ID (저장소가 있을 때만 기록)
+        self._dirty: set[str] = set()
+        self._created_at: dict[str, float] = {}
+        self._persisted_counts: dict[str, int] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_stop: Optional[asyncio.Event] = None
 
     def add_subscription(
         self, subscription_id: str, subscription: NncofEventsSubscription
@@ -59,49 +133,97 @@ class SubscriptionManager(SubscriberManagerIfc):
             f"{green('Create subscription')} - subscription_id: '{subscription_id}'"
         )
 
-        with self.lock:
-            # 기존 구독이 있는 경우 핸들러를 중지하고 제거
-            if subscription_id in self.subscriptions:
-                logger.warning(
-                    f"Subscription already exists - subscription_id: '{subscription_id}'"
-                )
-                existing_handler = self.handlers.pop(subscription_id, None)
-                if existing_handler:
-                    existing_handler.stop()
-            try:
-                config = HandlerConfig.from_ncof_events_subscription(subscription)
-            except Exception as e:
-                logger.error(
-                    f"Failed to create HandlerConfig - subscription_id: '{subscription_id}': {e}"
-                )
-                raise ValueError(f"Invalid subscription configuration: {e}") from e
+        existing_handler = self._start_handler(
+            subscription_id, subscription, created_at=time.time()
+        )
+        # 기존 구독이 있었던 경우 교체된 핸들러를 중지
+        if existing_handler is not None:
+            logger.warning(
+                f"Subscription already exists - subscription_id: '{subscription_id}'"
+            )
+            existing_handler.stop()
+        if self.store is not None:
+            with self.lock:
+                self._dirty.add(subscription_id)
+        return subscription_id
+
+    def _start_handler(
+        self,
+        subscription_id: str,
+        subscription: NncofEventsSubscription,
+        report_count: int = 0,
+        created_at: float = 0.0,
+        log_level: int = logging.INFO,
+    ) -> Optional[SubscriptionHandler]:
+        """
+        구독의 핸들러를 만들어 시작한 뒤 등록한다.
+
+        핸들러 생성과 시작은 락 밖에서 하므로, 많은 구독이 한꺼번에 생성되어도
+        부하 정보 전달이 막히지 않는다.
 
-            # 구독 정보로부터 핸들러 설정 생성
-            subscription_handler = SubscriptionHandler(
-                subscription_id=subscription_id,
-                handler_manager=self,
-                config=config,
+        Returns:
+            같은 ID 로 등록되어 있던 핸들러 (호출자가 중지한다), 없으면 None
+        """
+        try:
+            config = HandlerConfig.from_ncof_events_subscription(
+                subscription, change_delta=self._change_delta
             )
+        except Exception as e:
+            logger.error(
+                "Failed to create HandlerConfig - "
+                f"subscription_id: '{subscription_id}': {e}"
+            )
+            raise ValueError(f"Invalid subscription configuration: {e}") from e
 
-            # 구독 정보와 핸들러를 저장
-            self.subscriptions[subscription_id] = subscription
-            self.handlers[subscription_id] = subscription_handler
+        load_filter = LoadFilter.from_event_subscription(
+            subscription.event_subscriptions[0]
+        )
 
-            try:
-                subscription_handler.start()  # 핸들러 시작
-                logger.info(
-                    f"{green('SubscriptionHandler started')} - subscription_id: '{subscription_id}'"
-                )
-            except Exception as e:
-                # 핸들러 시작 실패 시 롤백 및 로깅
-                self.subscriptions.pop(subscription_id)
-                self.handlers.pop(subscription_id)
-                logger.error(
-                    f"Failed to start SubscriptionHandler - subscription_id: '{subscription_id}': {e}"
-                )
-                raise RuntimeError(f"Could not start subscription handler: {e}") from e
+        # 구독 정보로부터 핸들러 설정 생성
+        subscription_handler = SubscriptionHandler(
+            subscription_id=subscription_id,
+            handler_manager=self,
+            config=config,
+            scheduler=self.scheduler,
+            load_view=LoadView(self.load_store, load_filter),
+            dispatcher=self.dispatcher,
+        )
+        subscription_handler.report_count = report_count
+
+        try:
+            subscription_handler.start()  # 핸들러 시작
+        except Exception as e:
+            # 핸들러 시작 실패 시 타이머 정리 및 로깅
+            subscription_handler.stop()
+            logger.error(
+                "Failed to start SubscriptionHandler - "
+                f"subscription_id: '{subscription_id}': {e}"
+            )
+            raise RuntimeError(f"Could not start subscription handler: {e}") from e
 
-            return subscription_id
+        # 구독 정보와 핸들러를 등록
+        with self.lock:
+            existing_handler = self.handlers.get(subscription_id)
+            self.subscriptions[subscription_id] = subscription
+            self.handlers[subscription_id] = subscription_handler
+            self.index.add(subscription_id, load_filter)
+            if config.notif_method == "ON_THRESHOLD":
+                self.thresholds.add(subscription_id, list(config.thresholds))
+            else:
+                self.thresholds.remove(subscription_id)
+            self._created_at[subscription_id] = created_at
+            self._append_order(subscription_id)
+        self.live_feed.subscription_changed(subscription_id, subscription)
+        if config.notif_method == "ON_THRESHOLD":
+            # 이미 넘은 임계값은 다음 넘음을 기다리지 않고 바로 보고한다.
+            for sample, crossings in self.thresholds.initial_crossings(subscription_id):
+                subscription_handler.on_threshold_crossed(sample, crossings)
+        logger.log(
+            log_level,
+            f"{green('SubscriptionHandler started')} - "
+            f"subscription_id: '{subscription_id}'",
+        )
+        return existing_handler
 
     def remove_subscription(self, subscription_id: str) -> bool:
         """
@@ -127,17 +249,27 @@ class SubscriptionManager(SubscriberManagerIfc):
         )
 
         with self.lock:
-            subscription_existed = False
-
-            if subscription_id in self.subscriptions:
-                self.subscriptions.pop(subscription_id)
-                subscription_existed = True
-            if subscription_id in self.handlers:
-                handler = self.handlers.pop(subscription_id)
-                handler.stop()
-                subscription_existed = True
-
-            return subscription_existed
+            subscription = self.subscriptions.pop(subscription_id, None)
+            handler = self.handlers.pop(subscription_id, None)
+            self.index.remove(subscription_id)
+            self.thresholds.remove(subscription_id)
+            subscription_existed = subscription is not None or handler is not None
+            if subscription_existed:
+                self._created_at.pop(subscription_id, None)
+                self._seqs.pop(subscription_id, None)
+                self._compact_order()
+                if self.store is not None:
+                    self._dirty.add(subscription_id)
+
+        if handler is not None:
+            handler.stop()
+        if subscription_existed:
+            self.live_feed.subscription_changed(subscription_id, None)
+
+        for upstream in self.upstreams.release(subscription_id):
+            self._schedule_unsubscribe(upstream)
+
+        return subscription_existed
 
     def get_subscriptions(self):
         """
@@ -155,13 +287,320 @@ class SubscriptionManager(SubscriberManagerIfc):
             >>> for sub_id, subscription in subscriptions.items():
             ...     print(f"구독 ID: {sub_id}")
         """
-        with self.lock:
-            return self.subscriptions.copy()
+        return self.subscriptions.copy()
+
+    def iter_subscriptions(
+        self, after: Optional[int] = None
+    ) -> Iterator[tuple[int, str, NncofEventsSubscription]]:
+        """
+        구독을 생성 순서대로 (순번, 구독 ID, 구독) 으로 반환한다.
+
+        전체 딕셔너리를 복사하지 않고 락 없이 순회하므로, 많은 구독을 나누어
+        조회할 때 사용한다. 순번은 구독마다 증가하며 재시작하면 초기화된다.
+
+        Args:
+            after: 이 순번 다음에 생성된 구독부터 반환한다 (커서).
+        """
+        order = self._order
+        start = 0
+        if after is not None:
+            start = bisect.bisect_right(order, after, key=lambda entry: entry[0])
+        for index in range(start, len(order)):
+            seq, subscription_id = order[index]
+            if self._seqs.get(subscription_id) != seq:
+                continue  # 삭제되었거나 교체된 구독
+            subscription = self.subscriptions.get(subscription_id)
+            if subscription is not None:
+                yield seq, subscription_id, subscription
+
+    def _append_order(self, subscription_id: str) -> None:
+        """self.lock 을 잡은 상태에서 호출한다."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seqs[subscription_id] = seq
+        self._order.append((seq, subscription_id))
+        self._compact_order()
+
+    def _compact_order(self) -> None:
+        """self.lock 을 잡은 상태에서 호출한다."""
+        if len(self._order) > 2 * len(self._seqs) + 64:
+            # 순회 중인 목록은 그대로 두고 새 목록으로 바꾼다.
+            self._order = [
+                (seq, subscription_id)
+                for seq, subscription_id in self._order
+                if self._seqs.get(subscription_id) == seq
+            ]
 
     def get_handler(self, subscription_id: str) -> Optional["SubscriptionHandler"]:
         """
         주어진 구독 ID로 핸들러를 찾아서 반환한다.
 
+        락을 잡지 않으므로 구독 생성/삭제 중에도 기다리지 않는다.
+        """
+        return self.handlers.get(subscription_id)
+
+    def match_subscriptions(self, load: LoadSample) -> list[str]:
+        """
+        부하 정보 샘플의 조건에 맞는 구독 ID 목록을 반환한다.
+
+        전체 구독을 순회하지 않고 SubscriptionIndex 로 찾는다.
+        """
+        return list(self.index.match(load.meta))
+
+    def ingest_loads(
+        self,
+        subscription_id: str,
+        loads: list[LoadSample | NfLoadLevelInformation],
+    ) -> bool:
+        """
+        구독 ID로 수신한 부하 정보를 공유 저장소에 저장하고 핸들러들에 알린다.
+
+        부하 정보는 구독 수와 관계없이 한 번만 저장되며, 조건이 맞는 모든
+        구독의 핸들러가 이를 함께 사용한다.
+
+        Args:
+            subscription_id (str): 알림을 받은 NF 구독(upstream) 또는 구독의 식별자
+            loads (list[LoadSample | NfLoadLevelInformation]): 수신한 부하 정보 목록
+
+        Returns:
+            bool: 구독이 존재하면 True, 존재하지 않으면 False
+        """
+        return not self.ingest_batch([(subscription_id, loads)])
+
+    def ingest_batch(
+        self, batch: list[tuple[str, list[LoadSample | NfLoadLevelInformation]]]
+    ) -> list[str]:
+        """
+        여러 구독 ID로 수신한 부하 정보를 한 번에 저장하고 핸들러들에 알린다.
+
+        구독 확인은 배치 전체에 대해 한 번만 수행하고, 각 샘플은
+        SubscriptionIndex 로 찾은 조건이 맞는 구독의 핸들러에만 전달된다.
+        구독 레지스트리는 락 없이 읽는다.
+
+        Args:
+            batch: (구독 ID, 부하 정보 목록) 의 목록
+
+        Returns:
+            list[str]: 존재하지 않아 무시된 구독 ID 목록
+        """
+        handlers = self.handlers
+        unknown = [
+            subscription_id
+            for subscription_id, _ in batch
+            if subscription_id not in handlers
+            and self.upstreams.get(subscription_id) is None
+        ]
+
+        skipped = set(unknown)
+        loads = [
+            load
+            for subscription_id, subscription_loads in batch
+            if subscription_id not in skipped
+            for load in subscription_loads
+        ]
+        samples = self.load_store.ingest_many(loads)
+        if not samples:
+            return unknown
+        self.live_feed.loads_ingested(samples)
+
+        match = self.index.match
+        thresholds = self.thresholds
+        for sample in samples:
+            for subscription_id in match(sample.meta):
+                # 락 없이 읽는 동안 제거된 구독은 건너뛴다.
+                handler = handlers.get(subscription_id)
+                if handler is not None:
+                    handler.on_load_ingested(sample)
+            if not thresholds:
+                continue
+            for subscription_id, crossings in thresholds.evaluate(sample).items():
+                handler = handlers.get(subscription_id)
+                if handler is not None:
+                    handler.on_threshold_crossed(sample, crossings)
+        return unknown
+
+    def restore(
+        self, store: SubscriptionStore, flush_interval: float = 1.0
+    ) -> list[tuple[str, NncofEventsSubscription]]:
+        """
+        구독 저장소를 연결하고, 저장된 구독의 핸들러를 다시 시작한다.
+
+        복원된 구독은 저장된 보고 횟수부터 이어서 보고하며, start_ts,
+        end_ts/mon_dur 타이머도 다시 등록된다. 이후 변경 사항은 flush_interval
+        마다 저장된다. 이벤트 루프에서 호출해야 한다.
+
+        Returns:
+            복원된 (구독 ID, 구독) 목록. NF 구독은 호출자가 다시 요청해야 한다.
+        """
+        started = time.perf_counter()
+        self.store = store
+        restored = []
+        persisted_counts = {}
+        failed = []
+        for stored in store.load():
+            subscription_id = stored.subscription_id
+            try:
+                subscription = NncofEventsSubscription.model_validate_json(stored.body)
+                # 구독별 로그 대신 복원 결과를 한 번 남긴다.
+                self._start_handler(
+                    subscription_id,
+                    subscription,
+                    stored.report_count,
+                    created_at=stored.created_at,
+                    log_level=logging.DEBUG,
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to restore subscription - "
+                    f"subscription_id: '{subscription_id}': {e}"
+                )
+                failed.append(subscription_id)
+                continue
+            restored.append((subscription_id, subscription))
+            persisted_counts[subscription_id] = stored.report_count
+
+        with self.lock:
+            self._persisted_counts.update(persisted_counts)
+            # 복원할 수 없는 구독은 다음 저장 시 삭제된다.
+            self._dirty.update(failed)
+
+        self._flush_stop = asyncio.Event()
+        self._flush_task = asyncio.get_running_loop().create_task(
+            self._flush_periodically(flush_interval)
+        )
+        logger.info(
+            f"{green('Restored subscriptions')} - count: {len(restored)}, "
+            f"elapsed: {time.perf_counter() - started:.3f}s"
+        )
+        return restored
+
+    def _take_changes(self) -> SubscriptionChanges:
+        """저장되지 않은 생성/삭제와 바뀐 보고 횟수를 모은다."""
+        changes = SubscriptionChanges()
+        with self.lock:
+            for subscription_id in self._dirty:
+                subscription = self.subscriptions.get(subscription_id)
+                if subscription is None:
+                    changes.deletes.append(subscription_id)
+                    self._persisted_counts.pop(subscription_id, None)
+                    continue
+                report_count = self.handlers[subscription_id].report_count
+                changes.upserts.append(
+                    StoredSubscription(
+                        subscription_id=subscription_id,
+                        body=subscription.model_dump_json(
+                            by_alias=True, exclude_none=True
+                        ),
+                        report_count=report_count,
+                        created_at=self._created_at.get(subscription_id, 0.0),
+                    )
+                )
+                self._persisted_counts[subscription_id] = report_count
+            self._dirty.clear()
+
+            for subscription_id, handler in self.handlers.items():
+                if self._persisted_counts.get(subscription_id) != handler.report_count:
+                    changes.report_counts[subscription_id] = handler.report_count
+                    self._persisted_counts[subscription_id] = handler.report_count
+        return changes
+
+    async def flush(self) -> None:
+        """모아 둔 변경 사항을 저장소에 한 번에 저장한다."""
+        if self.store is None:
+            return
+        changes = self._take_changes()
+        if not changes:
+            return
+        try:
+            await asyncio.to_thread(self.store.write, changes)
+        except Exception:
+            # 다음 저장 때 다시 시도한다.
+            with self.lock:
+                self._dirty.update(s.subscription_id for s in changes.upserts)
+                self._dirty.update(changes.deletes)
+                for subscription_id in changes.report_counts:
+                    self._persisted_counts.pop(subscription_id, None)
+            raise
+
+    async def _flush_periodically(self, interval: float) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                await asyncio.wait_for(self._flush_stop.wait(), timeout=interval)
+                stopping = True
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to persist subscriptions: {e}", exc_info=True)
+
+    def acquire_upstream(
+        self, subscription_id: str, key: UpstreamKey
+    ) -> Optional[tuple[UpstreamSubscription, bool]]:
+        """
+        구독을 key 에 해당하는 NF 구독에 연결한다 (UpstreamRegistry.acquire).
+
+        구독 확인과 연결을 self.lock 안에서 하므로, 그 사이에 제거된 구독은
+        연결되지 않고, 연결 후에 제거되면 remove_subscription 이 해제한다.
+
+        Returns:
+            (NF 구독, 새로 만들어졌는지 여부). 구독이 이미 제거되었으면 None
+        """
+        with self.lock:
+            if subscription_id not in self.subscriptions:
+                return None
+            return self.upstreams.acquire(subscription_id, key)
+
+    def _schedule_unsubscribe(self, upstream: UpstreamSubscription) -> None:
+        if upstream.remote_id is None:
+            # 아직 구독 요청 중이면 요청이 끝난 뒤 해지된다.
+            return
+        try:
+            self.scheduler.spawn(lambda: self.unsubscribe_upstream(upstream))
+        except RuntimeError:
+            logger.warning(
+                f"No event loop to unsubscribe upstream - "
+                f"upstream_id: '{upstream.upstream_id}'"
+            )
+
+    async def unsubscribe_upstream(self, upstream: UpstreamSubscription) -> bool:
+        """
+        더 이상 사용하는 구독이 없는 NF 구독을 해지한다.
+
+        Returns:
+            bool: 해지 요청이 성공했으면 True
+        """
+        if upstream.remote_id is None:
+            return False
+        logger.info(
+            f"{red('Unsubscribe upstream')} - upstream_id: '{upstream.upstream_id}', "
+            f"uri: '{upstream.nf_uri}'"
+        )
+        return await unsubscribe_from_nf(upstream.remote_id, upstream.nf_uri)
+
+    async def shutdown(self):
+        """
+        모든 핸들러를 중지하고 남은 알림을 전송한 뒤, NF 구독을 해지하고
+        남은 변경 사항을 저장한 다음 스케줄러를 정리한다.
+
+        구독 자체는 제거하지 않으므로 저장소에 남아 다음 시작 시 복원된다.
+
+        애플리케이션 종료 시 lifespan 에서 호출된다.
         """
         with self.lock:
-            return self.handlers.get(subscription_id)
+            for handler in self.handlers.values():
+                handler.stop()
+        await self.dispatcher.shutdown()
+        await asyncio.gather(
+            *(self.unsubscribe_upstream(u) for u in self.upstreams.clear()),
+            return_exceptions=True,
+        )
+        if self._flush_task is not None:
+            # 마지막 저장을 마치고 종료한다.
+            self._flush_stop.set()
+            await self._flush_task
+            self._flush_task = None
+        if self.store is not None:
+            self.store.close()
+        await self.scheduler.shutdown()
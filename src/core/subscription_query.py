@@ -0,0 +1,114 @@
+import json
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+
+# alias(JSON 키) -> 필드 이름
+_FIELD_NAMES = {
+    field.alias or name: name
+    for name, field in NncofEventsSubscription.model_fields.items()
+}
+
+
+def parse_fields(fields: Optional[str]) -> Optional[frozenset[str]]:
+    """
+    쉼표로 구분된 alias 목록을 모델 필드 이름 집합으로 바꾼다.
+
+    Returns:
+        필드 이름 집합, fields 가 비어 있으면 None (전체 필드)
+
+    Raises:
+        ValueError: 알 수 없는 필드가 있는 경우
+    """
+    if not fields:
+        return None
+    names = set()
+    for alias in fields.split(","):
+        alias = alias.strip()
+        if not alias:
+            continue
+        name = _FIELD_NAMES.get(alias)
+        if name is None:
+            raise ValueError(f"Unknown field: '{alias}'")
+        names.add(name)
+    return frozenset(names) or None
+
+
+@dataclass(frozen=True)
+class SubscriptionQuery:
+    """
+    구독 목록 조회 조건과 응답 필드
+
+    None 인 조건은 모든 값을 허용한다. notif_method 가 없는 구독은
+    HandlerConfig 와 같이 PERIODIC 으로 본다.
+
+    Attributes:
+        nf_type: 구독의 nf_types 에 포함되어야 하는 NF 유형
+        notif_method: 구독의 알림 방법
+        notification_uri: 소비자의 알림 URI
+        fields: 응답에 포함할 필드 이름 (None 이면 전체)
+    """
+
+    nf_type: Optional[str] = None
+    notif_method: Optional[str] = None
+    notification_uri: Optional[str] = None
+    fields: Optional[frozenset[str]] = None
+
+    def matches(self, subscription: NncofEventsSubscription) -> bool:
+        event_subscription = subscription.event_subscriptions[0]
+        if self.nf_type is not None and self.nf_type not in (
+            event_subscription.nf_types or ()
+        ):
+            return False
+        if self.notif_method is not None:
+            evt_req = event_subscription.evt_req
+            notif_method = (evt_req and evt_req.notif_method) or "PERIODIC"
+            if notif_method != self.notif_method:
+                return False
+        if (
+            self.notification_uri is not None
+            and subscription.notification_uri != self.notification_uri
+        ):
+            return False
+        return True
+
+    def dump_json(self, subscription: NncofEventsSubscription) -> bytes:
+        """구독을 fields 만 담은 alias JSON 바이트로 직렬화한다."""
+        return subscription.model_dump_json(
+            by_alias=True, exclude_none=True, include=self.fields
+        ).encode()
+
+    def select(
+        self, entries: Iterable[tuple[int, str, NncofEventsSubscription]]
+    ) -> Iterator[tuple[int, str, bytes]]:
+        """
+        SubscriptionManager.iter_subscriptions() 결과 중 조건에 맞는 구독을
+        (순번, 구독 ID, JSON 바이트) 로 반환한다.
+        """
+        for seq, subscription_id, subscription in entries:
+            if self.matches(subscription):
+                yield seq, subscription_id, self.dump_json(subscription)
+
+
+def dump_subscription_page(items: Iterable[tuple[str, bytes]]) -> bytes:
+    """(구독 ID, JSON 바이트) 목록을 구독 ID 를 키로 하는 JSON 객체로 만든다."""
+    return (
+        b"{"
+        + b",".join(
+            json.dumps(subscription_id).encode() + b":" + body
+            for subscription_id, body in items
+        )
+        + b"}"
+    )
+
+
+def dump_subscription_line(subscription_id: str, body: bytes) -> bytes:
+    """NDJSON 한 줄: {"subscriptionId": ..., "subscription": {...}}"""
+    return (
+        b'{"subscriptionId":'
+        + json.dumps(subscription_id).encode()
+        + b',"subscription":'
+        + body
+        + b"}\n"
+    )
@@ -0,0 +1,156 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    delete,
+    insert,
+    select,
+    update,
+)
+
+from config.app_config import PersistenceConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredSubscription:
+    """
+    저장된 구독 하나
+
+    Attributes:
+        subscription_id: 구독 식별자
+        body: NncofEventsSubscription 의 JSON (alias 사용)
+        report_count: 지금까지 보고한 횟수
+        created_at: 구독 생성 시각 (epoch 초)
+    """
+
+    subscription_id: str
+    body: str
+    report_count: int = 0
+    created_at: float = 0.0
+
+
+@dataclass
+class SubscriptionChanges:
+    """한 번에 저장할 변경 사항"""
+
+    upserts: list[StoredSubscription] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+    report_counts: dict[str, int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.upserts or self.deletes or self.report_counts)
+
+
+class SubscriptionStore(ABC):
+    """
+    구독 저장소 인터페이스
+
+    SubscriptionManager 는 변경 사항을 모아 write() 로 한 번에 저장하고,
+    시작할 때 load() 로 저장된 구독을 복원한다. write() 는 이벤트 루프 밖의
+    스레드에서 호출될 수 있다.
+    """
+
+    @abstractmethod
+    def load(self) -> list[StoredSubscription]: ...
+
+    @abstractmethod
+    def write(self, changes: SubscriptionChanges) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+
+class SqlSubscriptionStore(SubscriptionStore):
+    """
+    sqlalchemy 를 사용하는 구독 저장소 (기본값은 SQLite)
+
+    Args:
+        url: sqlalchemy 데이터베이스 URL
+    """
+
+    def __init__(self, url: str):
+        self.engine = create_engine(url)
+        metadata = MetaData()
+        self.subscriptions = Table(
+            "subscriptions",
+            metadata,
+            Column("subscription_id", String(64), primary_key=True),
+            Column("body", Text, nullable=False),
+            Column("report_count", Integer, nullable=False, default=0),
+            Column("created_at", Float, nullable=False, default=0.0),
+        )
+        metadata.create_all(self.engine)
+
+    def load(self) -> list[StoredSubscription]:
+        table = self.subscriptions
+        with self.engine.connect() as connection:
+            rows = connection.execute(select(table).order_by(table.c.created_at))
+            return [
+                StoredSubscription(
+                    subscription_id=row.subscription_id,
+                    body=row.body,
+                    report_count=row.report_count,
+                    created_at=row.created_at,
+                )
+                for row in rows
+            ]
+
+    def write(self, changes: SubscriptionChanges) -> None:
+        """변경 사항을 하나의 트랜잭션으로 저장한다."""
+        table = self.subscriptions
+        replaced = [s.subscription_id for s in changes.upserts] + changes.deletes
+        with self.engine.begin() as connection:
+            if replaced:
+                # 방언별 upsert 대신 삭제 후 삽입한다.
+                connection.execute(
+                    delete(table).where(table.c.subscription_id.in_(replaced))
+                )
+            if changes.upserts:
+                connection.execute(
+                    insert(table),
+                    [
+                        {
+                            "subscription_id": s.subscription_id,
+                            "body": s.body,
+                            "report_count": s.report_count,
+                            "created_at": s.created_at,
+                        }
+                        for s in changes.upserts
+                    ],
+                )
+            if changes.report_counts:
+                connection.execute(
+                    update(table)
+                    .where(table.c.subscription_id == bindparam("b_id"))
+                    .values(report_count=bindparam("b_count")),
+                    [
+                        {"b_id": subscription_id, "b_count": count}
+                        for subscription_id, count in changes.report_counts.items()
+                    ],
+                )
+
+    def close(self) -> None:
+        self.engine.dispose()
+
+
+def create_subscription_store(
+    config: PersistenceConfig,
+) -> Optional[SubscriptionStore]:
+    """설정에 따라 구독 저장소를 만든다. url 이 없으면 None."""
+    if not config.url:
+        return None
+    logger.info(f"Subscription store: {config.url}")
+    return SqlSubscriptionStore(config.url)
@@ -0,0 +1,177 @@
+import bisect
+import math
+from typing import NamedTuple, Optional
+
+from openapi_server.models.threshold_level import ThresholdLevel
+
+from .load_sample import LOAD_FIELDS, LoadMeta, LoadSample
+
+# ThresholdLevel 필드 -> 비교할 LoadSample.values 의 위치
+THRESHOLD_METRICS = {
+    "nf_cpu_usage": LOAD_FIELDS.index("nf_cpu_usage"),
+    "nf_memory_usage": LOAD_FIELDS.index("nf_memory_usage"),
+    "nf_storage_usage": LOAD_FIELDS.index("nf_storage_usage"),
+    "nf_load_level": LOAD_FIELDS.index("nf_load_level_average"),
+}
+
+
+def _level_of(entry: tuple) -> float:
+    return entry[0]
+
+
+class ThresholdCrossing(NamedTuple):
+    """구독의 임계값 하나를 샘플이 넘은 기록"""
+
+    metric: str  # THRESHOLD_METRICS 의 키
+    level: float  # 임계값
+    rising: bool  # True 이면 위로, False 이면 아래로 넘음
+
+
+class ThresholdIndex:
+    """
+    ON_THRESHOLD 구독들의 임계값 색인
+
+    지표(THRESHOLD_METRICS)마다 (임계값, 구독 ID 집합) 을 임계값 순으로 정렬해
+    두므로, 샘플 하나가 넘은 임계값은 구독 수와 관계없이 이분 탐색 두 번과
+    넘은 임계값 수에 비례하는 비용으로 찾는다.
+
+    넘음 여부는 (샘플 메타(LoadMeta), 지표) 별 기준값 하나로 판단한다. 기준값
+    이하의 임계값은 "위" 상태이며, 값이 기준값보다 커지면 그 사이의
+    임계값을 위로 넘은 것으로, hysteresis 만큼 더 내려가면 그 사이의
+    임계값을 아래로 넘은 것으로 본다. 임계값 근처에서 값이 흔들려도
+    hysteresis 안쪽이면 다시 보고하지 않는다. 시계열(LoadStore 와 같이
+    인스턴스와 S-NSSAI 별)의 첫 샘플은 그 값 이하의 임계값을 모두 위로
+    넘은 것으로 본다.
+
+    기준값은 구독과 무관하게 공유되므로, 이미 "위" 상태인 임계값으로 나중에
+    추가된 구독은 evaluate() 로는 넘음을 받지 못한다. 이런 구독은
+    initial_crossings() 로 현재 "위" 상태인 임계값을 받는다. 색인이 비면
+    기준값도 비워, 다음 구독은 새 샘플부터 판단한다.
+
+    add()/remove() 는 호출자가 직렬화해야 하며, evaluate() 는 이벤트 루프
+    스레드에서 호출한다.
+
+    Args:
+        hysteresis: 아래로 넘었다고 보기 위해 임계값보다 더 내려가야 하는 값
+    """
+
+    def __init__(self, hysteresis: float = 0.0):
+        if hysteresis < 0:
+            raise ValueError("hysteresis cannot be negative")
+        self.hysteresis = hysteresis
+        self._entries: dict[str, list[tuple[float, set[str]]]] = {
+            metric: [] for metric in THRESHOLD_METRICS
+        }
+        self._levels: dict[str, list[tuple[str, float]]] = {}
+        # (샘플 메타, 지표) -> 기준값
+        self._armed: dict[tuple[LoadMeta, str], float] = {}
+        # 샘플 메타 -> 마지막으로 평가한 샘플 (initial_crossings 에서 보고)
+        self._latest: dict[LoadMeta, LoadSample] = {}
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def add(
+        self, subscription_id: str, thresholds: Optional[list[ThresholdLevel]]
+    ) -> bool:
+        """
+        구독의 임계값을 색인에 추가한다. 이미 있으면 교체한다.
+
+        Returns:
+            색인할 임계값이 있었으면 True
+        """
+        self.remove(subscription_id)
+        levels = [
+            (metric, float(value))
+            for threshold in thresholds or ()
+            for metric in THRESHOLD_METRICS
+            if (value := getattr(threshold, metric)) is not None
+        ]
+        if not levels:
+            return False
+        self._levels[subscription_id] = levels
+        for metric, level in levels:
+            entries = self._entries[metric]
+            i = bisect.bisect_left(entries, level, key=_level_of)
+            if i < len(entries) and entries[i][0] == level:
+                entries[i][1].add(subscription_id)
+            else:
+                entries.insert(i, (level, {subscription_id}))
+        return True
+
+    def remove(self, subscription_id: str) -> bool:
+        levels = self._levels.pop(subscription_id, None)
+        if levels is None:
+            return False
+        for metric, level in levels:
+            entries = self._entries[metric]
+            i = bisect.bisect_left(entries, level, key=_level_of)
+            if i < len(entries) and entries[i][0] == level:
+                subscribers = entries[i][1]
+                subscribers.discard(subscription_id)
+                if not subscribers:
+                    del entries[i]
+        if not self._levels:
+            # 평가가 멈추는 동안 기준값이 낡으므로 버린다.
+            self._armed.clear()
+            self._latest.clear()
+        return True
+
+    def initial_crossings(
+        self, subscription_id: str
+    ) -> list[tuple[LoadSample, list[ThresholdCrossing]]]:
+        """
+        새로 추가된 구독의 임계값 중 이미 "위" 상태인 것을 시계열별로 반환한다.
+
+        각 항목은 시계열의 마지막 샘플과, 기준값 이하인 구독의 임계값을 위로
+        넘은 기록이다. 구독 조건(LoadFilter)은 확인하지 않는다.
+        """
+        levels = self._levels.get(subscription_id)
+        if not levels:
+            return []
+        result = []
+        for meta, sample in self._latest.items():
+            crossings = [
+                ThresholdCrossing(metric, level, rising=True)
+                for metric, level in levels
+                if self._armed.get((meta, metric), -math.inf) >= level
+            ]
+            if crossings:
+                result.append((sample, crossings))
+        return result
+
+    def evaluate(self, sample: LoadSample) -> dict[str, list[ThresholdCrossing]]:
+        """
+        샘플이 넘은 임계값을 구독별로 반환하고 시계열의 기준값을 갱신한다.
+
+        구독 조건(LoadFilter)은 확인하지 않는다.
+        """
+        crossings: dict[str, list[ThresholdCrossing]] = {}
+        meta = sample.meta
+        values = sample.values
+        self._latest[meta] = sample
+        for metric, position in THRESHOLD_METRICS.items():
+            value = values[position]
+            if value is None:
+                continue
+            key = (meta, metric)
+            armed = self._armed.get(key, -math.inf)
+            if value > armed:
+                # (armed, value] 의 임계값을 위로 넘음
+                low, high, rising = armed, value, True
+                self._armed[key] = value
+            elif value + self.hysteresis < armed:
+                # (value + hysteresis, armed] 의 임계값을 아래로 넘음
+                low, high, rising = value + self.hysteresis, armed, False
+                self._armed[key] = low
+            else:
+                continue
+
+            entries = self._entries[metric]
+            start = bisect.bisect_right(entries, low, key=_level_of)
+            end = bisect.bisect_right(entries, high, key=_level_of)
+            for level, subscribers in entries[start:end]:
+                crossing = ThresholdCrossing(metric, level, rising)
+                for subscription_id in tuple(subscribers):
+                    crossings.setdefault(subscription_id, []).append(crossing)
+        return crossings
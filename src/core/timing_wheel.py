@@ -0,0 +1,205 @@
+import math
+from typing import Callable, Optional
+
+# 부동소수점 오차로 틱 경계가 한 칸 밀리지 않도록 하는 허용 오차 (틱 단위)
+_TICK_EPSILON = 1e-6
+
+
+class TimerEntry:
+    """
+    TimingWheel 에 등록된 타이머 항목
+
+    cancel() 은 자신이 속한 슬롯에서 바로 제거되므로 O(1) 이다.
+    """
+
+    __slots__ = ("deadline", "callback", "_tick", "_wheel", "_bucket", "_level")
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.callback = callback
+        self._tick = 0
+        self._wheel: Optional["TimingWheel"] = None
+        self._bucket: Optional[dict] = None
+        self._level = 0
+
+    @property
+    def active(self) -> bool:
+        return self._bucket is not None
+
+    def cancel(self) -> None:
+        if self._bucket is None:
+            return
+        del self._bucket[self]
+        self._wheel._counts[self._level] -= 1
+        self._wheel._size -= 1
+        self._bucket = None
+        self._wheel = None
+
+
+class TimingWheel:
+    """
+    계층형 타이밍 휠 (hierarchical timing wheel)
+
+    시간은 tick 단위의 정수로 관리되며, 각 레벨은 wheel_size 개의 슬롯을 가진다.
+    레벨 l 의 슬롯 하나는 wheel_size ** l 틱을 담당하고, 상위 레벨의 슬롯은
+    경계에 도달할 때 하위 레벨로 내려온다(cascade). 휠의 범위를 넘는 항목은
+    overflow 에 보관된다.
+
+    - insert / cancel: O(1)
+    - advance: 경과한 틱 수가 아니라 만료되거나 cascade 되는 항목 수에 비례
+
+    Args:
+        tick: 한 틱의 길이 (초)
+        wheel_size: 레벨당 슬롯 수 (2의 거듭제곱)
+        levels: 레벨 수
+        origin: 0번 틱에 해당하는 시각
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.01,
+        wheel_size: int = 256,
+        levels: int = 4,
+        origin: float = 0.0,
+    ):
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if wheel_size < 2 or wheel_size & (wheel_size - 1):
+            raise ValueError("wheel_size must be a power of two")
+        if levels < 1:
+            raise ValueError("levels must be positive")
+
+        self.tick = tick
+        self.origin = origin
+        self._bits = wheel_size.bit_length() - 1
+        self._mask = wheel_size - 1
+        self._levels = levels
+        self._wheels: list[list[dict]] = [
+            [{} for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self._overflow: dict = {}
+        self._counts = [0] * (levels + 1)
+        self._size = 0
+        # 이미 처리가 끝난 마지막 틱
+        self._current = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def now(self) -> float:
+        """휠이 처리를 마친 시각"""
+        return self.origin + self._current * self.tick
+
+    def insert(self, deadline: float, callback: Callable[[], None]) -> TimerEntry:
+        """deadline 시각에 callback 을 호출하도록 등록한다."""
+        entry = TimerEntry(deadline, callback)
+        entry._tick = max(
+            math.ceil((deadline - self.origin) / self.tick - _TICK_EPSILON),
+            self._current + 1,
+        )
+        entry._wheel = self
+        self._place(entry)
+        self._size += 1
+        return entry
+
+    def _place(self, entry: TimerEntry) -> None:
+        tick = entry._tick
+        current = self._current
+        for level in range(self._levels):
+            shift = self._bits * (level + 1)
+            if tick >> shift == current >> shift:
+                bucket = self._wheels[level][
+                    (tick >> (self._bits * level)) & self._mask
+                ]
+                break
+        else:
+            level = self._levels
+            bucket = self._overflow
+
+        bucket[entry] = None
+        entry._bucket = bucket
+        entry._level = level
+        self._counts[level] += 1
+
+    def _cascade(self, bucket: dict, level: int) -> None:
+        entries = list(bucket)
+        bucket.clear()
+        self._counts[level] -= len(entries)
+        for entry in entries:
+            self._place(entry)
+
+    def next_expiry(self) -> Optional[float]:
+        """
+        다음에 advance() 를 호출해야 하는 시각을 반환한다.
+
+        항목이 만료되거나 상위 레벨 슬롯이 cascade 되는 가장 이른 틱의 시각이며,
+        등록된 항목이 없으면 None 을 반환한다.
+        """
+        tick = self._next_event_tick()
+        if tick is None:
+            return None
+        return self.origin + tick * self.tick
+
+    def _next_event_tick(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+
+        current = self._current
+        for level in range(self._levels):
+            if self._counts[level] == 0:
+                continue
+            shift = self._bits * level
+            slots = self._wheels[level]
+            digit = (current >> shift) & self._mask
+            for index in range(digit + 1, self._mask + 1):
+                if slots[index]:
+                    window = (current >> (shift + self._bits)) << (shift + self._bits)
+                    return window | (index << shift)
+
+        # 모든 레벨이 비어 있으면 overflow 를 다시 배치할 최상위 경계
+        span = self._bits * self._levels
+        return ((current >> span) + 1) << span
+
+    def advance(self, now: float) -> list[TimerEntry]:
+        """
+        now 시각까지 휠을 진행시키고 만료된 항목 목록을 반환한다.
+
+        반환된 항목은 이미 휠에서 제거된 상태이며, 콜백 호출은 호출자가 한다.
+        """
+        target = math.floor((now - self.origin) / self.tick + _TICK_EPSILON)
+        expired: list[TimerEntry] = []
+
+        while self._current < target:
+            next_tick = self._next_event_tick()
+            if next_tick is None or next_tick > target:
+                self._current = target
+                break
+            self._current = next_tick
+            self._process_tick(next_tick, expired)
+
+        return expired
+
+    def _process_tick(self, tick: int, expired: list[TimerEntry]) -> None:
+        span = self._bits * self._levels
+        if tick & ((1 << span) - 1) == 0 and self._overflow:
+            self._cascade(self._overflow, self._levels)
+
+        # 상위 레벨부터 내려와야 같은 틱에 연속으로 cascade 되는 항목이 처리된다.
+        for level in range(self._levels - 1, 0, -1):
+            shift = self._bits * level
+            if tick & ((1 << shift) - 1) == 0:
+                bucket = self._wheels[level][(tick >> shift) & self._mask]
+                if bucket:
+                    self._cascade(bucket, level)
+
+        bucket = self._wheels[0][tick & self._mask]
+        if bucket:
+            entries = list(bucket)
+            bucket.clear()
+            self._counts[0] -= len(entries)
+            self._size -= len(entries)
+            for entry in entries:
+                entry._bucket = None
+                entry._wheel = None
+            expired.extend(entries)
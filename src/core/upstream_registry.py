@@ -0,0 +1,155 @@
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+
+
+def build_upstream_request(
+    subscription: NncofEventsSubscription,
+) -> NncofEventsSubscription:
+    """
+    구독에서 NF 에 전달할 부분만 남긴 요청을 만든다.
+
+    NF 구독은 여러 구독이 공유하고 마지막 구독이 떠날 때 해지하므로,
+    구독별 알림 URI/상관 ID, 시작/종료 시각과 최대 보고 횟수는 빼고
+    보고 주기는 1초로 맞춘다. 알림 URI 는 호출자가 NF 구독 ID 로 채운다.
+    """
+    request = subscription.model_copy(deep=True)
+    request.notification_uri = None
+    request.notif_corr_id = None
+
+    event_subscription = request.event_subscriptions[0]
+    event_subscription.extra_report_req = None
+    if event_subscription.evt_req is not None:
+        event_subscription.evt_req.rep_period = 1
+        event_subscription.evt_req.mon_dur = None
+        event_subscription.evt_req.max_report_nbr = None
+    return request
+
+
+@dataclass(frozen=True)
+class UpstreamKey:
+    """
+    NF 구독을 공유할 수 있는지 판단하는 키
+
+    같은 NF 에 보내는 요청(build_upstream_request)이 같은 구독은
+    하나의 NF 구독으로 처리할 수 있다. 대상 조건뿐 아니라 임계값,
+    그룹 보고 시간 등 NF 에 전달하는 모든 필드가 같아야 한다.
+    """
+
+    nf_uri: str
+    request: str
+
+    @staticmethod
+    def from_subscription(
+        nf_uri: str, subscription: NncofEventsSubscription
+    ) -> "UpstreamKey":
+        request = build_upstream_request(subscription)
+        return UpstreamKey(
+            nf_uri=nf_uri,
+            request=request.model_dump_json(by_alias=True, exclude_none=True),
+        )
+
+
+@dataclass
+class UpstreamSubscription:
+    """
+    NF 에 실제로 요청한 구독 하나
+
+    Attributes:
+        upstream_id: NF 가 알림을 보낼 NCOF 측 식별자 (알림 URI 에 사용)
+        key: 공유 판단 키
+        consumers: 이 NF 구독을 사용하는 구독 ID 집합
+        remote_id: NF 가 응답한 구독 식별자 (구독 요청이 끝나기 전에는 None)
+        closed: 마지막 구독이 떠나 해지 대상이 되었는지 여부
+    """
+
+    upstream_id: str
+    key: UpstreamKey
+    consumers: set[str] = field(default_factory=set)
+    remote_id: Optional[str] = None
+    closed: bool = False
+
+    @property
+    def nf_uri(self) -> str:
+        return self.key.nf_uri
+
+
+class UpstreamRegistry:
+    """
+    NF 구독을 (nf uri, NF 요청) 별로 공유하고 참조 수를 관리하는 레지스트리
+
+    같은 조건의 구독이 이미 있으면 새로 요청하지 않고 재사용하며,
+    마지막 구독이 떠나면 release() 가 해지할 NF 구독을 돌려준다.
+    """
+
+    def __init__(self):
+        self._by_key: dict[UpstreamKey, UpstreamSubscription] = {}
+        self._by_id: dict[str, UpstreamSubscription] = {}
+        self._by_consumer: dict[str, set[str]] = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def acquire(
+        self, consumer_id: str, key: UpstreamKey
+    ) -> tuple[UpstreamSubscription, bool]:
+        """
+        구독을 key 에 해당하는 NF 구독에 연결한다.
+
+        Returns:
+            (NF 구독, 새로 만들어졌는지 여부). 새로 만들어진 경우 호출자가
+            NF 에 구독을 요청해야 한다.
+        """
+        with self.lock:
+            upstream = self._by_key.get(key)
+            created = upstream is None
+            if created:
+                upstream = UpstreamSubscription(upstream_id=str(uuid.uuid4()), key=key)
+                self._by_key[key] = upstream
+                self._by_id[upstream.upstream_id] = upstream
+            upstream.consumers.add(consumer_id)
+            self._by_consumer.setdefault(consumer_id, set()).add(upstream.upstream_id)
+            return upstream, created
+
+    def release(self, consumer_id: str) -> list[UpstreamSubscription]:
+        """
+        구독이 사용하던 NF 구독의 참조를 해제한다.
+
+        Returns:
+            더 이상 사용하는 구독이 없어 해지해야 하는 NF 구독 목록
+        """
+        with self.lock:
+            released = []
+            for upstream_id in self._by_consumer.pop(consumer_id, ()):
+                upstream = self._by_id.get(upstream_id)
+                if upstream is None:
+                    continue
+                upstream.consumers.discard(consumer_id)
+                if not upstream.consumers:
+                    self._remove(upstream)
+                    released.append(upstream)
+            return released
+
+    def clear(self) -> list[UpstreamSubscription]:
+        """모든 NF 구독을 제거하고 반환한다."""
+        with self.lock:
+            upstreams = list(self._by_id.values())
+            for upstream in upstreams:
+                upstream.closed = True
+            self._by_key.clear()
+            self._by_id.clear()
+            self._by_consumer.clear()
+            return upstreams
+
+    def get(self, upstream_id: str) -> Optional[UpstreamSubscription]:
+        with self.lock:
+            return self._by_id.get(upstream_id)
+
+    def _remove(self, upstream: UpstreamSubscription) -> None:
+        upstream.closed = True
+        self._by_key.pop(upstream.key, None)
+        self._by_id.pop(upstream.upstream_id, None)
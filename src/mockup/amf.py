@@ -1,4 +1,5 @@
 import logging
+import uuid
 
 from fastapi import BackgroundTasks, Body, FastAPI, HTTPException, status
 
@@ -40,11 +41,16 @@ async def subscribe(
             delay=1,
         )
 
-    subscription_id = "amf-subscription-00001"
+    subscription_id = f"amf-subscription-{uuid.uuid4()}"
     logging.info(f"Background notification task added for {subscription.notification_uri}")
 
     return subscription_id
 
+
+@app.delete("/subscriptions/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def unsubscribe(subscription_id: str):
+    logging.info(f"[Unsubscription] <--- {subscription_id}")
+
 print(
     r"""
     _    __  __ _____   __  __            _
@@ -1,4 +1,5 @@
 import logging
+import uuid
 
 from fastapi import BackgroundTasks, Body, FastAPI, HTTPException, status
 
@@ -44,11 +45,16 @@ async def subscribe(
             delay=1,
         )
 
-    subscription_id = "smf-subscription-00001"
+    subscription_id = f"smf-subscription-{uuid.uuid4()}"
 
     return subscription_id
 
 
+@app.delete("/subscriptions/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def unsubscribe(subscription_id: str):
+    logging.info(f"{red('Delete subscription')} - {subscription_id}")
+
+
 print(
     r"""
  ____  __  __ _____   __  __            _
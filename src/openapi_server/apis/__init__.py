@@ -16,10 +16,15 @@ from openapi_server.apis.notifications_api import (
     router as notifications_api,
 )
 
+from openapi_server.apis.dashboard_api import (
+    router as dashboard_api,
+)
+
 __all__ = [
     "subscription_transfer_api",
     "subscription_transfers_api",
     "subscription_api",
     "subscriptions_api",
     "notifications_api",
+    "dashboard_api",
 ]
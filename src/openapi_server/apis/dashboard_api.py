@@ -0,0 +1,50 @@
+# coding: utf-8
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.subscription_manager import SubscriptionManager
+from core.dependency import get_subscription_manager
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/dashboard/events",
+    responses={
+        200: {
+            "description": "Server-Sent Events stream of subscription and load changes",
+            "content": {"text/event-stream": {}},
+        },
+        503: {"description": "Too many dashboard clients"},
+    },
+    tags=["Dashboard"],
+    summary="Stream subscription and NF load changes",
+)
+async def dashboard_events(
+    interval: Optional[float] = Query(None, gt=0),
+    subscription_manager: SubscriptionManager = Depends(get_subscription_manager),
+):
+    """
+    대시보드에 구독 생성/삭제와 NF 인스턴스별 집계 부하를 SSE 로 보낸다.
+
+    연결 이후의 변경만 보내므로, 클라이언트는 연결한 뒤 GET /subscriptions 로
+    현재 목록을 받고 그동안 받은 변경을 이어서 적용한다. 변경은 interval 초
+    (설정값보다 짧을 수 없음)마다 모아서 보낸다.
+    """
+    live_feed = subscription_manager.live_feed
+    client = live_feed.connect(interval)
+    if client is None:
+        raise HTTPException(status_code=503, detail="Too many dashboard clients")
+    logger.info(f"Dashboard connected - clients: {len(live_feed)}")
+
+    return StreamingResponse(
+        live_feed.stream(client),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
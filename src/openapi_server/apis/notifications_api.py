@@ -12,19 +12,36 @@ from fastapi import (  # noqa: F401
     Depends,
     HTTPException,
     Path,
+    Request,
     status,
 )
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from config.app_config import app_config
 
 from core.subscription_manager import SubscriptionManager
 from core.dependency import get_subscription_manager
+from core.fast_ingest import parse_event_notification, parse_event_notification_batch
 
-from openapi_server.models.event_notification import EventNotification
+from openapi_server.models.event_notification_batch_item import (
+    EventNotificationBatchItem,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _batch_request_schema() -> dict:
+    """POST /notifications 본문 스키마. 중첩 모델은 components 를 참조한다."""
+    item = EventNotificationBatchItem.model_json_schema(
+        by_alias=True, ref_template="#/components/schemas/{model}"
+    )
+    item.pop("$defs", None)
+    return {"type": "array", "minItems": 1, "items": item}
+
+
 @router.post(
     "/notifications/{subscription_id}",
     responses={
@@ -36,28 +53,89 @@ router = APIRouter()
     summary="Create a new Individual NCOF Events Notification",
     status_code=status.HTTP_201_CREATED,
     response_model_by_alias=True,
+    openapi_extra={
+        "requestBody": {
+            "description": "Event notification containing NF load level information",
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/EventNotification"}
+                }
+            },
+        }
+    },
 )
 async def create_nwdaf_events_notification(
+    request: Request,
     subscription_id: Annotated[StrictStr, Field()] = Path(),
     subscription_manager: SubscriptionManager = Depends(get_subscription_manager),
-    event_notification: EventNotification = Body(
-        None, description="Event notification containing NF load level information"
-    ),
 ):
-    """외부 서버로부터 알림 수신"""
+    """
+    외부 서버로부터 알림 수신
+
+    본문은 EventNotification 이다. fast_ingest 설정이 켜져 있으면 집계에
+    필요한 필드만 담은 LoadSample 로 바로 파싱하고, 그럴 수 없는 본문만
+    전체 검증으로 처리한다.
+    """
+
+    try:
+        nf_load_level_infos = parse_event_notification(
+            await request.body(), fast=app_config.fast_ingest
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
 
-    if not event_notification.nf_load_level_infos:
+    if not nf_load_level_infos:
         raise HTTPException(
             status_code=400,
             detail="No load level information provided in the notification",
         )
 
-    handler = subscription_manager.get_handler(subscription_id)
-
-    if not handler:
+    if not subscription_manager.ingest_loads(subscription_id, nf_load_level_infos):
         raise HTTPException(status_code=404, detail="구독 ID를 찾을 수 없음")
 
-    for load in event_notification.nf_load_level_infos:
-        handler.add_load_info(load)
-
     return None
+
+
+@router.post(
+    "/notifications",
+    responses={
+        201: {"description": "notifications accepted"},
+        400: {"description": "invalid input, object invalid"},
+    },
+    tags=["NCOF Events Notifications"],
+    summary="Create NCOF Events Notifications for multiple subscriptions",
+    status_code=status.HTTP_201_CREATED,
+    response_model_by_alias=True,
+    openapi_extra={
+        "requestBody": {
+            "description": "Event notifications for multiple subscriptions",
+            "required": True,
+            "content": {"application/json": {"schema": _batch_request_schema()}},
+        }
+    },
+)
+async def create_nwdaf_events_notifications(
+    request: Request,
+    subscription_manager: SubscriptionManager = Depends(get_subscription_manager),
+):
+    """
+    외부 서버로부터 여러 구독의 알림을 한 번에 수신
+
+    본문은 EventNotificationBatchItem 목록이며, 단건 알림과 같이 fast_ingest
+    설정에 따라 빠른 경로로 파싱한다. 존재하지 않는 구독 ID의 알림은 무시하고,
+    그 ID 목록을 응답한다.
+    """
+
+    try:
+        notifications = parse_event_notification_batch(
+            await request.body(), fast=app_config.fast_ingest
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+    unknown = subscription_manager.ingest_batch(notifications)
+
+    return {
+        "accepted": len(notifications) - len(unknown),
+        "unknownSubscriptionIds": unknown,
+    }
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+import itertools
 import logging
 import time
 from typing import Optional  # noqa: F401
@@ -13,12 +14,27 @@ from fastapi import (  # noqa: F401
     BackgroundTasks,
     Body,
     Depends,
+    Header,
     HTTPException,
+    Query,
+    Response,
     status,
 )
+from fastapi.responses import StreamingResponse
 
-from core.nf_client import subscribe_to_nf
+from core.nf_client import NfRequestError, subscribe_to_nf
 from core.nrf_client import get_nf_info
+from core.subscription_query import (
+    SubscriptionQuery,
+    dump_subscription_line,
+    dump_subscription_page,
+    parse_fields,
+)
+from core.upstream_registry import (
+    UpstreamKey,
+    UpstreamSubscription,
+    build_upstream_request,
+)
 
 # from core.subscription_manager import SubscriptionManager
 # from core.dependency import get_subscription_manager
@@ -33,21 +49,118 @@ from config.app_config import app_config
 
 router = APIRouter()
 
+# GET /subscriptions 한 페이지의 기본/최대 구독 수
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+# NDJSON 스트림에서 이벤트 루프에 양보하기 전까지 보내는 줄 수
+NDJSON_CHUNK_SIZE = 256
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# NF 구독 요청이 일시적으로 실패했을 때 재시도 간격 (초, 지수 증가)과 최대 시도 횟수
+UPSTREAM_RETRY_BASE = 1.0
+UPSTREAM_RETRY_MAX = 30.0
+UPSTREAM_RETRY_LIMIT = 8
+
 
 def build_ncof_notification_uri(subscription_id: str) -> str:
     return f"http://{app_config.server_ip}:{app_config.port}/{app_config.notification_prefix}/notifications/{subscription_id}"
 
 
+def build_upstream_payload(
+    subscription: NncofEventsSubscription, upstream_id: str
+) -> dict:
+    """NF 에 보낼 구독 요청을 만든다. 알림은 NF 구독 ID 로 받는다."""
+    payload = build_upstream_request(subscription)
+    payload.notification_uri = build_ncof_notification_uri(upstream_id)
+    return payload.model_dump()
+
+
+async def subscribe_upstream(
+    upstream: UpstreamSubscription,
+    subscription: NncofEventsSubscription,
+    subscription_manager: SubscriptionManager,
+):
+    """
+    NF 에 구독을 요청한다.
+
+    요청 중에 같은 NF 구독에 연결된 구독이 있을 수 있으므로, 일시적인 실패
+    (timeout/연결 오류, 429, 5xx)는 연결된 구독을 유지한 채 backoff 로
+    UPSTREAM_RETRY_LIMIT 번까지 시도한다. 그래도 실패하거나 다시 시도해도
+    소용없는 실패(4xx, 응답에 구독 ID 없음)이면 연결된 구독을 모두 제거한다.
+    """
+    attempt = 0
+    while True:
+        try:
+            remote_id = await subscribe_to_nf(
+                subscription_id=upstream.upstream_id,
+                uri=upstream.nf_uri,
+                payload=build_upstream_payload(subscription, upstream.upstream_id),
+            )
+            break
+        except Exception as e:
+            if upstream.closed:
+                return
+            attempt += 1
+            retryable = isinstance(e, NfRequestError) and e.retryable
+            if not retryable or attempt >= UPSTREAM_RETRY_LIMIT:
+                fail_upstream(upstream, subscription_manager, e)
+                return
+            delay = min(UPSTREAM_RETRY_MAX, UPSTREAM_RETRY_BASE * 2 ** (attempt - 1))
+            logger.warning(
+                f"Failed to subscribe upstream - upstream_id: "
+                f"'{upstream.upstream_id}', attempt: {attempt}, "
+                f"retry in {delay}s: {e}"
+            )
+            await asyncio.sleep(delay)
+            if upstream.closed:
+                return
+
+    upstream.remote_id = remote_id
+    if upstream.closed:
+        # 구독 요청 중에 마지막 구독이 떠났으면 바로 해지한다.
+        await subscription_manager.unsubscribe_upstream(upstream)
+
+
+def fail_upstream(
+    upstream: UpstreamSubscription,
+    subscription_manager: SubscriptionManager,
+    error: Exception,
+):
+    """NF 구독에 실패한 경우 연결된 구독을 모두 제거한다."""
+    consumers = tuple(upstream.consumers)
+    logger.error(
+        f"Failed to subscribe upstream - upstream_id: '{upstream.upstream_id}', "
+        f"uri: {upstream.nf_uri}, removing {len(consumers)} subscriptions: {error}"
+    )
+    for subscription_id in consumers:
+        subscription_manager.remove_subscription(subscription_id)
+
+
 # 비동기 작업을 위한 태스크 리스트 생성
-async def subscribe_to_nfs(nfs, payload, subscription_id):
-    tasks = [
-        subscribe_to_nf(
-            subscription_id=subscription_id,
-            uri=nf.get("uri") or "",
-            payload=payload,
-        )
-        for nf in nfs
-    ]
+async def subscribe_to_nfs(nfs, subscription, subscription_id, subscription_manager):
+    """
+    NF 별로 같은 조건의 NF 구독이 있으면 재사용하고, 없을 때만 구독을 요청한다.
+    """
+    tasks = []
+    for nf in nfs:
+        key = UpstreamKey.from_subscription(nf.get("uri") or "", subscription)
+        acquired = subscription_manager.acquire_upstream(subscription_id, key)
+        if acquired is None:
+            # 보고를 마쳤거나 종료 시각이 지나 NF 구독 전에 제거된 구독
+            logger.info(
+                f"Skip upstream subscription for removed subscription - "
+                f"subscription_id: '{subscription_id}'"
+            )
+            break
+        upstream, created = acquired
+        if created:
+            tasks.append(
+                subscribe_upstream(upstream, subscription, subscription_manager)
+            )
+        else:
+            logger.info(
+                f"Reuse upstream subscription - upstream_id: '{upstream.upstream_id}', "
+                f"consumers: {len(upstream.consumers)}"
+            )
     # 모든 태스크를 병렬로 실행하고 결과를 기다림
     results = await asyncio.gather(*tasks, return_exceptions=True)
     for result in results:
@@ -56,6 +169,30 @@ async def subscribe_to_nfs(nfs, payload, subscription_id):
     return True
 
 
+async def resubscribe_upstreams(restored, subscription_manager):
+    """
+    재시작 시 복원된 구독들의 NF 구독을 다시 요청한다.
+
+    모든 구독이 먼저 NF 구독을 acquire 하므로, 같은 조건의 구독은 NF 구독
+    하나를 공유하고 NF 에는 조건별로 한 번만 요청한다.
+    """
+    tasks = [
+        subscribe_to_nfs(
+            get_nfs_by_types(subscription.event_subscriptions[0].nf_types),
+            subscription,
+            subscription_id,
+            subscription_manager,
+        )
+        for subscription_id, subscription in restored
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    failed = [result for result in results if isinstance(result, Exception)]
+    if failed:
+        logger.error(
+            f"Failed to resubscribe upstreams for {len(failed)} restored subscriptions"
+        )
+
+
 logger = logging.getLogger(__name__)
 # TIMEZONE: timezone = timezone(timedelta(hours=9))
 TIMEZONE = datetime.now().astimezone().tzinfo
@@ -126,17 +263,6 @@ async def create_ncof_events_subscription(
         # 구독 ID를 생성한다.
         new_subscription_id = str(uuid.uuid4())
 
-        new_nf_events_subscription = subscription.model_copy(deep=True)
-
-        # update the notification URI in the subscription
-        new_nf_events_subscription.notification_uri = build_ncof_notification_uri(
-            new_subscription_id
-        )
-
-        # 보고 주기를 1초로
-        if new_nf_events_subscription.event_subscriptions[0].evt_req is not None:
-            new_nf_events_subscription.event_subscriptions[0].evt_req.rep_period = 1
-
         subscription_manager.add_subscription(
             subscription_id=new_subscription_id,
             subscription=subscription,
@@ -145,12 +271,16 @@ async def create_ncof_events_subscription(
         background_tasks.add_task(
             subscribe_to_nfs,
             nfs,
-            new_nf_events_subscription.model_dump(),
+            subscription,
             new_subscription_id,
+            subscription_manager,
         )
 
         return new_subscription_id
 
+    except ValueError as e:
+        # 구독 설정 오류 (예: ON_THRESHOLD 에 임계값이 없음)
+        raise HTTPException(status_code=400, detail=f"Error subscribing: {str(e)}")
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -158,12 +288,96 @@ async def create_ncof_events_subscription(
     # return await subscription_service.create_ncof_events_subscription(subscription)
 
 
+def parse_cursor(cursor: Optional[str]) -> Optional[int]:
+    if cursor is None:
+        return None
+    try:
+        return int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: '{cursor}'")
+
+
+async def stream_subscriptions(entries, limit: Optional[int]):
+    """조건에 맞는 구독을 NDJSON 으로 나누어 보낸다."""
+    entries = itertools.islice(entries, limit)
+    while chunk := list(itertools.islice(entries, NDJSON_CHUNK_SIZE)):
+        yield b"".join(
+            dump_subscription_line(subscription_id, body)
+            for _, subscription_id, body in chunk
+        )
+        # 큰 목록을 보내는 동안 다른 요청을 막지 않도록 양보한다.
+        await asyncio.sleep(0)
+
+
 @router.get(
     "/subscriptions",
+    responses={
+        200: {
+            "description": "Subscriptions keyed by subscription ID. "
+            "The X-Next-Cursor header is set when more subscriptions remain.",
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+        400: {"description": "Invalid cursor or fields"},
+    },
     tags=["NCOF Events Subscriptions"],
-    summary="Get all NCOF Events Subscriptions",
+    summary="Get NCOF Events Subscriptions",
 )
 async def subscriptions(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    nf_type: Optional[str] = Query(None, alias="nf-type"),
+    notif_method: Optional[str] = Query(None, alias="notif-method"),
+    notification_uri: Optional[str] = Query(None, alias="notification-uri"),
+    fields: Optional[str] = Query(None),
+    accept: Optional[str] = Header(None),
     subscription_manager: SubscriptionManager = Depends(get_subscription_manager),
 ):
-    return subscription_manager.get_subscriptions()
+    """
+    구독 목록을 생성 순서대로 조회한다.
+
+    응답은 구독 ID 를 키로 하는 객체이다. limit 과 cursor 가 모두 없으면
+    조건에 맞는 구독을 전부 반환한다. 둘 중 하나라도 있으면 한 번에 limit
+    개(기본 DEFAULT_PAGE_SIZE)까지 반환하고, 남은 구독이 있으면
+    X-Next-Cursor 헤더의 값을 cursor 로 다음 페이지를 조회한다. nf-type, notif-method,
+    notification-uri 로 구독을 거르고, fields (쉼표로 구분된 JSON 키) 로 응답
+    필드를 고른다.
+
+    Accept 가 application/x-ndjson 이면 조건에 맞는 구독을 (limit 이 없으면
+    전부) 한 줄에 하나씩 스트리밍한다.
+    """
+    try:
+        query = SubscriptionQuery(
+            nf_type=nf_type,
+            notif_method=notif_method,
+            notification_uri=notification_uri,
+            fields=parse_fields(fields),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    entries = query.select(
+        subscription_manager.iter_subscriptions(after=parse_cursor(cursor))
+    )
+
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            stream_subscriptions(entries, limit), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    headers = {}
+    if limit is None and cursor is None:
+        # 페이지를 요청하지 않은 기존 클라이언트에는 전체 목록을 보낸다.
+        page = entries
+    else:
+        page_size = limit or DEFAULT_PAGE_SIZE
+        # 다음 페이지가 있는지 알기 위해 하나 더 읽는다.
+        page = list(itertools.islice(entries, page_size + 1))
+        if len(page) > page_size:
+            page.pop()
+            headers["X-Next-Cursor"] = str(page[-1][0])
+    return Response(
+        content=dump_subscription_page(
+            (subscription_id, body) for _, subscription_id, body in page
+        ),
+        media_type="application/json",
+        headers=headers,
+    )
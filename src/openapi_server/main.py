@@ -10,7 +10,16 @@ from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
 from config.app_config import app_config
+from core.dependency import get_subscription_manager
+from core.nf_client import (
+    close_client_pool,
+    configure_delivery_policy,
+    open_client_pool,
+)
+from core.subscription_store import create_subscription_store
+from openapi_server.apis.subscriptions_api import resubscribe_upstreams
 from openapi_server.apis import (
+    dashboard_api,
     notifications_api,
     subscription_api,
     subscription_transfer_api,
@@ -32,7 +41,24 @@ print(
 # 생명주기 이벤트 핸들러
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # NF 로 보내는 요청은 하나의 클라이언트 풀에서 연결을 재사용한다.
+    open_client_pool(app_config.http_client)
+    configure_delivery_policy(app_config.delivery)
+
+    # 저장된 구독을 복원하고, NF 구독은 백그라운드에서 다시 요청한다.
+    subscription_manager = get_subscription_manager()
+    store = create_subscription_store(app_config.persistence)
+    if store is not None:
+        restored = subscription_manager.restore(
+            store, app_config.persistence.flush_interval
+        )
+        if restored:
+            subscription_manager.scheduler.spawn(
+                lambda: resubscribe_upstreams(restored, subscription_manager)
+            )
     yield
+    await get_subscription_manager().shutdown()
+    await close_client_pool()
 
 
 app = FastAPI(
@@ -58,6 +84,7 @@ app.include_router(subscription_transfers_api)
 app.include_router(subscription_api, prefix=SUBSCRIPTION_PREFIX)
 app.include_router(subscriptions_api, prefix=SUBSCRIPTION_PREFIX)
 app.include_router(notifications_api, prefix=NOTIFICATION_PREFIX)
+app.include_router(dashboard_api)
 
 
 class QuietUvicornServer:
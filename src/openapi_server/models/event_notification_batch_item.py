@@ -0,0 +1,89 @@
+# coding: utf-8
+
+"""
+Nncof_EventsSubscription
+
+Represents the NF load level information notified for one subscription
+in a bulk notification request (POST /notifications).
+"""
+
+from __future__ import annotations
+
+import json
+import pprint
+from typing import Any, ClassVar, Dict, List
+
+from pydantic import BaseModel, Field, StrictStr
+from typing_extensions import Annotated
+
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+
+class EventNotificationBatchItem(BaseModel):
+    """
+    Represents the NF load level information notified for one subscription in a
+    batch.
+    """
+
+    subscription_id: StrictStr = Field(alias="subscriptionId")
+    nf_load_level_infos: Annotated[
+        List[NfLoadLevelInformation], Field(min_length=1)
+    ] = Field(alias="nfLoadLevelInfos")
+    __properties: ClassVar[List[str]] = ["subscriptionId", "nfLoadLevelInfos"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of EventNotificationBatchItem from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias."""
+        _dict = self.model_dump(by_alias=True, exclude_none=True)
+        if self.nf_load_level_infos:
+            _dict["nfLoadLevelInfos"] = [
+                _item.to_dict() for _item in self.nf_load_level_infos if _item
+            ]
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of EventNotificationBatchItem from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        nf_load_level_infos = obj.get("nfLoadLevelInfos")
+        return cls.model_validate(
+            {
+                "subscriptionId": obj.get("subscriptionId"),
+                "nfLoadLevelInfos": (
+                    [
+                        NfLoadLevelInformation.from_dict(_item)
+                        for _item in nf_load_level_infos
+                    ]
+                    if nf_load_level_infos is not None
+                    else None
+                ),
+            }
+        )
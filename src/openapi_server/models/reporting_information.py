@@ -213,4 +213,4 @@ class ReportingInformation(BaseModel):
 
     @field_serializer("mon_dur")
     def serialize_mon_dur(self, value, _info):
-        return value.timestamp()
+        return value.timestamp() if value is not None else None
@@ -1,10 +1,20 @@
+import json
 import pytest
 import unittest
 from unittest.mock import Mock, patch
 from typing import Dict, List
 
 # 테스트 대상 함수들 import
-from core.nf_load_aggregator import calculate_average_loads, average
+from core.load_columns import LOAD_FIELDS, LoadColumnStore
+from core.load_sample import LoadMeta, LoadSample
+from core.nf_load_aggregator import (
+    average,
+    build_load_info,
+    dump_load_infos_json,
+    calculate_average_loads,
+    calculate_average_loads_columnar,
+    calculate_average_loads_incremental,
+)
 from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
 from openapi_server.models.nf_status import NfStatus
 
@@ -271,6 +281,107 @@ class TestAggregateFunction(unittest.TestCase):
         self.assertEqual(aggregated.nf_status, "ACTIVE")
 
 
+class TestColumnarAggregate(unittest.TestCase):
+    """calculate_average_loads_columnar() 함수에 대한 테스트 클래스"""
+
+    def _create_load_info(
+        self, nf_instance_id: str, **values
+    ) -> NfLoadLevelInformation:
+        load_info = NfLoadLevelInformation()
+        load_info.nf_instance_id = nf_instance_id
+        load_info.nf_type = "AMF"
+        load_info.nf_set_id = f"{nf_instance_id}-set"
+        for field, value in values.items():
+            setattr(load_info, field, value)
+        return load_info
+
+    def test_matches_list_aggregate(self):
+        """열 지향 집계 결과가 기존 집계 함수와 같은지 테스트"""
+        samples = [
+            self._create_load_info("instance-001", nf_cpu_usage=80, nf_memory_usage=60),
+            self._create_load_info("instance-001", nf_cpu_usage=91, nf_memory_usage=70),
+            self._create_load_info("instance-001", nf_storage_usage=7),
+        ]
+        store = LoadColumnStore(capacity=10)
+        for timestamp, sample in enumerate(samples):
+            store.append(float(timestamp), LoadSample.from_model(sample))
+
+        expected = calculate_average_loads({"instance-001": samples})
+        result = calculate_average_loads_columnar(store)
+
+        self.assertEqual(
+            [load.model_dump() for load in result],
+            [load.model_dump() for load in expected],
+        )
+
+    def test_expired_and_overwritten_samples_are_excluded(self):
+        """만료되거나 덮어써진 샘플은 집계에서 제외되어야 한다."""
+        store = LoadColumnStore(capacity=2)
+        for timestamp, cpu in enumerate([100, 10, 20]):
+            load_info = self._create_load_info("instance-001", nf_cpu_usage=cpu)
+            store.append(float(timestamp), LoadSample.from_model(load_info))
+
+        self.assertEqual(calculate_average_loads_columnar(store)[0].nf_cpu_usage, 15)
+
+        store.expire_before(2.0)
+        self.assertEqual(calculate_average_loads_columnar(store)[0].nf_cpu_usage, 20)
+
+        store.clear()
+        self.assertEqual(calculate_average_loads_columnar(store), [])
+
+
+class TestIncrementalAggregate(unittest.TestCase):
+    """calculate_average_loads_incremental() 함수에 대한 테스트 클래스"""
+
+    def _create_load_info(self, nf_instance_id: str, cpu, memory) -> LoadSample:
+        load_info = NfLoadLevelInformation()
+        load_info.nf_instance_id = nf_instance_id
+        load_info.nf_cpu_usage = cpu
+        load_info.nf_memory_usage = memory
+        return LoadSample.from_model(load_info)
+
+    def test_matches_columnar_aggregate_under_eviction(self):
+        """덮어쓰기와 만료가 반복되어도 전체 재계산 결과와 같은지 테스트"""
+        store = LoadColumnStore(capacity=16)
+        for timestamp in range(200):
+            store.append(
+                float(timestamp),
+                self._create_load_info(
+                    "instance-001",
+                    cpu=(timestamp * 7) % 100,
+                    memory=None if timestamp % 5 == 0 else timestamp % 50,
+                ),
+            )
+            if timestamp % 10 == 0:
+                store.expire_before(timestamp - 8.0)
+
+            self.assertEqual(
+                [
+                    load.model_dump()
+                    for load in calculate_average_loads_incremental(store)
+                ],
+                [load.model_dump() for load in calculate_average_loads_columnar(store)],
+            )
+
+        store.clear()
+        self.assertEqual(calculate_average_loads_incremental(store), [])
+
+    def test_tracks_window_min_and_max(self):
+        """윈도우에서 빠진 샘플은 min/max 에서도 제외되어야 한다."""
+        store = LoadColumnStore(capacity=3)
+        for timestamp, cpu in enumerate([50, 10, 90, 30]):
+            store.append(float(timestamp), self._create_load_info("a", cpu, None))
+
+        aggregates = store.aggregates
+        self.assertEqual(aggregates.minimum(0), 10)
+        self.assertEqual(aggregates.maximum(0), 90)
+
+        store.expire_before(2.0)
+        self.assertEqual(aggregates.minimum(0), 30)
+        self.assertEqual(aggregates.maximum(0), 90)
+        self.assertIsNone(aggregates.minimum(1))
+
+
 class TestAverageFunction(unittest.TestCase):
     """average() 함수에 대한 테스트 클래스"""
 
@@ -303,6 +414,39 @@ class TestAverageFunction(unittest.TestCase):
         self.assertEqual(result, 1.5)  # 정확히 1.50
 
 
+class TestBuildLoadInfo(unittest.TestCase):
+    """build_load_info() 와 dump_load_infos_json() 에 대한 테스트 클래스"""
+
+    def test_matches_assigned_model(self):
+        """필드를 하나씩 대입해 만든 모델과 같은 결과를 내는지 테스트"""
+        meta = LoadMeta("instance-001", "AMF", "set-001")
+        averages = [10, 20, 30, 1, 2, 3]
+
+        expected = NfLoadLevelInformation()
+        expected.nf_instance_id = "instance-001"
+        expected.nf_type = "AMF"
+        expected.nf_set_id = "set-001"
+        expected.nf_status = NfStatus(status_registered=98)
+        for field, value in zip(LOAD_FIELDS, averages):
+            setattr(expected, field, value)
+
+        result = build_load_info(meta, (98, None, None), averages)
+
+        self.assertEqual(result.model_dump(), expected.model_dump())
+        self.assertIsNone(build_load_info(meta, None, averages).nf_status)
+
+    def test_dump_json_uses_aliases(self):
+        """JSON 바이트는 alias 를 사용하고 None 필드를 제외해야 한다."""
+        load = build_load_info(LoadMeta("instance-001", None, None), None, [1] * 6)
+
+        result = json.loads(dump_load_infos_json([load]))
+
+        self.assertEqual(result[0]["nfInstanceId"], "instance-001")
+        self.assertEqual(result[0]["nfCpuUsage"], 1)
+        self.assertNotIn("nfType", result[0])
+        self.assertNotIn("nfStatus", result[0])
+
+
 if __name__ == "__main__":
     # 개별 테스트 실행 방법
     print("=== aggregate() 함수 테스트 시작 ===")
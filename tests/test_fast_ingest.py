@@ -0,0 +1,124 @@
+import json
+import unittest
+
+from pydantic import ValidationError
+
+from core.fast_ingest import (
+    parse_batch_records,
+    parse_event_notification,
+    parse_event_notification_batch,
+    parse_load_records,
+)
+from core.load_sample import LoadSample
+from core.load_store import LoadFilter, LoadStore
+
+LOAD_INFO = {
+    "nfInstanceId": "amf-1",
+    "nfType": "AMF",
+    "nfSetId": "set-1",
+    "nfStatus": {"statusRegistered": 98, "statusUnregistered": 2},
+    "snssai": {"sst": 1, "sd": "010203"},
+    "nfCpuUsage": 10,
+    "nfMemoryUsage": 20,
+    "confidence": 95,
+}
+
+
+def create_body(*load_infos) -> bytes:
+    return json.dumps({"nfLoadLevelInfos": list(load_infos)}).encode()
+
+
+class TestFastIngest(unittest.TestCase):
+    """알림 본문 빠른 파싱에 대한 테스트 클래스"""
+
+    def test_fast_path_matches_full_validation(self):
+        """빠른 경로의 샘플은 전체 검증 결과로 만든 샘플과 같아야 한다."""
+        body = create_body(LOAD_INFO)
+
+        sample = parse_load_records(body)[0]
+        load = parse_event_notification(body, fast=False)[0]
+        expected = LoadSample.from_model(load)
+
+        self.assertEqual(sample.meta, expected.meta)
+        self.assertEqual(sample.values, expected.values)
+        self.assertEqual(sample.nf_status, expected.nf_status)
+        self.assertEqual(sample.meta.snssai, (1, "010203"))
+        self.assertEqual(sample.nf_status, (98, 2, None))
+
+    def test_falls_back_to_full_validation(self):
+        """빠른 경로로 처리할 수 없는 본문은 전체 검증으로 처리해야 한다."""
+        for load_info in (
+            {"nfInstanceId": "amf-1", "nfCpuUsage": True},
+            {"nfInstanceId": "amf-1", "nfCpuUsage": 1.5},
+            {"nfInstanceId": "amf-1", "snssai": {"sst": 300}},
+        ):
+            with self.assertRaises(ValidationError):
+                parse_load_records(create_body(load_info))
+            with self.assertRaises(ValidationError):
+                parse_event_notification(create_body(load_info), fast=True)
+
+        # 필드 이름으로 된 본문처럼 알 수 없는 키가 있으면 전체 검증으로 처리된다.
+        body = json.dumps(
+            {"nf_load_level_infos": [{"nf_instance_id": "amf-1", "nf_cpu_usage": 5}]}
+        ).encode()
+        with self.assertRaises(ValidationError):
+            parse_load_records(body)
+        loads = parse_event_notification(body, fast=True)
+        self.assertEqual((loads[0].nf_instance_id, loads[0].nf_cpu_usage), ("amf-1", 5))
+
+    def test_samples_are_aggregated(self):
+        """빠른 경로의 샘플은 LoadStore 에 저장되고 집계되어야 한다."""
+        store = LoadStore()
+        samples = parse_load_records(
+            create_body(LOAD_INFO, dict(LOAD_INFO, nfCpuUsage=30))
+        )
+
+        store.ingest_many(samples)
+        loads = store.collect(LoadFilter(nf_types=frozenset({"AMF"})))
+
+        self.assertEqual(loads[0].nf_cpu_usage, 20)
+        self.assertEqual(loads[0].nf_status.status_registered, 98)
+
+    def test_batch_fast_path_matches_full_validation(self):
+        """여러 구독의 알림도 빠른 경로와 전체 검증의 샘플이 같아야 한다."""
+        body = json.dumps(
+            [
+                {"subscriptionId": "sub-1", "nfLoadLevelInfos": [LOAD_INFO]},
+                {
+                    "subscriptionId": "sub-2",
+                    "nfLoadLevelInfos": [dict(LOAD_INFO, nfCpuUsage=30)],
+                },
+            ]
+        ).encode()
+
+        fast = parse_batch_records(body)
+        full = parse_event_notification_batch(body, fast=False)
+
+        self.assertEqual(
+            [
+                (subscription_id, [s.values for s in samples])
+                for subscription_id, samples in fast
+            ],
+            [
+                (
+                    subscription_id,
+                    [LoadSample.from_model(load).values for load in loads],
+                )
+                for subscription_id, loads in full
+            ],
+        )
+        self.assertEqual(
+            [subscription_id for subscription_id, _ in fast], ["sub-1", "sub-2"]
+        )
+
+    def test_batch_falls_back_to_full_validation(self):
+        """빠른 경로로 처리할 수 없는 배치는 전체 검증으로 처리해야 한다."""
+        body = json.dumps(
+            [{"subscriptionId": "sub-1", "nfLoadLevelInfos": [{"nfCpuUsage": 1.5}]}]
+        ).encode()
+        with self.assertRaises(ValidationError):
+            parse_event_notification_batch(body, fast=True)
+
+        for body in (b"[]", b'[{"subscriptionId": "sub-1", "nfLoadLevelInfos": []}]'):
+            with self.assertRaises(ValidationError):
+                parse_event_notification_batch(body, fast=True)
@@ -0,0 +1,98 @@
+import json
+import unittest
+
+from config.app_config import DashboardConfig
+from core.live_feed import LiveFeed
+from core.subscription_manager import SubscriptionManager
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+
+
+def create_subscription(nf_type: str = "AMF") -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[EventSubscription(event="NF_LOAD", nf_types=[nf_type])],
+        notification_uri="http://consumer/callbacks",
+    )
+
+
+def create_load_info(nf_instance_id: str, cpu: int) -> NfLoadLevelInformation:
+    return NfLoadLevelInformation(
+        nf_instance_id=nf_instance_id, nf_type="AMF", nf_cpu_usage=cpu
+    )
+
+
+def parse_events(data: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for message in data.decode().strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestLiveFeed(unittest.IsolatedAsyncioTestCase):
+    """LiveFeed 에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.manager = SubscriptionManager(
+            dashboard_config=DashboardConfig(interval=0.01, max_clients=2)
+        )
+        self.live_feed: LiveFeed = self.manager.live_feed
+
+    async def asyncTearDown(self):
+        await self.manager.shutdown()
+
+    async def test_coalesced_events(self):
+        """전송 주기 사이의 변경은 구독별 마지막 상태와 인스턴스별 집계로 합쳐져야 한다."""
+        client = self.live_feed.connect()
+        self.manager.add_subscription("sub-1", create_subscription("AMF"))
+        self.manager.add_subscription("sub-2", create_subscription("SMF"))
+        self.manager.remove_subscription("sub-1")
+        self.manager.ingest_loads("sub-2", [create_load_info("amf-1", 10)])
+        self.manager.ingest_loads("sub-2", [create_load_info("amf-1", 30)])
+
+        events = parse_events(self.live_feed.take_events(client))
+
+        self.assertEqual(
+            [(event, data.get("subscriptionId")) for event, data in events],
+            [
+                ("subscription-removed", "sub-1"),
+                ("subscription", "sub-2"),
+                ("loads", None),
+            ],
+        )
+        self.assertEqual(
+            events[1][1]["subscription"]["eventSubscriptions"][0]["nfTypes"], ["SMF"]
+        )
+        self.assertEqual(
+            [
+                (info["nfInstanceId"], info["nfCpuUsage"])
+                for info in events[2][1]["nfLoadLevelInfos"]
+            ],
+            [("amf-1", 20)],
+        )
+        self.assertEqual(self.live_feed.take_events(client), b"")
+
+    async def test_client_limit_and_interval(self):
+        """max_clients 를 넘는 연결은 거절하고, interval 은 설정값보다 짧을 수 없다."""
+        first = self.live_feed.connect(interval=5.0)
+        second = self.live_feed.connect(interval=0.001)
+
+        self.assertEqual(first.interval, 5.0)
+        self.assertEqual(second.interval, 0.01)
+        self.assertIsNone(self.live_feed.connect())
+
+        self.live_feed.disconnect(first)
+        self.assertIsNotNone(self.live_feed.connect())
+
+    async def test_stream(self):
+        """스트림은 interval 마다 모인 변경을 보내고, 종료되면 클라이언트를 해제해야 한다."""
+        client = self.live_feed.connect()
+        stream = self.live_feed.stream(client)
+
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        self.manager.add_subscription("sub-1", create_subscription())
+        self.assertEqual(parse_events(await anext(stream))[0][0], "subscription")
+
+        await stream.aclose()
+        self.assertEqual(len(self.live_feed), 0)
@@ -0,0 +1,165 @@
+import json
+import unittest
+
+from core.load_sample import LoadSample
+from core.load_store import LoadFilter, LoadStore, LoadView
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+from openapi_server.models.nf_status import NfStatus
+from openapi_server.models.snssai import Snssai
+
+
+def create_load_info(nf_instance_id: str, nf_type: str, cpu: int, **kwargs):
+    return NfLoadLevelInformation(
+        nf_instance_id=nf_instance_id, nf_type=nf_type, nf_cpu_usage=cpu, **kwargs
+    )
+
+
+def create_meta(*args, **kwargs):
+    return LoadSample.from_model(create_load_info(*args, **kwargs)).meta
+
+
+class TestLoadFilter(unittest.TestCase):
+    """LoadFilter 에 대한 테스트 클래스"""
+
+    def test_empty_filter_matches_everything(self):
+        self.assertTrue(LoadFilter().matches(create_meta("amf-1", "AMF", 10)))
+
+    def test_snssai_condition(self):
+        """snssai 가 다른 샘플은 거르고, snssai 가 없는 샘플은 통과시켜야 한다."""
+        load_filter = LoadFilter(snssais=frozenset({(1, "000001")}))
+
+        self.assertTrue(
+            load_filter.matches(
+                create_meta("amf-1", "AMF", 10, snssai=Snssai(sst=1, sd="000001"))
+            )
+        )
+        self.assertFalse(
+            load_filter.matches(create_meta("amf-1", "AMF", 10, snssai=Snssai(sst=2)))
+        )
+        self.assertTrue(load_filter.matches(create_meta("amf-1", "AMF", 10)))
+
+
+class TestLoadStore(unittest.TestCase):
+    """LoadStore 와 LoadView 에 대한 테스트 클래스"""
+
+    def test_views_share_samples(self):
+        """샘플은 한 번만 저장되고 각 뷰는 조건에 맞는 인스턴스만 집계해야 한다."""
+        store = LoadStore()
+        all_view = LoadView(store, LoadFilter())
+        smf_view = LoadView(store, LoadFilter(nf_types=frozenset({"SMF"})))
+
+        store.ingest(create_load_info("amf-1", "AMF", 10), timestamp=100.0)
+        store.ingest(create_load_info("smf-1", "SMF", 20), timestamp=100.0)
+        store.ingest(create_load_info("smf-1", "SMF", 40), timestamp=101.0)
+
+        self.assertEqual(len(store), 2)
+        loads = store.collect(all_view.filter, now=102.0)
+        self.assertEqual(
+            sorted((load.nf_instance_id, load.nf_cpu_usage) for load in loads),
+            [("amf-1", 10), ("smf-1", 30)],
+        )
+        loads = store.collect(smf_view.filter, now=102.0)
+        self.assertEqual([load.nf_cpu_usage for load in loads], [30])
+
+    def test_take_new_loads_advances_cursor(self):
+        """take_new_loads 는 마지막 호출 이후의 샘플만 집계해야 한다."""
+        store = LoadStore()
+        store.ingest(create_load_info("amf-1", "AMF", 90))
+        view = LoadView(store, LoadFilter())
+
+        store.ingest(create_load_info("amf-1", "AMF", 10))
+        store.ingest(create_load_info("amf-1", "AMF", 30))
+        self.assertEqual([load.nf_cpu_usage for load in view.take_new_loads()], [20])
+        self.assertEqual(view.take_new_loads(), [])
+
+        store.ingest(create_load_info("amf-1", "AMF", 50))
+        self.assertEqual([load.nf_cpu_usage for load in view.take_new_loads()], [50])
+
+    def test_payload_is_shared_until_store_changes(self):
+        """같은 조건의 알림 본문은 한 번만 직렬화되고, 샘플이 들어오면 다시 만들어야 한다."""
+        store = LoadStore()
+        first = LoadView(store, LoadFilter(nf_types=frozenset({"AMF"})))
+        second = LoadView(store, LoadFilter(nf_types=frozenset({"AMF"})))
+        store.ingest(create_load_info("amf-1", "AMF", 10))
+
+        payload = first.window_payload()
+
+        self.assertIs(second.window_payload(), payload)
+        self.assertEqual(
+            json.loads(payload),
+            {
+                "nfLoadLevelInfos": [
+                    {
+                        "nfInstanceId": "amf-1",
+                        "nfType": "AMF",
+                        "nfCpuUsage": 10,
+                        "nfMemoryUsage": 0,
+                        "nfStorageUsage": 0,
+                        "nfLoadLevelAverage": 0,
+                        "nfLoadLevelpeak": 0,
+                        "nfLoadAvgInAoi": 0,
+                    }
+                ]
+            },
+        )
+
+        store.ingest(create_load_info("amf-1", "AMF", 30))
+        self.assertEqual(
+            json.loads(second.window_payload())["nfLoadLevelInfos"][0]["nfCpuUsage"],
+            20,
+        )
+        self.assertIsNone(LoadView(store, LoadFilter()).take_new_payload())
+
+    def test_expired_instances_are_dropped(self):
+        """보관 시간이 지난 인스턴스는 집계에서 빠지고 저장소에서 정리되어야 한다."""
+        store = LoadStore(max_age=10.0)
+        store.ingest(create_load_info("amf-1", "AMF", 10), timestamp=100.0)
+        store.ingest(create_load_info("smf-1", "SMF", 20), timestamp=108.0)
+
+        loads = store.collect(LoadFilter(), now=115.0)
+
+        self.assertEqual([load.nf_instance_id for load in loads], ["smf-1"])
+        self.assertEqual(len(store), 1)
+
+    def test_samples_share_metadata(self):
+        """같은 인스턴스의 샘플은 메타데이터를 공유하고 nf_status 는 집계 결과에 복원되어야 한다."""
+        store = LoadStore()
+        for registered in (90, 95):
+            store.ingest(
+                create_load_info(
+                    "amf-1",
+                    "AMF",
+                    10,
+                    nf_status=NfStatus(status_registered=registered),
+                    snssai=Snssai(sst=1, sd="ABCDEF"),
+                )
+            )
+
+        (series,) = store._series.values()
+        first, second = series.slots()
+        self.assertIs(series.meta_at(first), series.meta_at(second))
+        self.assertEqual(series.meta_at(first).snssai, (1, "abcdef"))
+        self.assertEqual(series.nf_status_at(second), (95, None, None))
+
+        load = store.collect(LoadFilter())[0]
+        self.assertEqual(load.nf_status, NfStatus(status_registered=90))
+
+    def test_slices_of_one_instance_are_kept_apart(self):
+        """한 인스턴스의 S-NSSAI 별 샘플은 따로 집계되고, 각 뷰는 자기 슬라이스만 봐야 한다."""
+        store = LoadStore()
+        slice_1 = Snssai(sst=1, sd="000001")
+        slice_2 = Snssai(sst=2)
+        for cpu, snssai in ((10, slice_1), (80, slice_2), (30, slice_1)):
+            store.ingest(create_load_info("amf-1", "AMF", cpu, snssai=snssai))
+
+        def collect(*snssais):
+            load_filter = LoadFilter(snssais=frozenset(snssais) or None)
+            return sorted(
+                (load.nf_cpu_usage, load.snssai.sst)
+                for load in store.collect(load_filter)
+            )
+
+        self.assertEqual(collect((1, "000001")), [(20, 1)])
+        # 마지막 샘플의 슬라이스가 바뀌어도 앞선 슬라이스의 샘플은 남아 있어야 한다.
+        self.assertEqual(collect((2, None)), [(80, 2)])
+        self.assertEqual(collect(), [(20, 1), (80, 2)])
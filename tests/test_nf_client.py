@@ -0,0 +1,217 @@
+import unittest
+
+import httpx
+
+from config.app_config import DeliveryPolicyConfig, HttpClientConfig
+from core import nf_client
+
+
+class TestNfClientPool(unittest.IsolatedAsyncioTestCase):
+    """NfClientPool 에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.requests = []
+
+        self.subscribe_response = httpx.Response(201, json="nf-subscription-1")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.method == "POST" and request.url.path == "/subscriptions":
+                return self.subscribe_response
+            return httpx.Response(204)
+
+        self.pool = nf_client.open_client_pool(
+            HttpClientConfig(), httpx.MockTransport(handler)
+        )
+
+    async def asyncTearDown(self):
+        await nf_client.close_client_pool()
+
+    async def test_client_is_reused_per_origin(self):
+        """같은 목적지는 같은 클라이언트를, 다른 목적지는 다른 클라이언트를 사용해야 한다."""
+        amf = self.pool.client_for("http://localhost:8082/subscriptions")
+
+        self.assertIs(amf, self.pool.client_for("http://localhost:8082/callbacks/1"))
+        self.assertIsNot(
+            amf, self.pool.client_for("http://localhost:8083/subscriptions")
+        )
+        self.assertEqual(len(self.pool), 2)
+
+    async def test_requests_go_through_pool(self):
+        """구독/해지 요청은 열린 풀의 클라이언트로 전송되어야 한다."""
+        body = await nf_client.subscribe_to_nf(
+            "sub-1", "http://localhost:8082/subscriptions", {"a": 1}
+        )
+        await nf_client.unsubscribe_from_nf(body, "http://localhost:8082/subscriptions")
+
+        self.assertEqual(body, "nf-subscription-1")
+        self.assertEqual(
+            [(r.method, str(r.url)) for r in self.requests],
+            [
+                ("POST", "http://localhost:8082/subscriptions"),
+                ("DELETE", "http://localhost:8082/subscriptions/nf-subscription-1"),
+            ],
+        )
+        self.assertEqual(len(self.pool), 1)
+
+    async def test_subscription_id_from_object_response(self):
+        """NF 가 객체로 응답하면 Location 헤더, 없으면 본문의 ID 를 사용해야 한다."""
+        uri = "http://localhost:8082/subscriptions"
+        self.subscribe_response = httpx.Response(
+            201,
+            json={"eventSubscriptions": [], "notificationUri": "http://ncof/cb"},
+            headers={"Location": f"{uri}/nf-subscription-2"},
+        )
+        self.assertEqual(
+            await nf_client.subscribe_to_nf("sub-1", uri, {}), "nf-subscription-2"
+        )
+
+        self.subscribe_response = httpx.Response(
+            201, json={"subscriptionId": "nf-subscription-3"}
+        )
+        self.assertEqual(
+            await nf_client.subscribe_to_nf("sub-1", uri, {}), "nf-subscription-3"
+        )
+
+        # 해지할 수 없는 구독은 실패로 처리한다.
+        self.subscribe_response = httpx.Response(201, json={"eventSubscriptions": []})
+        with self.assertRaises(nf_client.NfRequestError) as raised:
+            await nf_client.subscribe_to_nf("sub-1", uri, {})
+        self.assertFalse(raised.exception.retryable)
+
+    async def test_subscription_id_from_text_response(self):
+        """텍스트 본문은 JSON 으로 파싱하지 않고 그대로 구독 ID 로 사용해야 한다."""
+        uri = "http://localhost:8082/subscriptions"
+        self.subscribe_response = httpx.Response(201, text="nf-subscription-4")
+
+        self.assertEqual(
+            await nf_client.subscribe_to_nf("sub-1", uri, {}), "nf-subscription-4"
+        )
+
+    async def test_subscribe_failure_is_classified(self):
+        """일시적인 실패만 재시도 대상이어야 한다."""
+        uri = "http://localhost:8082/subscriptions"
+        for status_code, retryable in ((503, True), (429, True), (400, False)):
+            self.subscribe_response = httpx.Response(status_code)
+            with self.assertRaises(nf_client.NfRequestError) as raised:
+                await nf_client.subscribe_to_nf("sub-1", uri, {})
+            self.assertEqual(raised.exception.status_code, status_code)
+            self.assertEqual(raised.exception.retryable, retryable)
+
+    async def test_json_bytes_are_sent_as_is(self):
+        """직렬화된 알림 바이트는 그대로 JSON 본문으로 전송되어야 한다."""
+        payload = b'{"nfLoadLevelInfos":[]}'
+
+        await nf_client.send_notification("sub-1", "http://localhost:8081/cb", payload)
+
+        request = self.requests[0]
+        self.assertEqual(request.content, payload)
+        self.assertEqual(request.headers["content-type"], "application/json")
+
+    async def test_close_client_pool(self):
+        """풀을 닫으면 모든 클라이언트가 닫혀야 한다."""
+        client = self.pool.client_for("http://localhost:8082/subscriptions")
+
+        await nf_client.close_client_pool()
+
+        self.assertTrue(client.is_closed)
+        self.assertEqual(len(self.pool), 0)
+
+    async def test_http_version_per_destination(self):
+        """목적지별로 설정한 HTTP 버전으로 클라이언트를 만들어야 한다."""
+        await nf_client.close_client_pool()
+        pool = nf_client.open_client_pool(
+            HttpClientConfig(destinations={"localhost:8081": "h2c"})
+        )
+
+        pool.client_for("http://localhost:8081/callbacks")
+        pool.client_for("http://localhost:8082/subscriptions")
+
+        expected = "h2c" if nf_client._h2_available() else "1.1"
+        self.assertEqual(
+            pool.http_versions,
+            {"http://localhost:8081": expected, "http://localhost:8082": "1.1"},
+        )
+
+
+class TestDeliveryPolicy(unittest.IsolatedAsyncioTestCase):
+    """DeliveryPolicy 에 대한 테스트 클래스"""
+
+    CONSUMER_URI = "http://consumer/callbacks"
+
+    async def asyncSetUp(self):
+        self.statuses = []
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            status = self.statuses.pop(0) if self.statuses else 204
+            return httpx.Response(status)
+
+        nf_client.open_client_pool(HttpClientConfig(), httpx.MockTransport(handler))
+        self.now = 0.0
+
+    async def asyncTearDown(self):
+        await nf_client.close_client_pool()
+
+    def create_policy(self, **kwargs) -> nf_client.DeliveryPolicy:
+        values = dict(backoff_base=0.001, backoff_max=0.001)
+        values.update(kwargs)
+        return nf_client.DeliveryPolicy(
+            DeliveryPolicyConfig(**values), clock=lambda: self.now
+        )
+
+    async def test_retries_transient_failures(self):
+        """5xx 응답은 재시도하고, 4xx 응답은 재시도하지 않아야 한다."""
+        policy = self.create_policy(max_retries=2)
+
+        self.statuses = [503, 503]
+        response = await policy.send("sub-1", self.CONSUMER_URI, {})
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(self.requests), 3)
+
+        self.statuses = [400]
+        response = await policy.send("sub-1", self.CONSUMER_URI, {})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(self.requests), 4)
+
+    async def test_circuit_opens_and_recovers(self):
+        """연속 실패하면 전송을 멈추고, reset_timeout 이후 시험 전송으로 복구해야 한다."""
+        policy = self.create_policy(
+            max_retries=0, failure_threshold=2, reset_timeout=10.0
+        )
+
+        self.statuses = [500, 500]
+        await policy.send("sub-1", self.CONSUMER_URI, {})
+        await policy.send("sub-1", self.CONSUMER_URI, {})
+        self.assertEqual(policy.breaker_for(self.CONSUMER_URI).state, "open")
+
+        response = await policy.send("sub-1", self.CONSUMER_URI, {})
+        self.assertEqual(response.status_code, 0)
+        self.assertEqual(len(self.requests), 2)
+
+        self.now = 10.0
+        response = await policy.send("sub-1", self.CONSUMER_URI, {})
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(policy.breaker_for(self.CONSUMER_URI).state, "closed")
+
+    async def test_buffers_while_open(self):
+        """buffer_size 가 있으면 circuit 이 열린 동안의 알림을 복구 후 전송해야 한다."""
+        policy = self.create_policy(
+            max_retries=0, failure_threshold=1, reset_timeout=10.0, buffer_size=2
+        )
+
+        self.statuses = [500]
+        await policy.send("sub-1", self.CONSUMER_URI, {"n": 0})
+        for n in (1, 2, 3):
+            await policy.send("sub-1", self.CONSUMER_URI, {"n": n})
+        self.assertEqual(policy.buffered(self.CONSUMER_URI), 2)
+
+        self.now = 10.0
+        await policy.send("sub-1", self.CONSUMER_URI, {"n": 4})
+
+        self.assertEqual(policy.buffered(self.CONSUMER_URI), 0)
+        self.assertEqual(
+            [request.content for request in self.requests[1:]],
+            [b'{"n":4}', b'{"n":2}', b'{"n":3}'],
+        )
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from config.app_config import NotificationDispatchConfig
+from core.notification_dispatcher import NotificationDispatcher
+
+SLOW_URI = "http://slow-consumer/callbacks"
+FAST_URI = "http://fast-consumer/callbacks"
+
+
+class TestNotificationDispatcher(unittest.IsolatedAsyncioTestCase):
+    """NotificationDispatcher 에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.sent = []
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.release_slow = asyncio.Event()
+
+        async def fake_send_notification(notification_id, uri, payload):
+            self.in_flight[uri] = self.in_flight.get(uri, 0) + 1
+            self.max_in_flight[uri] = max(
+                self.max_in_flight.get(uri, 0), self.in_flight[uri]
+            )
+            if uri == SLOW_URI:
+                await self.release_slow.wait()
+            self.in_flight[uri] -= 1
+            self.sent.append((notification_id, uri))
+            return 204
+
+        patcher = patch(
+            "core.notification_dispatcher.send_notification", fake_send_notification
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_dispatcher(self, **kwargs) -> NotificationDispatcher:
+        dispatcher = NotificationDispatcher(NotificationDispatchConfig(**kwargs))
+        self.addAsyncCleanup(dispatcher.shutdown, timeout=0.1)
+        return dispatcher
+
+    async def test_submit_does_not_wait_for_delivery(self):
+        """느린 consumer 로의 전송이 다른 목적지 전송을 막지 않아야 한다."""
+        dispatcher = self.create_dispatcher()
+
+        self.assertTrue(dispatcher.submit("sub-1", SLOW_URI, {}))
+        self.assertTrue(dispatcher.submit("sub-2", FAST_URI, {}))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.sent, [("sub-2", FAST_URI)])
+
+        self.release_slow.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self.sent), 2)
+        self.assertEqual(len(dispatcher), 0)
+
+    async def test_per_destination_concurrency_limit(self):
+        """목적지별 동시 전송 수가 제한되어야 한다."""
+        dispatcher = self.create_dispatcher(max_in_flight_per_destination=2)
+
+        for i in range(5):
+            dispatcher.submit(f"sub-{i}", SLOW_URI, {})
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.in_flight[SLOW_URI], 2)
+        self.assertEqual(len(dispatcher), 3)
+
+        self.release_slow.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self.sent), 5)
+        self.assertEqual(self.max_in_flight[SLOW_URI], 2)
+
+    async def test_queue_full_drops_notification(self):
+        """대기 중인 알림이 queue_size 를 넘으면 새 알림은 버려져야 한다."""
+        dispatcher = self.create_dispatcher(
+            queue_size=2, max_in_flight_per_destination=1
+        )
+
+        results = [dispatcher.submit(f"sub-{i}", SLOW_URI, {}) for i in range(4)]
+        # 첫 번째 알림은 송신 태스크가 시작되어야 큐에서 빠진다.
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(dispatcher.dropped, 2)
+
+    async def test_batch_destination_coalesces_notifications(self):
+        """배치 모드 목적지로 가는 알림은 하나의 요청으로 묶여야 한다."""
+        payloads = []
+
+        async def fake_send_notification(notification_id, uri, payload):
+            payloads.append((uri, json.loads(payload)))
+            return 204
+
+        dispatcher = self.create_dispatcher(batch_destinations={FAST_URI: 0.02})
+        with patch(
+            "core.notification_dispatcher.send_notification", fake_send_notification
+        ):
+            dispatcher.submit("sub-1", FAST_URI, {"n": 1}, notif_corr_id="corr-1")
+            dispatcher.submit("sub-2", FAST_URI, {"n": 2})
+            dispatcher.submit("sub-1", FAST_URI, {"n": 3}, notif_corr_id="corr-1")
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(
+            payloads,
+            [
+                (
+                    FAST_URI,
+                    [
+                        {
+                            "subscriptionId": "sub-1",
+                            "notifCorrId": "corr-1",
+                            "eventNotifications": [{"n": 1}, {"n": 3}],
+                        },
+                        {"subscriptionId": "sub-2", "eventNotifications": [{"n": 2}]},
+                    ],
+                )
+            ],
+        )
+
+    async def test_single_batch_sender_per_destination(self):
+        """배치 모드 목적지는 batch window 마다 요청 하나로 보내야 한다."""
+        batches = []
+
+        async def fake_send_notification(notification_id, uri, payload):
+            batches.append([item["subscriptionId"] for item in json.loads(payload)])
+            return 204
+
+        dispatcher = self.create_dispatcher(batch_destinations={FAST_URI: 0.05})
+        with patch(
+            "core.notification_dispatcher.send_notification", fake_send_notification
+        ):
+            for i, delay in enumerate((0, 0.02, 0.04, 0.02)):
+                await asyncio.sleep(delay)
+                dispatcher.submit(f"sub-{i}", FAST_URI, {})
+            await asyncio.sleep(0.1)
+
+        self.assertEqual(batches, [["sub-0", "sub-1"], ["sub-2", "sub-3"]])
+
+    async def test_batch_requests_respect_in_flight_limit(self):
+        """배치 요청도 목적지별 동시 전송 수 안에서 겹쳐 보낼 수 있어야 한다."""
+        dispatcher = self.create_dispatcher(
+            batch_destinations={SLOW_URI: 0.01},
+            max_in_flight_per_destination=2,
+            max_batch_size=1,
+        )
+
+        for i in range(5):
+            dispatcher.submit(f"sub-{i}", SLOW_URI, {})
+        await asyncio.sleep(0.02)
+        self.assertEqual(self.in_flight[SLOW_URI], 2)
+        self.assertEqual(len(dispatcher), 3)
+
+        self.release_slow.set()
+        await asyncio.sleep(0.02)
+        self.assertEqual(len(self.sent), 5)
+        self.assertEqual(self.max_in_flight[SLOW_URI], 2)
@@ -0,0 +1,53 @@
+import unittest
+
+from core.ring_buffer import TimedRingBuffer
+
+
+class TestTimedRingBuffer(unittest.TestCase):
+    """TimedRingBuffer 에 대한 테스트 클래스"""
+
+    def test_append_overwrites_oldest_when_full(self):
+        """가득 찬 버퍼에 추가하면 가장 오래된 항목이 밀려나야 한다."""
+        buffer = TimedRingBuffer(3)
+        for i in range(5):
+            buffer.append(float(i), i)
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(list(buffer.snapshot()), [2, 3, 4])
+
+    def test_expire_before_moves_head(self):
+        """cutoff 이전 항목만 제거되는지 테스트"""
+        buffer = TimedRingBuffer(4)
+        for i in range(4):
+            buffer.append(float(i), i)
+
+        self.assertEqual(buffer.expire_before(2.0), 2)
+        self.assertEqual(list(buffer.snapshot()), [2, 3])
+
+        buffer.append(4.0, 4)
+        buffer.append(5.0, 5)
+        self.assertEqual(list(buffer.snapshot()), [2, 3, 4, 5])
+
+    def test_snapshot_survives_clear(self):
+        """clear 이후에도 덮어쓰기 전까지 스냅샷을 읽을 수 있어야 한다."""
+        buffer = TimedRingBuffer(4)
+        buffer.append(0.0, "a")
+        buffer.append(1.0, "b")
+
+        snapshot = buffer.snapshot()
+        buffer.clear()
+        buffer.append(2.0, "c")
+
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(list(snapshot), ["a", "b"])
+
+    def test_overwritten_snapshot_raises(self):
+        """덮어써진 스냅샷을 읽으면 오류가 발생해야 한다."""
+        buffer = TimedRingBuffer(2)
+        buffer.append(0.0, "a")
+        snapshot = buffer.snapshot()
+        buffer.append(1.0, "b")
+        buffer.append(2.0, "c")
+
+        with self.assertRaises(RuntimeError):
+            list(snapshot)
@@ -0,0 +1,60 @@
+import asyncio
+import time
+import unittest
+
+from core.scheduler import HandlerScheduler
+
+
+class TestHandlerScheduler(unittest.IsolatedAsyncioTestCase):
+    """HandlerScheduler 에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.scheduler = HandlerScheduler(tick=0.005)
+
+    async def asyncTearDown(self):
+        await self.scheduler.shutdown()
+
+    async def test_callbacks_fire_in_deadline_order(self):
+        """여러 타이머가 예약 시각 순서대로 실행되는지 테스트"""
+        fired = []
+        now = time.time()
+        self.scheduler.call_at(now + 0.04, lambda: fired.append("slow"))
+        self.scheduler.call_at(now + 0.01, lambda: fired.append("fast"))
+
+        await asyncio.sleep(0.08)
+
+        self.assertEqual(fired, ["fast", "slow"])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_callback_is_not_called_early(self):
+        """타이머가 예약 시각보다 먼저 실행되지 않아야 한다."""
+        fired_at = []
+        deadline = time.time() + 0.03
+        self.scheduler.call_at(deadline, lambda: fired_at.append(time.time()))
+
+        await asyncio.sleep(0.06)
+
+        self.assertEqual(len(fired_at), 1)
+        self.assertGreaterEqual(fired_at[0], deadline - 0.002)
+
+    async def test_cancelled_timer_is_not_called(self):
+        """취소된 타이머는 예약 시각이 되어도 실행되지 않아야 한다."""
+        fired = []
+        entry = self.scheduler.call_later(0.01, lambda: fired.append(True))
+        entry.cancel()
+
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(fired, [])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_spawn_runs_coroutine(self):
+        """spawn 으로 실행한 코루틴이 태스크로 실행되는지 테스트"""
+        done = asyncio.Event()
+
+        async def work():
+            done.set()
+
+        self.scheduler.call_later(0.01, lambda: self.scheduler.spawn(work))
+
+        await asyncio.wait_for(done.wait(), timeout=1)
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+from core.load_store import LoadFilter, LoadStore, LoadView
+from core.notification_dispatcher import NotificationDispatcher
+from core.scheduler import HandlerScheduler
+from core.subscription_handler import HandlerConfig, SubscriptionHandler
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+from openapi_server.models.snssai import Snssai
+
+
+class FakeManager:
+    """테스트용 구독 관리자"""
+
+    def __init__(self):
+        self.removed = []
+
+    def remove_subscription(self, subscription_id: str) -> bool:
+        self.removed.append(subscription_id)
+        return True
+
+
+def create_config(notif_method: str, **kwargs) -> HandlerConfig:
+    values = dict(
+        rep_period=1,
+        max_report_nbr=0,
+        mon_dur=None,
+        start_ts=None,
+        end_ts=None,
+        notif_method=notif_method,
+        notification_uri="http://consumer/callbacks",
+    )
+    values.update(kwargs)
+    return HandlerConfig(**values)
+
+
+def create_load_info(
+    cpu: int, nf_instance_id: str = "amf-1", snssai: Snssai = None
+) -> NfLoadLevelInformation:
+    return NfLoadLevelInformation(
+        nf_instance_id=nf_instance_id, nf_type="AMF", nf_cpu_usage=cpu, snssai=snssai
+    )
+
+
+class TestSubscriptionHandler(unittest.IsolatedAsyncioTestCase):
+    """SubscriptionHandler 에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.scheduler = HandlerScheduler(tick=0.005)
+        self.manager = FakeManager()
+        self.store = LoadStore()
+        self.dispatcher = NotificationDispatcher()
+        self.handlers = []
+        self.sent = []
+
+        async def fake_send_notification(notification_id, uri, payload):
+            self.sent.append((time.time(), payload))
+            return 204
+
+        patcher = patch(
+            "core.notification_dispatcher.send_notification", fake_send_notification
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.dispatcher.shutdown()
+        await self.scheduler.shutdown()
+
+    def create_handler(
+        self, config: HandlerConfig, load_filter: LoadFilter = LoadFilter()
+    ) -> SubscriptionHandler:
+        handler = SubscriptionHandler(
+            subscription_id=f"sub-{len(self.handlers) + 1}",
+            handler_manager=self.manager,
+            config=config,
+            scheduler=self.scheduler,
+            load_view=LoadView(self.store, load_filter),
+            dispatcher=self.dispatcher,
+        )
+        handler.start()
+        self.handlers.append(handler)
+        return handler
+
+    def ingest(self, load: NfLoadLevelInformation):
+        for sample in self.store.ingest_many([load]):
+            for handler in self.handlers:
+                handler.on_load_ingested(sample)
+
+    async def test_on_event_detection_reports_immediately(self):
+        """ON_EVENT_DETECTION 은 알림 수신 즉시 보고해야 한다."""
+        handler = self.create_handler(create_config("ON_EVENT_DETECTION"))
+
+        received_at = time.time()
+        self.ingest(create_load_info(10))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(self.sent), 1)
+        self.assertLess(self.sent[0][0] - received_at, 0.05)
+        self.assertEqual(handler.report_count, 1)
+
+    async def test_on_event_detection_coalesces_bursts(self):
+        """coalesce_window 동안 도착한 알림은 하나의 콜백으로 묶여야 한다."""
+        handler = self.create_handler(
+            create_config("ON_EVENT_DETECTION", coalesce_window=0.05)
+        )
+
+        for cpu in (10, 20, 30):
+            self.ingest(create_load_info(cpu))
+        await asyncio.sleep(0.02)
+        self.assertEqual(self.sent, [])
+
+        await asyncio.sleep(0.08)
+        self.assertEqual(len(self.sent), 1)
+        loads = json.loads(self.sent[0][1])["nfLoadLevelInfos"]
+        self.assertEqual(loads[0]["nfCpuUsage"], 20)
+        self.assertEqual(handler.report_count, 1)
+
+    async def test_periodic_reports_every_rep_period(self):
+        """PERIODIC 은 rep_period 마다 보고하고 max_report_nbr 에서 종료해야 한다."""
+        handler = self.create_handler(
+            create_config("PERIODIC", rep_period=0.03, max_report_nbr=2)
+        )
+        self.ingest(create_load_info(10))
+
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(len(self.sent), 2)
+        self.assertFalse(handler.running)
+        self.assertEqual(self.manager.removed, ["sub-1"])
+
+    async def test_shared_store_fans_out_by_filter(self):
+        """공유 저장소의 샘플은 조건이 맞는 구독에만 보고되어야 한다."""
+        amf_handler = self.create_handler(
+            create_config("ON_EVENT_DETECTION"), LoadFilter(nf_types=frozenset({"AMF"}))
+        )
+        smf_handler = self.create_handler(
+            create_config("ON_EVENT_DETECTION"), LoadFilter(nf_types=frozenset({"SMF"}))
+        )
+
+        self.ingest(create_load_info(10))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(amf_handler.report_count, 1)
+        self.assertEqual(smf_handler.report_count, 0)
+        self.assertEqual(len(self.store), 1)
+
+    async def test_on_change_reports_only_changed_instances(self):
+        """ON_CHANGE 는 마지막 보고값보다 change_delta 를 넘게 바뀐 인스턴스만 보고해야 한다."""
+        handler = self.create_handler(create_config("ON_CHANGE", change_delta=2))
+
+        reported = []
+        for loads in (
+            [(50, "amf-1"), (30, "amf-2")],
+            [(51, "amf-1"), (31, "amf-2")],  # 변화량 이내
+            [(52, "amf-1"), (40, "amf-2")],  # amf-1 은 보고값(50) 대비 2 이내
+            [(53, "amf-1"), (40, "amf-2")],
+        ):
+            sent = len(self.sent)
+            for cpu, nf_instance_id in loads:
+                self.ingest(create_load_info(cpu, nf_instance_id))
+            await asyncio.sleep(0.02)
+            reported.append(
+                sorted(
+                    (info["nfInstanceId"], info["nfCpuUsage"])
+                    for _, payload in self.sent[sent:]
+                    for info in json.loads(payload)["nfLoadLevelInfos"]
+                )
+            )
+
+        self.assertEqual(
+            reported,
+            [
+                [("amf-1", 50), ("amf-2", 30)],
+                [],
+                [("amf-2", 40)],
+                [("amf-1", 53)],
+            ],
+        )
+        self.assertEqual(handler.report_count, 3)
+
+    async def test_on_change_tracks_slices_separately(self):
+        """한 인스턴스의 슬라이스는 각자의 마지막 보고값과 비교해야 한다."""
+        handler = self.create_handler(create_config("ON_CHANGE", change_delta=2))
+        first = Snssai(sst=1, sd="000001")
+        second = Snssai(sst=1, sd="000002")
+
+        reported = []
+        for loads in (
+            [(50, first), (20, second)],
+            [(51, first), (21, second)],  # 슬라이스별로는 변화량 이내
+            [(51, first), (30, second)],
+        ):
+            sent = len(self.sent)
+            for cpu, snssai in loads:
+                self.ingest(create_load_info(cpu, snssai=snssai))
+            await asyncio.sleep(0.02)
+            reported.append(
+                sorted(
+                    (info["snssai"]["sd"], info["nfCpuUsage"])
+                    for _, payload in self.sent[sent:]
+                    for info in json.loads(payload)["nfLoadLevelInfos"]
+                )
+            )
+
+        self.assertEqual(
+            reported,
+            [[("000001", 50), ("000002", 20)], [], [("000002", 30)]],
+        )
+        self.assertEqual(handler.report_count, 2)
+
+    async def test_on_change_drops_reverted_values(self):
+        """보고 전에 값이 마지막 보고값으로 되돌아오면 보고하지 않아야 한다."""
+        self.create_handler(
+            create_config("ON_CHANGE", change_delta=2, coalesce_window=0.05)
+        )
+        self.ingest(create_load_info(50))
+        await asyncio.sleep(0.08)
+
+        self.ingest(create_load_info(70))
+        self.ingest(create_load_info(51))
+        await asyncio.sleep(0.08)
+
+        self.assertEqual(len(self.sent), 1)
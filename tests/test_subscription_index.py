@@ -0,0 +1,120 @@
+import unittest
+from random import Random
+
+from core.load_sample import LoadMeta
+from core.load_store import LoadFilter
+from core.subscription_index import SubscriptionIndex
+
+
+class TestSubscriptionIndex(unittest.TestCase):
+    """SubscriptionIndex 에 대한 테스트 클래스"""
+
+    def setUp(self):
+        self.index = SubscriptionIndex()
+        self.index.add("all", LoadFilter())
+        self.index.add("amf", LoadFilter(nf_types=frozenset({"AMF"})))
+        self.index.add(
+            "amf-1",
+            LoadFilter(
+                nf_types=frozenset({"AMF"}), nf_instance_ids=frozenset({"amf-1"})
+            ),
+        )
+        self.index.add("set-a", LoadFilter(nf_set_ids=frozenset({"set-a"})))
+        self.index.add("slice-1", LoadFilter(snssais=frozenset({(1, "000001")})))
+
+    def test_match(self):
+        """조건이 맞는 구독만 찾아야 하고, 결과는 LoadFilter 와 같아야 한다."""
+        meta = LoadMeta("amf-1", "AMF", "set-b", (2, None))
+
+        self.assertEqual(set(self.index.match(meta)), {"all", "amf", "amf-1"})
+        self.assertEqual(
+            set(self.index.match(LoadMeta("smf-1", "SMF", "set-a"))),
+            {"all", "set-a", "slice-1"},
+        )
+
+    def test_accepting(self):
+        """한 조건의 값을 허용하는 구독을 찾을 수 있어야 한다."""
+        self.assertEqual(
+            self.index.accepting("nf_instance_ids", "amf-1"),
+            {"all", "amf", "amf-1", "set-a", "slice-1"},
+        )
+        self.assertEqual(
+            self.index.accepting("nf_types", "SMF"), {"all", "set-a", "slice-1"}
+        )
+
+    def test_remove_invalidates_matches(self):
+        """구독을 제거하거나 교체하면 캐시된 결과가 갱신되어야 한다."""
+        meta = LoadMeta("amf-1", "AMF", None)
+        self.assertIn("amf", self.index.match(meta))
+
+        self.assertTrue(self.index.remove("amf"))
+        self.index.add("all", LoadFilter(nf_types=frozenset({"SMF"})))
+
+        self.assertEqual(set(self.index.match(meta)), {"amf-1", "slice-1"})
+        self.assertFalse(self.index.remove("amf"))
+        self.assertEqual(len(self.index), 4)
+
+    def test_mutation_keeps_unrelated_matches(self):
+        """구독이 바뀌면 그 조건이 허용하는 캐시 항목만 지워야 한다."""
+        amf = LoadMeta("amf-1", "AMF", None)
+        smf = LoadMeta("smf-1", "SMF", None)
+        self.index.match(amf)
+        self.index.match(smf)
+
+        self.index.add("smf", LoadFilter(nf_types=frozenset({"SMF"})))
+
+        self.assertIn(amf, self.index._matches)
+        self.assertNotIn(smf, self.index._matches)
+        self.assertIn("smf", self.index.match(smf))
+
+    def test_invalidation_shrinks_reverse_map(self):
+        """캐시 항목이 지워지면 필드 값별 역색인에서도 빠져야 한다."""
+        for i in range(100):
+            self.index.match(LoadMeta(f"smf-{i}", "SMF", None))
+            self.index.add("smf", LoadFilter(nf_types=frozenset({"SMF"})))
+
+        self.assertEqual(self.index._matches, {})
+        for by_value in self.index._cached_by_value.values():
+            self.assertEqual(by_value, {})
+
+    def test_matches_filters_under_churn(self):
+        """구독이 계속 바뀌어도 결과는 LoadFilter.matches 와 같아야 한다."""
+        random = Random(7)
+        nf_types = ["AMF", "SMF", "UPF"]
+        snssais = [(1, "000001"), (2, None)]
+        metas = [
+            LoadMeta(f"{nf_type.lower()}-{i}", nf_type, f"set-{i % 2}", snssai)
+            for nf_type in nf_types
+            for i in range(3)
+            for snssai in (None, *snssais)
+        ]
+
+        def random_filter() -> LoadFilter:
+            def pick(values):
+                if random.random() < 0.5:
+                    return None
+                return frozenset(random.sample(values, random.randint(1, 2)))
+
+            return LoadFilter(
+                nf_types=pick(nf_types),
+                nf_instance_ids=pick([meta.nf_instance_id for meta in metas]),
+                nf_set_ids=pick(["set-0", "set-1"]),
+                snssais=pick(snssais),
+            )
+
+        index = SubscriptionIndex()
+        filters = {}
+        for _ in range(500):
+            subscription_id = f"sub-{random.randrange(40)}"
+            if subscription_id in filters and random.random() < 0.4:
+                index.remove(subscription_id)
+                del filters[subscription_id]
+            else:
+                filters[subscription_id] = random_filter()
+                index.add(subscription_id, filters[subscription_id])
+
+            for meta in random.sample(metas, 5):
+                self.assertEqual(
+                    set(index.match(meta)),
+                    {sid for sid, f in filters.items() if f.matches(meta)},
+                )
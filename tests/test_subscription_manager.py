@@ -0,0 +1,107 @@
+import threading
+import unittest
+from unittest import mock
+
+from core.load_sample import LoadSample
+from core.subscription_manager import SubscriptionManager
+from core.upstream_registry import UpstreamKey
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+
+
+def create_load_info(nf_instance_id: str, cpu: int) -> NfLoadLevelInformation:
+    return NfLoadLevelInformation(
+        nf_instance_id=nf_instance_id, nf_type="AMF", nf_cpu_usage=cpu
+    )
+
+
+def create_subscription(nf_type: str) -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[EventSubscription(event="NF_LOAD", nf_types=[nf_type])],
+        notification_uri="http://consumer/callbacks",
+    )
+
+
+class TestIngestBatch(unittest.TestCase):
+    """SubscriptionManager.ingest_batch 에 대한 테스트 클래스"""
+
+    def setUp(self):
+        self.manager = SubscriptionManager()
+        key = UpstreamKey.from_subscription(
+            "http://localhost:8082/subscriptions", create_subscription("AMF")
+        )
+        self.upstream, _ = self.manager.upstreams.acquire("sub-1", key)
+
+    def test_ingest_batch_skips_unknown_subscriptions(self):
+        """알 수 없는 구독 ID의 알림은 저장하지 않고 목록으로 돌려줘야 한다."""
+        unknown = self.manager.ingest_batch(
+            [
+                (self.upstream.upstream_id, [create_load_info("amf-1", 10)]),
+                ("missing", [create_load_info("amf-2", 20)]),
+                (self.upstream.upstream_id, [create_load_info("amf-3", 30)]),
+            ]
+        )
+
+        self.assertEqual(unknown, ["missing"])
+        self.assertEqual(len(self.manager.load_store), 2)
+        self.assertEqual(self.manager.load_store.next_seq, 2)
+
+    def test_ingest_loads_unknown_subscription(self):
+        self.assertFalse(
+            self.manager.ingest_loads("missing", [create_load_info("amf-1", 10)])
+        )
+        self.assertTrue(
+            self.manager.ingest_loads(
+                self.upstream.upstream_id, [create_load_info("amf-1", 10)]
+            )
+        )
+
+
+class TestLoadFanOut(unittest.IsolatedAsyncioTestCase):
+    """SubscriptionIndex 를 통한 부하 정보 전달에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.manager = SubscriptionManager()
+        self.manager.add_subscription("amf-sub", create_subscription("AMF"))
+        self.manager.add_subscription("smf-sub", create_subscription("SMF"))
+
+    async def asyncTearDown(self):
+        await self.manager.shutdown()
+
+    async def test_only_matching_handlers_are_notified(self):
+        """조건이 맞는 구독의 핸들러에만 샘플이 전달되어야 한다."""
+        handlers = self.manager.handlers
+        with (
+            mock.patch.object(handlers["amf-sub"], "on_load_ingested") as amf,
+            mock.patch.object(handlers["smf-sub"], "on_load_ingested") as smf,
+        ):
+            self.manager.ingest_loads("amf-sub", [create_load_info("amf-1", 10)])
+
+        self.assertEqual(amf.call_count, 1)
+        smf.assert_not_called()
+
+    async def test_match_subscriptions(self):
+        sample = LoadSample.from_model(create_load_info("amf-1", 10))
+        self.assertEqual(self.manager.match_subscriptions(sample), ["amf-sub"])
+
+        self.manager.remove_subscription("amf-sub")
+        self.assertEqual(self.manager.match_subscriptions(sample), [])
+
+    async def test_lookups_do_not_wait_for_lock(self):
+        """구독 생성/삭제가 락을 잡고 있어도 조회와 부하 정보 전달은 진행되어야 한다."""
+        results = []
+
+        def lookup():
+            results.append(self.manager.get_handler("amf-sub"))
+            results.append(
+                self.manager.ingest_loads("amf-sub", [create_load_info("amf-1", 10)])
+            )
+
+        with self.manager.lock:
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join(timeout=1.0)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(results, [self.manager.handlers["amf-sub"], True])
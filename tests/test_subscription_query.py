@@ -0,0 +1,134 @@
+import importlib
+import json
+import unittest
+from unittest import mock
+
+import httpx
+
+from core.dependency import get_subscription_manager
+from core.subscription_manager import SubscriptionManager
+from core.subscription_query import SubscriptionQuery, parse_fields
+from openapi_server.main import SUBSCRIPTION_PREFIX, app
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+from openapi_server.models.reporting_information import ReportingInformation
+
+subscriptions_api = importlib.import_module("openapi_server.apis.subscriptions_api")
+
+
+def create_subscription(
+    nf_type: str = "AMF",
+    notif_method: str = "PERIODIC",
+    notification_uri: str = "http://consumer/callbacks",
+) -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[
+            EventSubscription(
+                event="NF_LOAD",
+                nf_types=[nf_type],
+                evt_req=ReportingInformation(notif_method=notif_method),
+            )
+        ],
+        notification_uri=notification_uri,
+    )
+
+
+class TestSubscriptionQuery(unittest.TestCase):
+    """SubscriptionQuery 에 대한 테스트 클래스"""
+
+    def test_matches(self):
+        subscription = create_subscription("AMF", "ON_CHANGE")
+
+        self.assertTrue(SubscriptionQuery().matches(subscription))
+        self.assertTrue(
+            SubscriptionQuery(nf_type="AMF", notif_method="ON_CHANGE").matches(
+                subscription
+            )
+        )
+        self.assertFalse(SubscriptionQuery(nf_type="SMF").matches(subscription))
+        self.assertFalse(
+            SubscriptionQuery(notification_uri="http://other").matches(subscription)
+        )
+
+    def test_fields_projection(self):
+        """fields 에 지정한 JSON 키만 응답에 포함되어야 한다."""
+        query = SubscriptionQuery(fields=parse_fields("notificationURI"))
+
+        self.assertEqual(
+            json.loads(query.dump_json(create_subscription())),
+            {"notificationURI": "http://consumer/callbacks"},
+        )
+        with self.assertRaises(ValueError):
+            parse_fields("notificationURI,unknown")
+
+
+class TestListSubscriptions(unittest.IsolatedAsyncioTestCase):
+    """GET /subscriptions 의 페이지 조회와 스트리밍에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.manager = SubscriptionManager()
+        for i in range(5):
+            self.manager.add_subscription(
+                f"sub-{i}", create_subscription("AMF" if i % 2 == 0 else "SMF")
+            )
+        app.dependency_overrides[get_subscription_manager] = lambda: self.manager
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://ncof"
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        app.dependency_overrides = {}
+        await self.manager.shutdown()
+
+    async def test_pagination(self):
+        """X-Next-Cursor 로 모든 구독을 생성 순서대로 한 번씩 조회해야 한다."""
+        self.manager.remove_subscription("sub-1")
+        self.manager.add_subscription("sub-0", create_subscription("AMF"))
+
+        pages = []
+        params = {"limit": 2}
+        while True:
+            response = await self.client.get(
+                f"{SUBSCRIPTION_PREFIX}/subscriptions", params=params
+            )
+            self.assertEqual(response.status_code, 200)
+            pages.append(list(response.json()))
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        self.assertEqual(pages, [["sub-2", "sub-3"], ["sub-4", "sub-0"]])
+
+    async def test_without_paging(self):
+        """limit 과 cursor 가 없으면 페이지 크기와 상관없이 전체 구독을 반환해야 한다."""
+        with mock.patch.object(subscriptions_api, "DEFAULT_PAGE_SIZE", 2):
+            response = await self.client.get(f"{SUBSCRIPTION_PREFIX}/subscriptions")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()), [f"sub-{i}" for i in range(5)])
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
+    async def test_filter_and_stream(self):
+        """조건에 맞는 구독을 NDJSON 으로 한 줄씩 받아야 한다."""
+        response = await self.client.get(
+            f"{SUBSCRIPTION_PREFIX}/subscriptions",
+            params={"nf-type": "AMF", "fields": "notificationURI"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(
+            [line["subscriptionId"] for line in lines], ["sub-0", "sub-2", "sub-4"]
+        )
+        self.assertEqual(
+            lines[0]["subscription"], {"notificationURI": "http://consumer/callbacks"}
+        )
+
+    async def test_invalid_cursor(self):
+        response = await self.client.get(
+            f"{SUBSCRIPTION_PREFIX}/subscriptions", params={"cursor": "abc"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import time
+import unittest
+
+from core.subscription_manager import SubscriptionManager
+from core.subscription_store import (
+    SqlSubscriptionStore,
+    StoredSubscription,
+    SubscriptionChanges,
+    SubscriptionStore,
+)
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+from openapi_server.models.reporting_information import ReportingInformation
+
+
+def create_subscription(nf_type: str = "AMF") -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[
+            EventSubscription(
+                event="NF_LOAD",
+                nf_types=[nf_type],
+                evt_req=ReportingInformation(
+                    notif_method="PERIODIC", rep_period=60, max_report_nbr=10
+                ),
+            )
+        ],
+        notification_uri="http://consumer/callbacks",
+    )
+
+
+class TestSqlSubscriptionStore(unittest.TestCase):
+    """SqlSubscriptionStore 에 대한 테스트 클래스"""
+
+    def setUp(self):
+        self.store = SqlSubscriptionStore("sqlite://")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_write_and_load(self):
+        """생성, 삭제, 보고 횟수 변경이 한 번에 저장되어야 한다."""
+        self.store.write(
+            SubscriptionChanges(
+                upserts=[
+                    StoredSubscription("sub-1", "{}", 0, 1.0),
+                    StoredSubscription("sub-2", "{}", 0, 2.0),
+                ]
+            )
+        )
+        self.store.write(
+            SubscriptionChanges(
+                upserts=[StoredSubscription("sub-1", '{"a":1}', 3, 1.0)],
+                deletes=["sub-2"],
+                report_counts={"sub-1": 5},
+            )
+        )
+
+        self.assertEqual(
+            self.store.load(), [StoredSubscription("sub-1", '{"a":1}', 5, 1.0)]
+        )
+
+    def test_incomplete_store_cannot_be_created(self):
+        """load/write 를 구현하지 않은 저장소는 생성할 수 없어야 한다."""
+
+        class LoadOnlyStore(SubscriptionStore):
+            def load(self):
+                return []
+
+        with self.assertRaises(TypeError):
+            LoadOnlyStore()
+
+
+class TestSubscriptionPersistence(unittest.IsolatedAsyncioTestCase):
+    """SubscriptionManager 의 구독 저장과 복원에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.url = f"sqlite:///{os.path.join(directory.name, 'subscriptions.db')}"
+
+    async def test_restore_after_restart(self):
+        """재시작 후 삭제되지 않은 구독과 보고 횟수가 복원되어야 한다."""
+        manager = SubscriptionManager()
+        manager.restore(SqlSubscriptionStore(self.url), flush_interval=60)
+        manager.add_subscription("sub-1", create_subscription("AMF"))
+        manager.add_subscription("sub-2", create_subscription("SMF"))
+        manager.remove_subscription("sub-2")
+        manager.handlers["sub-1"].report_count = 4
+        await manager.shutdown()
+
+        restarted = SubscriptionManager()
+        restored = restarted.restore(SqlSubscriptionStore(self.url))
+
+        self.assertEqual(
+            [subscription_id for subscription_id, _ in restored], ["sub-1"]
+        )
+        self.assertEqual(restarted.handlers["sub-1"].report_count, 4)
+        self.assertEqual(
+            restarted.subscriptions["sub-1"].event_subscriptions[0].nf_types, ["AMF"]
+        )
+        self.assertTrue(restarted.handlers["sub-1"].active)
+        await restarted.shutdown()
+
+    async def test_restore_many_subscriptions(self):
+        """수천 개의 구독을 1초 안에 복원해야 한다."""
+        body = create_subscription().model_dump_json(by_alias=True, exclude_none=True)
+        store = SqlSubscriptionStore(self.url)
+        store.write(
+            SubscriptionChanges(
+                upserts=[
+                    StoredSubscription(f"sub-{i}", body, 0, float(i))
+                    for i in range(3000)
+                ]
+            )
+        )
+
+        manager = SubscriptionManager()
+        started = time.perf_counter()
+        restored = manager.restore(store)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(restored), 3000)
+        self.assertEqual(len(manager.scheduler), 3000)
+        self.assertLess(elapsed, 1.0)
+        await manager.shutdown()
+
+    async def test_no_changes_tracked_without_store(self):
+        """저장소가 없으면 생성/삭제를 변경 사항으로 모으지 않아야 한다."""
+        manager = SubscriptionManager()
+        for i in range(10):
+            manager.add_subscription(f"sub-{i}", create_subscription())
+            manager.remove_subscription(f"sub-{i}")
+
+        self.assertEqual(manager._dirty, set())
+        await manager.shutdown()
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from config.app_config import ReportingConfig
+from core.load_sample import LoadSample
+from core.subscription_handler import HandlerConfig, SubscriptionHandler
+from core.subscription_manager import SubscriptionManager
+from core.threshold_index import ThresholdCrossing, ThresholdIndex
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nf_load_level_information import NfLoadLevelInformation
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+from openapi_server.models.reporting_information import ReportingInformation
+from openapi_server.models.snssai import Snssai
+from openapi_server.models.threshold_level import ThresholdLevel
+
+
+def create_sample(cpu: int, nf_instance_id: str = "amf-1", **kwargs) -> LoadSample:
+    return LoadSample.from_model(
+        NfLoadLevelInformation(
+            nf_instance_id=nf_instance_id, nf_type="AMF", nf_cpu_usage=cpu, **kwargs
+        )
+    )
+
+
+def create_subscription(*thresholds: ThresholdLevel) -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[
+            EventSubscription(
+                event="NF_LOAD",
+                nf_types=["AMF"],
+                nf_load_lvl_thds=list(thresholds) or None,
+                evt_req=ReportingInformation(notif_method="ON_THRESHOLD"),
+            )
+        ],
+        notification_uri="http://consumer/callbacks",
+    )
+
+
+class TestThresholdIndex(unittest.TestCase):
+    """ThresholdIndex 에 대한 테스트 클래스"""
+
+    def setUp(self):
+        self.index = ThresholdIndex(hysteresis=5)
+        self.index.add("cpu-80", [ThresholdLevel(nf_cpu_usage=80)])
+        self.index.add("cpu-60", [ThresholdLevel(nf_cpu_usage=60)])
+        self.index.add("mixed", [ThresholdLevel(nf_cpu_usage=80, nf_memory_usage=50)])
+
+    def test_crossing_with_hysteresis(self):
+        """임계값을 넘을 때만 보고하고, hysteresis 안쪽의 흔들림은 무시해야 한다."""
+        self.assertEqual(self.index.evaluate(create_sample(50)), {})
+        self.assertEqual(
+            set(self.index.evaluate(create_sample(85))), {"cpu-60", "cpu-80", "mixed"}
+        )
+        # 80 아래로 내려갔지만 hysteresis(5) 안쪽
+        self.assertEqual(self.index.evaluate(create_sample(77)), {})
+        self.assertEqual(self.index.evaluate(create_sample(84)), {})
+
+        crossings = self.index.evaluate(create_sample(70))
+        self.assertEqual(
+            crossings["cpu-80"],
+            [ThresholdCrossing("nf_cpu_usage", 80.0, rising=False)],
+        )
+        self.assertEqual(set(crossings), {"cpu-80", "mixed"})
+        self.assertEqual(
+            set(self.index.evaluate(create_sample(81))), {"cpu-80", "mixed"}
+        )
+
+    def test_state_is_per_instance_and_metric(self):
+        self.index.evaluate(create_sample(85, "amf-1"))
+
+        self.assertEqual(
+            set(self.index.evaluate(create_sample(65, "amf-2"))), {"cpu-60"}
+        )
+        self.assertEqual(
+            self.index.evaluate(create_sample(85, "amf-1", nf_memory_usage=55)),
+            {"mixed": [ThresholdCrossing("nf_memory_usage", 50.0, rising=True)]},
+        )
+
+    def test_state_is_per_slice(self):
+        """한 인스턴스의 슬라이스가 임계값 양쪽에 있어도 번갈아 넘음으로 보지 않아야 한다."""
+        high = Snssai(sst=1, sd="000001")
+        low = Snssai(sst=1, sd="000002")
+
+        self.assertEqual(
+            set(self.index.evaluate(create_sample(85, snssai=high))),
+            {"cpu-60", "cpu-80", "mixed"},
+        )
+        self.assertEqual(self.index.evaluate(create_sample(50, snssai=low)), {})
+        for _ in range(3):
+            self.assertEqual(self.index.evaluate(create_sample(86, snssai=high)), {})
+            self.assertEqual(self.index.evaluate(create_sample(51, snssai=low)), {})
+
+        self.index.add("late", [ThresholdLevel(nf_cpu_usage=70)])
+        self.assertEqual(
+            [
+                (sample.meta.snssai, crossings)
+                for sample, crossings in self.index.initial_crossings("late")
+            ],
+            [((1, "000001"), [ThresholdCrossing("nf_cpu_usage", 70.0, rising=True)])],
+        )
+
+    def test_initial_crossings_for_late_subscriber(self):
+        """이미 넘은 임계값으로 나중에 추가된 구독은 현재 상태를 받아야 한다."""
+        self.index.evaluate(create_sample(85, "amf-1"))
+        self.index.evaluate(create_sample(65, "amf-2"))
+        self.index.add("late", [ThresholdLevel(nf_cpu_usage=70)])
+
+        initial = self.index.initial_crossings("late")
+
+        self.assertEqual(
+            [(sample.nf_instance_id, crossings) for sample, crossings in initial],
+            [("amf-1", [ThresholdCrossing("nf_cpu_usage", 70.0, rising=True)])],
+        )
+        self.assertEqual(self.index.evaluate(create_sample(86, "amf-1")), {})
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove("cpu-80"))
+        self.assertFalse(self.index.add("none", [ThresholdLevel(cong_level=1)]))
+
+        self.assertEqual(
+            set(self.index.evaluate(create_sample(90))), {"cpu-60", "mixed"}
+        )
+        self.assertEqual(len(self.index), 2)
+
+    def test_many_thresholds(self):
+        """수천 개의 임계값 중 넘은 구간의 구독만 찾아야 한다."""
+        index = ThresholdIndex()
+        for i in range(5000):
+            index.add(f"sub-{i}", [ThresholdLevel(nf_cpu_usage=i % 100 + 1)])
+
+        index.evaluate(create_sample(40))
+        crossed = index.evaluate(create_sample(42))
+
+        self.assertEqual(len(crossed), 100)
+        self.assertTrue(
+            all(int(s.split("-")[1]) % 100 + 1 in (41, 42) for s in crossed)
+        )
+
+
+class TestOnThreshold(unittest.IsolatedAsyncioTestCase):
+    """ON_THRESHOLD 구독의 보고에 대한 테스트 클래스"""
+
+    async def asyncSetUp(self):
+        self.manager = SubscriptionManager(
+            reporting_config=ReportingConfig(threshold_hysteresis=5)
+        )
+        self.payloads = []
+        patcher = mock.patch.object(
+            SubscriptionHandler,
+            "_send_callback_to_nf",
+            lambda handler, payload: self.payloads.append(json.loads(payload)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.manager.shutdown()
+
+    async def ingest(self, *cpus: int, snssais=(None,)):
+        self.manager.ingest_loads(
+            "sub-1",
+            [
+                NfLoadLevelInformation(
+                    nf_instance_id="amf-1",
+                    nf_type="AMF",
+                    nf_cpu_usage=cpu,
+                    snssai=snssai,
+                )
+                for cpu, snssai in zip(cpus, snssais)
+            ],
+        )
+        await asyncio.sleep(0.01)
+
+    async def test_reports_only_crossings(self):
+        """임계값을 위/아래로 넘은 샘플만 그 값 그대로 보고해야 한다."""
+        self.manager.add_subscription(
+            "sub-1", create_subscription(ThresholdLevel(nf_cpu_usage=80))
+        )
+
+        for cpu in (50, 85, 83, 78, 70, 72, 90):
+            await self.ingest(cpu)
+
+        self.assertEqual(
+            [p["nfLoadLevelInfos"][0]["nfCpuUsage"] for p in self.payloads],
+            [85, 70, 90],
+        )
+        self.assertEqual(self.manager.handlers["sub-1"].report_count, 3)
+
+    async def test_reports_crossings_of_each_slice(self):
+        """같은 보고 주기에 두 슬라이스가 임계값을 넘으면 둘 다 보고해야 한다."""
+        self.manager.add_subscription(
+            "sub-1", create_subscription(ThresholdLevel(nf_cpu_usage=80))
+        )
+
+        await self.ingest(
+            85, 90, snssais=(Snssai(sst=1, sd="000001"), Snssai(sst=1, sd="000002"))
+        )
+
+        self.assertEqual(
+            sorted(
+                (info["snssai"]["sd"], info["nfCpuUsage"])
+                for payload in self.payloads
+                for info in payload["nfLoadLevelInfos"]
+            ),
+            [("000001", 85), ("000002", 90)],
+        )
+
+    async def test_requires_thresholds(self):
+        """ON_THRESHOLD 구독에 지원하는 임계값이 없으면 생성할 수 없어야 한다."""
+        with self.assertRaises(ValueError):
+            self.manager.add_subscription("sub-1", create_subscription())
+        with self.assertRaises(ValueError):
+            HandlerConfig.from_ncof_events_subscription(
+                create_subscription(ThresholdLevel(cong_level=3))
+            )
+        self.assertEqual(len(self.manager.thresholds), 0)
+
+    async def test_late_subscriber_is_notified(self):
+        """임계값을 이미 넘은 뒤에 추가된 구독도 바로 보고를 받아야 한다."""
+        self.manager.add_subscription(
+            "sub-1", create_subscription(ThresholdLevel(nf_cpu_usage=80))
+        )
+        await self.ingest(90)
+        self.manager.add_subscription(
+            "sub-2", create_subscription(ThresholdLevel(nf_cpu_usage=60))
+        )
+        await asyncio.sleep(0.01)
+        await self.ingest(92)
+
+        self.assertEqual(self.manager.handlers["sub-1"].report_count, 1)
+        self.assertEqual(self.manager.handlers["sub-2"].report_count, 1)
+        self.assertEqual(self.payloads[1]["nfLoadLevelInfos"][0]["nfCpuUsage"], 90)
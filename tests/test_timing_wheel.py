@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from core.timing_wheel import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+    """TimingWheel 에 대한 테스트 클래스"""
+
+    def test_expires_at_deadline(self):
+        """항목이 deadline 에 도달했을 때만 만료되는지 테스트"""
+        wheel = TimingWheel(tick=1.0, wheel_size=8, levels=2)
+        entry = wheel.insert(5.0, lambda: None)
+
+        self.assertEqual(wheel.advance(4.9), [])
+        self.assertEqual(wheel.advance(5.0), [entry])
+        self.assertEqual(len(wheel), 0)
+        self.assertFalse(entry.active)
+
+    def test_cancel_removes_entry(self):
+        """취소된 항목은 만료 목록에 포함되지 않아야 한다."""
+        wheel = TimingWheel(tick=1.0, wheel_size=8, levels=2)
+        keep = wheel.insert(3.0, lambda: None)
+        drop = wheel.insert(3.0, lambda: None)
+        drop.cancel()
+
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.advance(10.0), [keep])
+
+    def test_far_deadlines_cascade_and_overflow(self):
+        """상위 레벨과 overflow 에 들어간 항목도 정확한 틱에 만료되는지 테스트"""
+        wheel = TimingWheel(tick=1.0, wheel_size=4, levels=2)
+        # 휠 범위(16 틱)를 넘는 항목은 overflow 에 보관된다.
+        entries = {t: wheel.insert(float(t), lambda: None) for t in (3, 9, 15, 40)}
+
+        for t, entry in entries.items():
+            self.assertEqual(wheel.next_expiry() <= t, True)
+            self.assertEqual(wheel.advance(t - 0.5), [])
+            self.assertEqual(wheel.advance(float(t)), [entry])
+
+    def test_next_expiry_skips_idle_time(self):
+        """next_expiry 가 빈 슬롯을 건너뛰고 만료 시각을 반환하는지 테스트"""
+        wheel = TimingWheel(tick=1.0, wheel_size=8, levels=3)
+        self.assertIsNone(wheel.next_expiry())
+
+        wheel.insert(6.0, lambda: None)
+        self.assertEqual(wheel.next_expiry(), 6.0)
+
+    def test_random_deadlines_match_sorted_order(self):
+        """무작위 deadline 과 취소에 대해 만료 결과가 정렬 기준과 일치하는지 테스트"""
+        rng = random.Random(7)
+        wheel = TimingWheel(tick=0.5, wheel_size=8, levels=3)
+        live = {}
+        for _ in range(500):
+            # 틱 경계에 맞춘 deadline 을 사용해 해상도에 의한 지연을 배제한다.
+            deadline = rng.randint(1, 800) * 0.5
+            live[wheel.insert(deadline, lambda: None)] = deadline
+        for entry in rng.sample(list(live), 100):
+            entry.cancel()
+            del live[entry]
+
+        now = 0.0
+        while live:
+            now += rng.uniform(0, 20)
+            expired = wheel.advance(now)
+            expected = {e for e, d in live.items() if d <= now}
+            self.assertEqual(set(expired), expected)
+            for entry in expired:
+                self.assertLessEqual(entry.deadline, now)
+                del live[entry]
+        self.assertEqual(len(wheel), 0)
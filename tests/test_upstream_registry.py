@@ -0,0 +1,240 @@
+import importlib
+import unittest
+from unittest import mock
+
+from core.nf_client import NfRequestError
+from core.subscription_manager import SubscriptionManager
+from core.upstream_registry import UpstreamKey, UpstreamRegistry
+from openapi_server.models.event_subscription import EventSubscription
+from openapi_server.models.nncof_events_subscription import NncofEventsSubscription
+from openapi_server.models.reporting_information import ReportingInformation
+from openapi_server.models.threshold_level import ThresholdLevel
+
+# openapi_server.apis 패키지는 같은 이름으로 router 를 노출하므로 모듈을 직접 가져온다.
+subscriptions_api = importlib.import_module("openapi_server.apis.subscriptions_api")
+
+AMF_URI = "http://localhost:8082/subscriptions"
+
+
+def create_subscription(nf_types) -> NncofEventsSubscription:
+    return NncofEventsSubscription(
+        event_subscriptions=[EventSubscription(event="NF_LOAD", nf_types=nf_types)],
+        notification_uri="http://consumer/callbacks",
+    )
+
+
+def create_key(
+    nf_types,
+    notif_method="PERIODIC",
+    nf_uri=AMF_URI,
+    rep_period=5,
+    grp_rep_time=None,
+    nf_load_lvl_thds=None,
+    notification_uri="http://consumer/callbacks",
+) -> UpstreamKey:
+    subscription = NncofEventsSubscription(
+        event_subscriptions=[
+            EventSubscription(
+                event="NF_LOAD",
+                nf_types=nf_types,
+                nf_load_lvl_thds=nf_load_lvl_thds,
+                evt_req=ReportingInformation(
+                    notif_method=notif_method,
+                    rep_period=rep_period,
+                    grp_rep_time=grp_rep_time,
+                ),
+            )
+        ],
+        notification_uri=notification_uri,
+    )
+    return UpstreamKey.from_subscription(nf_uri, subscription)
+
+
+class TestUpstreamRegistry(unittest.TestCase):
+    """UpstreamRegistry 에 대한 테스트 클래스"""
+
+    def test_same_filter_reuses_upstream(self):
+        """같은 NF, 같은 조건의 구독은 하나의 NF 구독을 공유해야 한다."""
+        registry = UpstreamRegistry()
+
+        first, created_first = registry.acquire("sub-1", create_key(["AMF"]))
+        second, created_second = registry.acquire("sub-2", create_key(["AMF"]))
+
+        self.assertTrue(created_first)
+        self.assertFalse(created_second)
+        self.assertIs(first, second)
+        self.assertEqual(first.consumers, {"sub-1", "sub-2"})
+        self.assertEqual(len(registry), 1)
+
+    def test_different_filter_creates_upstream(self):
+        """조건이나 알림 방식이 다르면 별도의 NF 구독을 만들어야 한다."""
+        registry = UpstreamRegistry()
+
+        registry.acquire("sub-1", create_key(["AMF"]))
+        _, created_type = registry.acquire("sub-2", create_key(["SMF"]))
+        _, created_method = registry.acquire(
+            "sub-3", create_key(["AMF"], notif_method="ON_EVENT_DETECTION")
+        )
+
+        self.assertTrue(created_type)
+        self.assertTrue(created_method)
+        self.assertEqual(len(registry), 3)
+
+    def test_forwarded_fields_split_upstream(self):
+        """NF 에 전달하는 임계값, 그룹 보고 시간이 다르면 공유하지 않아야 한다."""
+        registry = UpstreamRegistry()
+
+        registry.acquire("sub-1", create_key(["AMF"]))
+        _, created_grp = registry.acquire("sub-2", create_key(["AMF"], grp_rep_time=10))
+        _, created_thds = registry.acquire(
+            "sub-3",
+            create_key(["AMF"], nf_load_lvl_thds=[ThresholdLevel(nf_cpu_usage=80)]),
+        )
+
+        self.assertTrue(created_grp)
+        self.assertTrue(created_thds)
+        self.assertEqual(len(registry), 3)
+
+    def test_consumer_only_fields_share_upstream(self):
+        """NF 에 전달하지 않는 알림 URI, 보고 주기만 다르면 공유해야 한다."""
+        registry = UpstreamRegistry()
+
+        first, _ = registry.acquire("sub-1", create_key(["AMF"]))
+        second, created = registry.acquire(
+            "sub-2",
+            create_key(
+                ["AMF"], rep_period=30, notification_uri="http://other/callbacks"
+            ),
+        )
+
+        self.assertFalse(created)
+        self.assertIs(first, second)
+
+    def test_release_returns_upstream_after_last_consumer(self):
+        """마지막 구독이 떠날 때만 해지할 NF 구독을 반환해야 한다."""
+        registry = UpstreamRegistry()
+        upstream, _ = registry.acquire("sub-1", create_key(["AMF"]))
+        registry.acquire("sub-2", create_key(["AMF"]))
+
+        self.assertEqual(registry.release("sub-1"), [])
+        self.assertFalse(upstream.closed)
+
+        self.assertEqual(registry.release("sub-2"), [upstream])
+        self.assertTrue(upstream.closed)
+        self.assertIsNone(registry.get(upstream.upstream_id))
+
+        # 해지 후 같은 조건으로 구독하면 새로 요청해야 한다.
+        _, created = registry.acquire("sub-3", create_key(["AMF"]))
+        self.assertTrue(created)
+
+
+class TestSubscribeUpstream(unittest.IsolatedAsyncioTestCase):
+    """subscribe_to_nfs/subscribe_upstream 에 대한 테스트 클래스"""
+
+    def setUp(self):
+        self.manager = SubscriptionManager()
+        self.subscription = create_subscription(["AMF"])
+        self.key = UpstreamKey.from_subscription(AMF_URI, self.subscription)
+        retry = mock.patch.object(subscriptions_api, "UPSTREAM_RETRY_BASE", 0.0)
+        retry.start()
+        self.addCleanup(retry.stop)
+
+    async def asyncTearDown(self):
+        await self.manager.shutdown()
+
+    async def test_retry_keeps_attached_consumers(self):
+        """요청이 실패하면 그 사이 연결된 구독을 유지한 채 재시도해야 한다."""
+        upstream, _ = self.manager.upstreams.acquire("sub-1", self.key)
+
+        async def subscribe_to_nf(**kwargs):
+            if subscribe.await_count == 1:
+                # 첫 요청이 진행되는 동안 같은 조건의 구독이 연결된다.
+                self.manager.upstreams.acquire("sub-2", self.key)
+                raise NfRequestError(0, "connection refused")
+            return "nf-subscription-1"
+
+        with mock.patch.object(
+            subscriptions_api, "subscribe_to_nf", side_effect=subscribe_to_nf
+        ) as subscribe:
+            await subscriptions_api.subscribe_upstream(
+                upstream, self.subscription, self.manager
+            )
+
+        self.assertEqual(subscribe.await_count, 2)
+        self.assertEqual(upstream.remote_id, "nf-subscription-1")
+        self.assertEqual(upstream.consumers, {"sub-1", "sub-2"})
+        self.assertIs(self.manager.upstreams.get(upstream.upstream_id), upstream)
+
+    async def test_stop_retry_after_last_consumer_leaves(self):
+        """마지막 구독이 떠나면 재시도를 멈춰야 한다."""
+        upstream, _ = self.manager.upstreams.acquire("sub-1", self.key)
+
+        async def subscribe_to_nf(**kwargs):
+            self.manager.upstreams.release("sub-1")
+            raise NfRequestError(0, "connection refused")
+
+        with mock.patch.object(
+            subscriptions_api, "subscribe_to_nf", side_effect=subscribe_to_nf
+        ) as subscribe:
+            await subscriptions_api.subscribe_upstream(
+                upstream, self.subscription, self.manager
+            )
+
+        self.assertEqual(subscribe.await_count, 1)
+        self.assertIsNone(upstream.remote_id)
+
+    async def test_skip_removed_subscription(self):
+        """NF 구독 전에 제거된 구독은 NF 구독에 연결하지 않아야 한다."""
+        self.manager.add_subscription("sub-1", self.subscription)
+        self.manager.remove_subscription("sub-1")
+
+        with mock.patch.object(subscriptions_api, "subscribe_to_nf") as subscribe:
+            await subscriptions_api.subscribe_to_nfs(
+                [{"uri": AMF_URI}], self.subscription, "sub-1", self.manager
+            )
+
+        subscribe.assert_not_called()
+        self.assertEqual(len(self.manager.upstreams), 0)
+        self.assertIsNone(self.manager.acquire_upstream("sub-1", self.key))
+
+    async def test_fail_consumers_on_permanent_error(self):
+        """다시 시도해도 소용없는 실패이면 연결된 구독을 모두 제거해야 한다."""
+        self.manager.add_subscription("sub-1", self.subscription)
+        self.manager.add_subscription("sub-2", self.subscription)
+        upstream, _ = self.manager.acquire_upstream("sub-1", self.key)
+        self.manager.acquire_upstream("sub-2", self.key)
+
+        with mock.patch.object(
+            subscriptions_api,
+            "subscribe_to_nf",
+            side_effect=NfRequestError(201, "No subscription id"),
+        ) as subscribe:
+            await subscriptions_api.subscribe_upstream(
+                upstream, self.subscription, self.manager
+            )
+
+        self.assertEqual(subscribe.await_count, 1)
+        self.assertEqual(self.manager.get_subscriptions(), {})
+        self.assertTrue(upstream.closed)
+        self.assertEqual(len(self.manager.upstreams), 0)
+
+    async def test_retry_limit(self):
+        """일시적인 실패도 UPSTREAM_RETRY_LIMIT 번 시도한 뒤에는 구독을 제거해야 한다."""
+        self.manager.add_subscription("sub-1", self.subscription)
+        upstream, _ = self.manager.acquire_upstream("sub-1", self.key)
+
+        with (
+            mock.patch.object(subscriptions_api, "UPSTREAM_RETRY_LIMIT", 3),
+            mock.patch.object(
+                subscriptions_api,
+                "subscribe_to_nf",
+                side_effect=NfRequestError(503, "Service Unavailable"),
+            ) as subscribe,
+        ):
+            await subscriptions_api.subscribe_upstream(
+                upstream, self.subscription, self.manager
+            )
+
+        self.assertEqual(subscribe.await_count, 3)
+        self.assertIsNone(self.manager.get_handler("sub-1"))
+        self.assertEqual(len(self.manager.upstreams), 0)